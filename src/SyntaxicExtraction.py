@@ -1,29 +1,19 @@
-from Tokenizer.DependencyExtractor import DependencyExtractor
-from Tokenizer.Disambiguator import Disambiguator
-from Tokenizer.GroupsExtractor import GroupExtractor
-from Tokenizer.Lexicon import Lexicon
-from Tokenizer.MorphologicalAnalyzer import MorphologicalAnalyzer
-from Tokenizer.Tokenizer import Tokenizer
+from Tokenizer.Pipeline import default_pipeline
 
 
 class SyntaxicExtraction:
-    def __init__(self, text):
-        # Initialize the components of the NLP pipeline
-        self.tokenizer = Tokenizer()
-        self.lexicon = Lexicon()
-        self.morph_analyzer = MorphologicalAnalyzer()
-        self.disambiguator = Disambiguator()
-        self.dependency_extractor = DependencyExtractor()
-        self.group_extractor = GroupExtractor()
-        
-        # Process the text through the pipeline
-        tokens = self.tokenizer.tokenize(text)
-        tokens = self.lexicon.extract_lemmas(tokens)
-        tokens = self.lexicon.extract_pos(tokens)
-        tokens = self.morph_analyzer.analyze(tokens, self.lexicon)
-        tokens = self.disambiguator.disambiguate(tokens, self.morph_analyzer, self.lexicon)
-        tokens = self.dependency_extractor.extract_dependencies(tokens)
-        tokens = self.group_extractor.extract_groups(tokens)
-        
-        # Store the processed tokens
-        self.tokens = tokens
+    def __init__(self, text, pipeline=None):
+        # Les composants sont ceux d'une pipeline chargée une seule fois (la pipeline par défaut
+        # si aucune n'est fournie) : aucun index ni règle n'est relu pour chaque texte
+        if pipeline is None:
+            pipeline = default_pipeline()
+        self.pipeline = pipeline
+        self.tokenizer = pipeline.tokenizer
+        self.lexicon = pipeline.lexicon
+        self.morph_analyzer = pipeline.morph_analyzer
+        self.disambiguator = pipeline.disambiguator
+        self.dependency_extractor = pipeline.dependency_extractor
+        self.group_extractor = pipeline.group_extractor
+
+        # Process the text through the pipeline and store the processed tokens
+        self.tokens = pipeline.analyze(text)
@@ -0,0 +1,171 @@
+# src/BisectLexicon.py
+
+import argparse
+import logging
+import mmap
+import os
+
+
+def line_key(line):
+    """
+    Key of a lexicon line: its first column, stripped and lowercased, as used by the indexes.
+    """
+    return line.split(b';', 1)[0].strip().decode('utf-8', errors='replace').lower()
+
+
+def check_sorted(path):
+    """
+    Check that the lines of a lexicon file are sorted by line_key, which bisect mode requires.
+
+    Returns:
+        int: None if the file is sorted, otherwise the number of the first line out of order.
+    """
+    previous = None
+    with open(path, 'rb') as f:
+        for number, line in enumerate(f, start=1):
+            key = line_key(line)
+            if previous is not None and key < previous:
+                return number
+            previous = key
+    return None
+
+
+class SortedTextFile:
+    def __init__(self, path):
+        """
+        Memory-map a sorted lexicon text file to binary-search it by line key.
+        Nothing is loaded: only the pages probed by the searches become resident.
+        """
+        self.path = path
+        self._file = open(path, 'rb')
+        if os.fstat(self._file.fileno()).st_size == 0:
+            self.mm = b''  # mmap refuse les fichiers vides
+        else:
+            self.mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def line_end(self, start):
+        end = self.mm.find(b'\n', start)
+        return len(self.mm) if end < 0 else end
+
+    def lower_bound(self, key):
+        """
+        Return the offset of the first line whose key is not lower than key.
+        """
+        lo, hi = 0, len(self.mm)
+        # lo et hi sont toujours des débuts de ligne
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = self.mm.rfind(b'\n', 0, mid) + 1  # Début de la ligne contenant mid
+            end = self.line_end(start)
+            if line_key(self.mm[start:end]) < key:
+                lo = end + 1
+            else:
+                hi = start
+        return lo
+
+    def lines(self, key):
+        """
+        Yield the lines (bytes, without the newline) of a key, in file order.
+        """
+        start = self.lower_bound(key)
+        size = len(self.mm)
+        while start < size:
+            end = self.line_end(start)
+            line = self.mm[start:end]
+            if line_key(line) != key:
+                break
+            yield line
+            start = end + 1
+
+    def close(self):
+        if isinstance(self.mm, mmap.mmap):
+            self.mm.close()
+        self._file.close()
+
+
+class BisectLexicon:
+    def __init__(self, lemma_file_path, pos_file_path):
+        """
+        Lexicon store reading the sorted lemma and POS text files directly, without any index:
+        each lookup is a binary search over the memory-mapped file (O(log n) probes).
+
+        Parameters:
+            lemma_file_path (str): Path to lemma_clean_utf8.txt, sorted by line_key.
+            pos_file_path (str): Path to pos_utf8.txt, sorted by line_key.
+        """
+        self.lemma_file = SortedTextFile(lemma_file_path)
+        self.pos_file = SortedTextFile(pos_file_path)
+        # Pas d'inventaire des tags sans parcourir le fichier : ils sont analysés à la demande
+        self.tags = ()
+
+    def lemmas_of(self, word):
+        """Return the (lemma, score) entries of a form, in file order."""
+        entries = []
+        for line in self.lemma_file.lines(word):
+            columns = [col.strip() for col in line.decode('utf-8', errors='replace').strip().split(';')]
+            if len(columns) == 3 and columns[2].isdigit():
+                score = int(columns[2])
+                if score > 0:  # Ne considérer que les scores positifs
+                    entries.append((columns[1].lower(), score))
+        return entries
+
+    def pos_of(self, word):
+        """Return the (tag, score) entries of a form, in file order."""
+        entries = []
+        for line in self.pos_file.lines(word):
+            try:
+                columns = line.decode('utf-8').strip().split(';')
+            except UnicodeDecodeError:
+                logging.error(f"Unicode decode error in {self.pos_file.path} for word '{word}'")
+                continue
+            if len(columns) > 3 and columns[3].isdigit():
+                score = int(columns[3])
+                if score > 0:
+                    entries.append((columns[2].strip(), score))
+        return entries
+
+    def search_lemmas(self, target_words):
+        """
+        Look up the lemma candidates of several words.
+
+        Returns:
+            dict: A dictionary mapping each word to a list of (lemma, score) tuples.
+        """
+        return {word: self.lemmas_of(word) for word in target_words}
+
+    def search_pos(self, target_words):
+        """
+        Look up the POS candidates of several words.
+
+        Returns:
+            dict: A dictionary mapping each word to a list of (tag, score) tuples.
+        """
+        return {word: self.pos_of(word) for word in target_words}
+
+    def search(self, target_words):
+        """
+        Look up both the lemma and the POS candidates of several words.
+
+        Returns:
+            tuple: (lemma results, POS results), two dictionaries keyed by word.
+        """
+        return self.search_lemmas(target_words), self.search_pos(target_words)
+
+    def close(self):
+        """Release the memory maps."""
+        self.lemma_file.close()
+        self.pos_file.close()
+
+
+if __name__ == "__main__":
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    data_dir = os.path.abspath(os.path.join(base_dir, '..', '..', 'data'))
+
+    parser = argparse.ArgumentParser(description="Check that the lexicon files are sorted for bisect mode.")
+    parser.add_argument('--lemma-file', default=os.path.join(data_dir, 'lemma_clean_utf8.txt'))
+    parser.add_argument('--pos-file', default=os.path.join(data_dir, 'pos_utf8.txt'))
+    args = parser.parse_args()
+
+    for path in (args.lemma_file, args.pos_file):
+        line_number = check_sorted(path)
+        print(f"{path}: {'sorted' if line_number is None else f'not sorted (line {line_number})'}")
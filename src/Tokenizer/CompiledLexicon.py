@@ -0,0 +1,349 @@
+# src/CompiledLexicon.py
+
+import argparse
+import logging
+import mmap
+import os
+import struct
+import sys
+
+from Tokenizer.IndexBuilder import write_metadata
+
+# Format binaire du lexique compilé (little-endian, sections alignées sur 8 octets) :
+#   en-tête      : magic, version, nombre de chaînes, de formes, de tags,
+#                  d'entrées lemme, d'entrées POS, puis l'offset de chaque section
+#   strings      : offsets uint32 (n_strings + 1) + blob UTF-8 trié par octets
+#   tags         : offsets uint32 (n_tags + 1) + blob UTF-8 des tags POS
+#   forms        : id de chaîne uint32 de chaque forme, triées comme la table des chaînes
+#   lemma_ranges : uint32 (n_forms + 1), plage de chaque forme dans les entrées lemme
+#   lemma_ids    : uint32, id de chaîne du lemme
+#   lemma_scores : int32
+#   pos_ranges   : uint32 (n_forms + 1), plage de chaque forme dans les entrées POS
+#   pos_tags     : uint32, id du tag
+#   pos_scores   : int32
+MAGIC = b'LXC1'
+VERSION = 1
+SECTIONS = (
+    'string_offsets', 'string_blob', 'tag_offsets', 'tag_blob', 'forms',
+    'lemma_ranges', 'lemma_ids', 'lemma_scores', 'pos_ranges', 'pos_tags', 'pos_scores',
+)
+HEADER = struct.Struct('<4sIIIIII' + 'Q' * len(SECTIONS))
+ALIGNMENT = 8
+
+
+def normalize_form(form: str) -> str:
+    """
+    Normalize a surface form the same way Lexicon does before a lookup.
+    """
+    return form.lower().lstrip('-').strip('-')
+
+
+def read_lemma_entries(lemma_file_path):
+    """
+    Stream the (form, lemma, score) entries of lemma_clean_utf8.txt.
+
+    Only lines with exactly three columns and a strictly positive score are kept,
+    the same filter as Lexicon.search_lemmas_with_index.
+    """
+    with open(lemma_file_path, 'r', encoding='utf-8', errors='replace') as file:
+        for line in file:
+            columns = [col.strip() for col in line.strip().split(';')]
+            if len(columns) == 3 and columns[2].isdigit():
+                score = int(columns[2])
+                if score > 0:
+                    yield columns[0].lower(), columns[1].lower(), score
+
+
+def read_pos_entries(pos_file_path):
+    """
+    Stream the (form, tag, score) entries of pos_utf8.txt.
+
+    The form is in the first column, the tag in the third and the score in the fourth,
+    the same filter as Lexicon.extract_pos.
+    """
+    with open(pos_file_path, 'rb') as file:
+        for line_bytes in file:
+            try:
+                line = line_bytes.decode('utf-8').strip()
+            except UnicodeDecodeError:
+                continue
+            columns = line.split(';')
+            if len(columns) > 3 and columns[3].isdigit():
+                score = int(columns[3])
+                if score > 0:
+                    yield columns[0].strip().lower(), columns[2].strip(), score
+
+
+def collect_candidates(entries):
+    """
+    Group entries by form, keeping the maximal score of each candidate.
+
+    Returns:
+        dict: form -> list of (candidate, score) sorted by decreasing score
+              (stable with respect to the file order, like Lexicon does).
+    """
+    grouped = {}
+    for form, candidate, score in entries:
+        candidates = grouped.setdefault(form, {})
+        if candidate not in candidates or score > candidates[candidate]:
+            candidates[candidate] = score
+    return {form: sorted(candidates.items(), key=lambda x: x[1], reverse=True)
+            for form, candidates in grouped.items()}
+
+
+def _pack_strings(strings):
+    blobs = [s.encode('utf-8') for s in strings]
+    offsets = [0]
+    for blob in blobs:
+        offsets.append(offsets[-1] + len(blob))
+    return struct.pack(f'<{len(offsets)}I', *offsets), b''.join(blobs)
+
+
+def compile_lexicon(lemma_file_path, pos_file_path, output_path):
+    """
+    Compile the lemma and POS text files into a single binary lexicon.
+
+    Parameters:
+        lemma_file_path (str): Path to lemma_clean_utf8.txt.
+        pos_file_path (str): Path to pos_utf8.txt.
+        output_path (str): Path of the binary file to write.
+
+    Returns:
+        dict: Counts of forms, strings, tags and entries written.
+    """
+    logging.info(f"Compiling lexicon from {lemma_file_path} and {pos_file_path}")
+    lemmas = collect_candidates(read_lemma_entries(lemma_file_path))
+    pos = collect_candidates(read_pos_entries(pos_file_path))
+
+    forms = sorted(set(lemmas) | set(pos), key=lambda s: s.encode('utf-8'))
+    strings = set(forms)
+    for candidates in lemmas.values():
+        strings.update(lemma for lemma, _ in candidates)
+    strings = sorted(strings, key=lambda s: s.encode('utf-8'))
+    string_ids = {s: i for i, s in enumerate(strings)}
+
+    tags = sorted({tag for candidates in pos.values() for tag, _ in candidates})
+    tag_ids = {t: i for i, t in enumerate(tags)}
+
+    lemma_ranges, lemma_ids, lemma_scores = [0], [], []
+    pos_ranges, pos_tags, pos_scores = [0], [], []
+    for form in forms:
+        for lemma, score in lemmas.get(form, ()):
+            lemma_ids.append(string_ids[lemma])
+            lemma_scores.append(score)
+        lemma_ranges.append(len(lemma_ids))
+        for tag, score in pos.get(form, ()):
+            pos_tags.append(tag_ids[tag])
+            pos_scores.append(score)
+        pos_ranges.append(len(pos_tags))
+
+    string_offsets, string_blob = _pack_strings(strings)
+    tag_offsets, tag_blob = _pack_strings(tags)
+    sections = {
+        'string_offsets': string_offsets,
+        'string_blob': string_blob,
+        'tag_offsets': tag_offsets,
+        'tag_blob': tag_blob,
+        'forms': struct.pack(f'<{len(forms)}I', *(string_ids[f] for f in forms)),
+        'lemma_ranges': struct.pack(f'<{len(lemma_ranges)}I', *lemma_ranges),
+        'lemma_ids': struct.pack(f'<{len(lemma_ids)}I', *lemma_ids),
+        'lemma_scores': struct.pack(f'<{len(lemma_scores)}i', *lemma_scores),
+        'pos_ranges': struct.pack(f'<{len(pos_ranges)}I', *pos_ranges),
+        'pos_tags': struct.pack(f'<{len(pos_tags)}I', *pos_tags),
+        'pos_scores': struct.pack(f'<{len(pos_scores)}i', *pos_scores),
+    }
+
+    offsets = []
+    position = HEADER.size
+    for name in SECTIONS:
+        position += -position % ALIGNMENT
+        offsets.append(position)
+        position += len(sections[name])
+
+    tmp_path = output_path + '.tmp'
+    with open(tmp_path, 'wb') as out:
+        out.write(HEADER.pack(MAGIC, VERSION, len(strings), len(forms), len(tags),
+                              len(lemma_ids), len(pos_tags), *offsets))
+        for name, offset in zip(SECTIONS, offsets):
+            out.write(b'\0' * (offset - out.tell()))
+            out.write(sections[name])
+    os.replace(tmp_path, output_path)
+
+    counts = {'forms': len(forms), 'strings': len(strings), 'tags': len(tags),
+              'lemma_entries': len(lemma_ids), 'pos_entries': len(pos_tags)}
+    write_metadata(output_path, [lemma_file_path, pos_file_path], **counts)
+    logging.info(f"Compiled lexicon written to {output_path}: {counts}")
+    return counts
+
+
+class CompiledLexicon:
+    def __init__(self, path=None, buffer=None):
+        """
+        Open a compiled lexicon. The file is memory-mapped read-only, so lookups
+        do not copy the tables and the pages are shared between processes.
+
+        Parameters:
+            path (str): Path to the binary file produced by compile_lexicon.
+            buffer (buffer): Alternatively, any buffer holding the binary content
+                             (e.g. a shared memory block).
+        """
+        if sys.byteorder != 'little':
+            raise RuntimeError("The compiled lexicon format is little-endian only.")
+        self.path = path
+        self._file = None
+        if buffer is None:
+            self._file = open(path, 'rb')
+            buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.buffer = buffer
+        view = memoryview(buffer)
+        self._views = [view]
+
+        header = HEADER.unpack_from(view, 0)
+        magic, version = header[0], header[1]
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Not a compiled lexicon (version {VERSION}): {path}")
+        self.n_strings, self.n_forms, self.n_tags, n_lemma_entries, n_pos_entries = header[2:7]
+        offsets = dict(zip(SECTIONS, header[7:]))
+        lengths = {
+            'string_offsets': 4 * (self.n_strings + 1),
+            'tag_offsets': 4 * (self.n_tags + 1),
+            'forms': 4 * self.n_forms,
+            'lemma_ranges': 4 * (self.n_forms + 1),
+            'lemma_ids': 4 * n_lemma_entries,
+            'lemma_scores': 4 * n_lemma_entries,
+            'pos_ranges': 4 * (self.n_forms + 1),
+            'pos_tags': 4 * n_pos_entries,
+            'pos_scores': 4 * n_pos_entries,
+        }
+
+        def section(name, fmt):
+            start = offsets[name]
+            sliced = view[start:start + lengths[name]]
+            self._views.append(sliced)
+            self._views.append(sliced.cast(fmt))
+            return self._views[-1]
+
+        self.string_offsets = section('string_offsets', 'I')
+        self.string_blob = view[offsets['string_blob']:]
+        self._views.append(self.string_blob)
+        self.forms = section('forms', 'I')
+        self.lemma_ranges = section('lemma_ranges', 'I')
+        self.lemma_ids = section('lemma_ids', 'I')
+        self.lemma_scores = section('lemma_scores', 'i')
+        self.pos_ranges = section('pos_ranges', 'I')
+        self.pos_tags = section('pos_tags', 'I')
+        self.pos_scores = section('pos_scores', 'i')
+
+        # Le jeu de tags est petit et fermé : on le décode une fois pour toutes
+        tag_offsets = section('tag_offsets', 'I')
+        tag_blob = view[offsets['tag_blob']:]
+        self._views.append(tag_blob)
+        self.tags = [bytes(tag_blob[tag_offsets[i]:tag_offsets[i + 1]]).decode('utf-8')
+                     for i in range(self.n_tags)]
+
+    def string_bytes(self, string_id):
+        """Return the raw UTF-8 bytes of a string of the string table."""
+        return bytes(self.string_blob[self.string_offsets[string_id]:self.string_offsets[string_id + 1]])
+
+    def string(self, string_id):
+        """Return a string of the string table."""
+        return self.string_bytes(string_id).decode('utf-8')
+
+    def find_form(self, word):
+        """
+        Binary search a normalized form.
+
+        Returns:
+            int: The form index, or -1 if the form is not in the lexicon.
+        """
+        key = word.encode('utf-8')
+        low, high = 0, self.n_forms
+        while low < high:
+            middle = (low + high) // 2
+            candidate = self.string_bytes(self.forms[middle])
+            if candidate < key:
+                low = middle + 1
+            elif candidate > key:
+                high = middle
+            else:
+                return middle
+        return -1
+
+    def lemmas_of(self, form_index):
+        """Return the (lemma, score) candidates of a form index, sorted by decreasing score."""
+        return [(self.string(self.lemma_ids[i]), self.lemma_scores[i])
+                for i in range(self.lemma_ranges[form_index], self.lemma_ranges[form_index + 1])]
+
+    def pos_of(self, form_index):
+        """Return the (tag, score) candidates of a form index, sorted by decreasing score."""
+        return [(self.tags[self.pos_tags[i]], self.pos_scores[i])
+                for i in range(self.pos_ranges[form_index], self.pos_ranges[form_index + 1])]
+
+    def search_lemmas(self, target_words):
+        """
+        Look up the lemma candidates of several words.
+
+        Returns:
+            dict: A dictionary mapping each word to a list of (lemma, score) tuples.
+        """
+        results = {}
+        for word in target_words:
+            form_index = self.find_form(word)
+            results[word] = self.lemmas_of(form_index) if form_index >= 0 else []
+        return results
+
+    def search_pos(self, target_words):
+        """
+        Look up the POS candidates of several words.
+
+        Returns:
+            dict: A dictionary mapping each word to a list of (tag, score) tuples.
+        """
+        results = {}
+        for word in target_words:
+            form_index = self.find_form(word)
+            results[word] = self.pos_of(form_index) if form_index >= 0 else []
+        return results
+
+    def search(self, target_words):
+        """
+        Look up both the lemma and the POS candidates of several words, with a single
+        binary search per word.
+
+        Returns:
+            tuple: (lemma results, POS results), two dictionaries keyed by word.
+        """
+        lemma_results, pos_results = {}, {}
+        for word in target_words:
+            form_index = self.find_form(word)
+            if form_index >= 0:
+                lemma_results[word] = self.lemmas_of(form_index)
+                pos_results[word] = self.pos_of(form_index)
+            else:
+                lemma_results[word] = []
+                pos_results[word] = []
+        return lemma_results, pos_results
+
+    def close(self):
+        """Release the memory map."""
+        for view in reversed(self._views):
+            view.release()
+        self._views = []
+        if self._file is not None:
+            self.buffer.close()
+            self._file.close()
+            self._file = None
+
+
+if __name__ == "__main__":
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    data_dir = os.path.abspath(os.path.join(base_dir, '..', '..', 'data'))
+
+    parser = argparse.ArgumentParser(description="Compile the lemma and POS files into a binary lexicon.")
+    parser.add_argument('--lemma-file', default=os.path.join(data_dir, 'lemma_clean_utf8.txt'))
+    parser.add_argument('--pos-file', default=os.path.join(data_dir, 'pos_utf8.txt'))
+    parser.add_argument('--output', default=os.path.join(data_dir, 'lexicon.bin'))
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    print(compile_lexicon(args.lemma_file, args.pos_file, args.output))
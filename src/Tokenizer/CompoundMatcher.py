@@ -0,0 +1,207 @@
+# src/CompoundMatcher.py
+
+import argparse
+import logging
+import os
+import pickle
+import re
+from array import array
+from collections import deque
+
+from Tokenizer.IndexBuilder import check_staleness, write_metadata
+from Tokenizer.Token_ import Token
+from Tokenizer.TrieLexicon import read_compounds
+
+# Découpage en tokens, partagé avec Tokenizer.tokenize
+WORD_PATTERN = re.compile(r"\b\w+(?:-\w+)*\b|[.!?;\"()\[\]{}\-]", re.UNICODE)
+AUTOMATON_FILE = 'motsComposes.ac.pkl'
+
+
+class CompoundMatcher:
+    # Version du format de l'automate, pour écarter un cache d'une version antérieure
+    FORMAT_VERSION = 2
+
+    def __init__(self, expressions=()):
+        """
+        Aho-Corasick automaton over token sequences, matching the multi-word expressions
+        ("pomme de terre", "tout à fait") in a single linear pass over a token stream.
+
+        Parameters:
+            expressions (iterable): Expressions, split into lowercased tokens like the text.
+        """
+        self.symbols = {}  # Texte d'un token -> symbole entier
+        self.goto = {}  # (état, symbole) -> état suivant
+        self.fail = array('i', [0])
+        # Longueur de l'expression qui se termine exactement sur chaque état (0 si aucune)
+        self.length = array('i', [0])
+        # Lien de sortie : plus proche état de la chaîne d'échec qui termine une expression
+        self.output = array('i', [0])
+        self.count = 0
+        self.version = self.FORMAT_VERSION
+        for expression in expressions:
+            self.add(expression)
+        self.compile()
+
+    def add(self, expression):
+        """
+        Add an expression of at least two tokens (single words are left to the compound set).
+        """
+        words = WORD_PATTERN.findall(expression.lower())
+        if len(words) < 2:
+            return
+        state = 0
+        for word in words:
+            symbol = self.symbols.setdefault(word, len(self.symbols))
+            next_state = self.goto.get((state, symbol))
+            if next_state is None:
+                next_state = self.goto[(state, symbol)] = len(self.fail)
+                self.fail.append(0)
+                self.length.append(0)
+                self.output.append(0)
+            state = next_state
+        if not self.length[state]:
+            self.count += 1
+        self.length[state] = len(words)
+
+    def compile(self):
+        """
+        Compute the failure and output links breadth-first.
+        """
+        children = {}
+        for (state, symbol), child in self.goto.items():
+            children.setdefault(state, []).append((symbol, child))
+        queue = deque(child for _, child in children.get(0, ()))
+        while queue:
+            state = queue.popleft()
+            for symbol, child in children.get(state, ()):
+                fallback = self.fail[state]
+                while fallback and (fallback, symbol) not in self.goto:
+                    fallback = self.fail[fallback]
+                target = self.goto.get((fallback, symbol), 0)
+                self.fail[child] = target if target != child else 0
+                fallback = self.fail[child]
+                self.output[child] = fallback if self.length[fallback] else self.output[fallback]
+                queue.append(child)
+
+    def find(self, words):
+        """
+        Find the leftmost-longest non-overlapping expressions in a sequence of words.
+
+        Parameters:
+            words (list): Lowercased token texts.
+
+        Returns:
+            list: (start, end) spans, end excluded.
+        """
+        candidates = []
+        state = 0
+        for position, word in enumerate(words):
+            symbol = self.symbols.get(word)
+            if symbol is None:
+                state = 0
+                continue
+            while state and (state, symbol) not in self.goto:
+                state = self.fail[state]
+            state = self.goto.get((state, symbol), 0)
+            # Toutes les expressions qui se terminent ici, en suivant les liens de sortie
+            match = state if self.length[state] else self.output[state]
+            while match:
+                candidates.append((position + 1 - self.length[match], position + 1))
+                match = self.output[match]
+
+        spans = []
+        last_end = 0
+        for start, end in sorted(candidates, key=lambda span: (span[0], -span[1])):
+            if start >= last_end:
+                spans.append((start, end))
+                last_end = end
+        return spans
+
+    def merge(self, tokens):
+        """
+        Merge the tokens of each expression found into one token, within a sentence,
+        and renumber the token ids of each sentence.
+
+        Parameters:
+            tokens (list): Tokens produced by Tokenizer.tokenize.
+
+        Returns:
+            list: The tokens, with the expressions merged.
+        """
+        spans = [(start, end) for start, end in self.find([token.text.lower() for token in tokens])
+                 if tokens[start].token_pid == tokens[end - 1].token_pid]
+        if not spans:
+            return tokens
+
+        merged = []
+        position = 0
+        for start, end in spans:
+            merged.extend(tokens[position:start])
+            first, last = tokens[start], tokens[end - 1]
+            if first.source is not None and first.source is last.source:
+                # Le token fusionné couvre le texte source de l'expression, espaces compris
+                token = Token(start=first.start, end=last.end, source=first.source)
+            else:
+                token = Token(' '.join(token.text for token in tokens[start:end]))
+            token.token_pid = tokens[start].token_pid
+            merged.append(token)
+            position = end
+        merged.extend(tokens[position:])
+
+        token_id, token_pid = 0, None
+        for token in merged:
+            if token.token_pid != token_pid:
+                token_id, token_pid = 0, token.token_pid
+            token.token_id = token_id
+            token.token_primarykey = (token_pid, token_id)
+            token_id += 1
+        return merged
+
+    def __len__(self):
+        return self.count
+
+
+def load_compound_matcher(compounds_file_path, cache_path=None):
+    """
+    Load the automaton cached next to the compound file, or build it from motsComposés.txt
+    and cache it when the cache is missing or stale.
+
+    Parameters:
+        compounds_file_path (str): Path to motsComposés.txt.
+        cache_path (str): Path of the cached automaton, next to the compound file by default.
+
+    Returns:
+        CompoundMatcher: The automaton.
+    """
+    if cache_path is None:
+        cache_path = os.path.join(os.path.dirname(compounds_file_path), AUTOMATON_FILE)
+    if os.path.exists(cache_path) and not check_staleness(cache_path, [compounds_file_path]):
+        with open(cache_path, 'rb') as f:
+            matcher = pickle.load(f)
+        if getattr(matcher, 'version', 1) == CompoundMatcher.FORMAT_VERSION:
+            return matcher
+        logging.info(f"{cache_path} was built by an older version")
+
+    logging.info(f"Building the compound automaton from {compounds_file_path}")
+    matcher = CompoundMatcher(read_compounds(compounds_file_path))
+    try:
+        with open(cache_path + '.tmp', 'wb') as f:
+            pickle.dump(matcher, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(cache_path + '.tmp', cache_path)
+        write_metadata(cache_path, [compounds_file_path], with_hash=False, entries=len(matcher))
+        logging.info(f"Compound automaton cached in {cache_path} ({len(matcher)} expressions)")
+    except OSError as e:
+        logging.warning(f"Could not cache the compound automaton in {cache_path}: {e}")
+    return matcher
+
+
+if __name__ == "__main__":
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    default_file = os.path.abspath(os.path.join(base_dir, '..', '..', 'data', 'motsComposés.txt'))
+
+    parser = argparse.ArgumentParser(description="Build the multi-word compound automaton.")
+    parser.add_argument('--compounds-file', default=default_file)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    print(f"{len(load_compound_matcher(args.compounds_file))} multi-word expressions")
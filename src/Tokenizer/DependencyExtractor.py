@@ -1,6 +1,8 @@
 class DependencyExtractor:
-    def __init__(self):
-        pass
+    def __init__(self, use_token_pid=False):
+        # Avec use_token_pid, les phrases sont celles du Tokenizer (token_pid, voir TextSplitter)
+        # au lieu d'être recoupées sur chaque point
+        self.use_token_pid = use_token_pid
 
     def extract_dependencies(self, tokens):
         clauses = self.segment_into_clauses(tokens)
@@ -12,8 +14,15 @@ class DependencyExtractor:
         clauses = []
         clause = []
         for token in tokens:
+            if self.use_token_pid and clause and token.token_pid != clause[-1].token_pid:
+                clauses.append(clause)
+                clause = []
             clause.append(token)
-            if token.pos_ == 'PUNCT' and token.text in ('.', '!', '?', ';'):
+            if self.use_token_pid:
+                if token.pos_ == 'PUNCT' and token.text == ';':
+                    clauses.append(clause)
+                    clause = []
+            elif token.pos_ == 'PUNCT' and token.text in ('.', '!', '?', ';'):
                 clauses.append(clause)
                 clause = []
         if clause:
@@ -1,34 +1,40 @@
+import itertools
 import logging
 import json
+from Tokenizer.LemmaMorphology import LemmaMorphologyTable
 from Tokenizer.MorphologicalAnalyzer import MorphologicalAnalyzer
-from Tokenizer.Token_ import Token
+from Tokenizer.PosDecoder import ViterbiPosDecoder
+from Tokenizer.TagTable import POS_MAPPING, TAG_TABLE
+from Tokenizer.Trace import DISAMBIGUATOR_TRACE as TRACE
 
 class Disambiguator:
-    POS_MAPPING = {
-        "Adj": "ADJ",
-        "Pre": "ADP",
-        "Adv": "ADV",
-        "Ver": "VERB",
-        "Conj:Coord": "CCONJ",
-        "Conj": "SCONJ",
-        "Con": "SCONJ",
-        "con": "SCONJ",
-        "Det": "DET",
-        "Int": "INTJ",
-        "Nom": "NOUN",
-        "Part": "PART",
-        "Pro": "PRON",
-        "Punct": "PUNCT",
-        "Symbole": "SYM",
-        "Unit": "VERB"
-    }
-
-    def __init__(self, json_file_path='struct_lemma.json'):
+    POS_MAPPING = POS_MAPPING
+
+    POS_DECODERS = ('greedy', 'viterbi', 'beam')
+    DEFAULT_BEAM_SIZE = 4
+
+    def __init__(self, json_file_path='struct_lemma.json', pos_decoder='greedy', beam_size=None):
         """
         Initialize the Disambiguator with an optional JSON file for lemma replacements.
+
+        Parameters:
+            json_file_path (str): Path to the JSON file containing replacement rules.
+            pos_decoder (str): 'greedy' picks the POS token by token with disambiguate_pos;
+                               'viterbi' and 'beam' decode the whole sequence at once, with the
+                               same rules as transition scores (see ViterbiPosDecoder).
+            beam_size (int): Beam width of the 'beam' decoder.
         """
         logging.info("Disambiguator initialized with hardcoded logic.")
+        if pos_decoder not in self.POS_DECODERS:
+            raise ValueError(f"Unknown POS decoder '{pos_decoder}', expected one of {self.POS_DECODERS}.")
+        self.pos_decoder = pos_decoder
+        self.sequence_decoder = None
+        if pos_decoder != 'greedy':
+            self.sequence_decoder = ViterbiPosDecoder(
+                beam_size=(beam_size or self.DEFAULT_BEAM_SIZE) if pos_decoder == 'beam' else None)
         self.lemma_replacement_rules = self.load_json_rules(json_file_path)
+        # Tables lemme -> morphologie, une par lexique
+        self.lemma_tables = {}
 
     def load_json_rules(self, json_file_path):
         """
@@ -47,6 +53,26 @@ class Disambiguator:
             logging.debug(f"JSON file '{json_file_path}' not found.")
             return {}
 
+    def get_lemma_table(self, morphological_analyzer, lexicon):
+        """
+        Return the lemma morphology table attached to a lexicon, creating it on first use.
+
+        Parameters:
+            morphological_analyzer (MorphologicalAnalyzer): Instance of the morphological analyzer.
+            lexicon (Lexicon): Lexicon instance to use for morphology extraction.
+
+        Returns:
+            LemmaMorphologyTable: The memoized lemma morphology table.
+        """
+        table = self.lemma_tables.get(lexicon.cache_namespace)
+        if table is None:
+            # Les tables d'une version antérieure du même lexique (avant un ajout) sont périmées
+            self.lemma_tables = {namespace: other for namespace, other in self.lemma_tables.items()
+                                 if other.lexicon is not lexicon}
+            table = LemmaMorphologyTable(morphological_analyzer, lexicon)
+            self.lemma_tables[lexicon.cache_namespace] = table
+        return table
+
     def map_pos_to_spacy(self, pos):
         """
         Map custom POS to spaCy POS tags.
@@ -57,12 +83,11 @@ class Disambiguator:
         Returns:
             str: Mapped spaCy POS tag.
         """
-        for key, value in self.POS_MAPPING.items():
-            if pos.startswith(key):
-                logging.debug(f"Mapping POS '{pos}' to '{value}'")
-                return value
-        logging.warning(f"POS '{pos}' not mapped, defaulting to 'X'")
-        return "X"  # Default if no match found
+        # Correspondance précalculée une fois par tag dans la table partagée
+        upos = TAG_TABLE.info(pos).upos
+        if upos == "X":
+            logging.warning("POS '%s' not mapped, defaulting to 'X'", pos)
+        return upos
 
     def disambiguate(self, tokens, morphological_analyzer, lexicon):
         """
@@ -77,6 +102,16 @@ class Disambiguator:
             list: List of tokens with disambiguated POS and lemmata.
         """
         logging.info("Starting disambiguation process")
+        # Analyser en un seul lot tous les lemmes candidats du document
+        self.get_lemma_table(morphological_analyzer, lexicon).prefill(
+            lemma for token in tokens for lemma, _ in token.lemma_candidates
+        )
+        # Décodage de toute la séquence de POS en une fois, sinon token par token
+        decoded_pos = None
+        if self.sequence_decoder is not None:
+            decoded_pos = []
+            for _, sentence in itertools.groupby(tokens, key=lambda token: token.token_pid):
+                decoded_pos.extend(self.sequence_decoder.decode([token.pos_candidates for token in sentence]))
         prev_pos = 'BOS'  # Begin of sentence marker
         prev_token = None  # To keep track of the previous token
         prev_prev_token = None  # To keep track of the token before the previous token
@@ -87,26 +122,33 @@ class Disambiguator:
 
             # Disambiguate POS
             pos_candidates = token.pos_candidates  # List of tuples (POS, score)
-            logging.info(f"***** Disambiguation token: {token.text}")
-            logging.debug(f"POS candidates for '{token.text}': {pos_candidates}")
-            disamb_pos = self.disambiguate_pos(prev_pos, pos_candidates, next_token, morphological_analyzer, lexicon)
+            if TRACE.enabled:
+                TRACE("***** Disambiguation token: %s, POS candidates: %s", token.text, pos_candidates)
+            if decoded_pos is not None:
+                disamb_pos = decoded_pos[i]
+            else:
+                disamb_pos = self.disambiguate_pos(prev_pos, pos_candidates, next_token, morphological_analyzer,
+                                                   lexicon)
 
             # Map the selected POS to spaCy format
             spacy_pos = self.map_pos_to_spacy(disamb_pos)
             token.pos_ = spacy_pos
-            logging.debug(f"Disambiguated POS for '{token.text}': {spacy_pos}")
+            if TRACE.enabled:
+                TRACE("Disambiguated POS for '%s': %s", token.text, spacy_pos)
 
             # Disambiguate Lemma
             lemma_candidates = sorted(token.lemma_candidates, key=lambda x: x[1], reverse=True)  # Sort by score
             disamb_lemma = self.disambiguate_lemma(spacy_pos, lemma_candidates, token, morphological_analyzer, lexicon)
             token.lemma_ = disamb_lemma
-            logging.debug(f"Disambiguated Lemma for '{token.text}': {disamb_lemma}")
+            if TRACE.enabled:
+                TRACE("Disambiguated Lemma for '%s': %s", token.text, disamb_lemma)
 
             # Check if it's an auxiliary verb and update POS accordingly
             auxiliary_verbs = ["être", "avoir"]
             if token.pos_ == "VERB" and token.lemma_ in auxiliary_verbs:
                 token.pos_ = "AUX"
-                logging.debug(f"Token '{token.text}' reclassified as AUX")
+                if TRACE.enabled:
+                    TRACE("Token '%s' reclassified as AUX", token.text)
 
             # Condition existante : Transformation du POS si deux tokens adjacents sont des NOUN et possèdent un candidat 'Adj'
             if prev_token and prev_token.pos_ == "NOUN" and token.pos_ == "NOUN":
@@ -136,10 +178,9 @@ class Disambiguator:
                         token_to_modify, _ = max(adj_tokens, key=lambda x: x[1])
                         original_pos = token_to_modify.pos_
                         token_to_modify.pos_ = "ADJ"
-                        print(
-                            f"Modified POS of token '{token_to_modify.text}' from '{original_pos}' to 'ADJ' "
-                            f"due to adjacent NOUNs with 'Adj' candidates."
-                        )
+                        if TRACE.enabled:
+                            TRACE("Modified POS of token '%s' from '%s' to 'ADJ' due to adjacent NOUNs with 'Adj' "
+                                  "candidates.", token_to_modify.text, original_pos)
 
             # Nouvelle condition spécifique : ADJ + "et" + NOUN avec candidat 'Adj'
             if (
@@ -154,10 +195,9 @@ class Disambiguator:
                 # Transformer le POS en 'ADJ'
                 original_pos = token.pos_
                 #token.pos_ = "ADJ"
-                logging.debug(
-                    f"Modified POS of token '{token.text}' from '{original_pos}' to 'ADJ' "
-                    f"due to pattern ADJ + 'et' + NOUN with 'Adj' candidate."
-                )
+                if TRACE.enabled:
+                    TRACE("Modified POS of token '%s' from '%s' to 'ADJ' due to pattern ADJ + 'et' + NOUN with "
+                          "'Adj' candidate.", token.text, original_pos)
             if token.text=="car":
                 token.pos_="CCONJ"
             if token.text.lower() in {"ce","ces"}:
@@ -190,7 +230,7 @@ class Disambiguator:
             str: The selected POS tag or 'X' if no candidates are available.
         """
         if not pos_candidates:
-            logging.warning(f"No POS candidates available for previous POS '{prev_pos}'. Assigning 'X' as default POS.")
+            logging.warning("No POS candidates available for previous POS '%s'. Assigning 'X' as default POS.", prev_pos)
             return 'X'  # Assign a default POS
 
         # Ensure prev_pos is a string
@@ -199,32 +239,36 @@ class Disambiguator:
 
         # Disambiguate the next token first if available
         if next_token and not next_token.pos_:
-            logging.info(f"Disambiguating the next token: {next_token.text}")
             next_pos_candidates = next_token.pos_candidates
-            logging.info(f"POS candidates for next token '{next_token.text}': {next_pos_candidates}")
             next_pos = self.disambiguate_pos(prev_pos, next_pos_candidates, None, morphological_analyzer, lexicon)
-            logging.info(f"Disambiguated POS for next token '{next_token.text}': {next_pos}")
+            if TRACE.enabled:
+                TRACE("Disambiguated POS for next token '%s' from %s: %s", next_token.text, next_pos_candidates, next_pos)
             next_token.pos_ = self.map_pos_to_spacy(next_pos)
 
-        logging.info(f"Previous token POS: {prev_pos}")
+        if TRACE.enabled:
+            TRACE("Previous token POS: %s", prev_pos)
 
         # Special rule: If the previous POS is 'DET' and the current candidate is 'VERB', reclassify as 'NOUN'
         for candidate, score in pos_candidates:
             if candidate.startswith("Ver") and prev_pos.startswith("Det"):
-                logging.info(f"Reclassifying 'VERB' as 'NOUN' since it's preceded by a 'DET'.")
+                if TRACE.enabled:
+                    TRACE("Reclassifying 'VERB' as 'NOUN' since it's preceded by a 'DET'.")
                 return "Nom"  # Map to 'NOUN' in the custom POS system
 
         # Special handling based on next token's POS
         if next_token and next_token.pos_:
             for candidate, score in pos_candidates:
                 if candidate.startswith("Det") and next_token.pos_ in ['NOUN', 'PROPN']:
-                    logging.info(f"Favoring 'DET' for candidate '{candidate}' based on next token POS '{next_token.pos_}'.")
+                    if TRACE.enabled:
+                        TRACE("Favoring 'DET' for candidate '%s' based on next token POS '%s'.", candidate, next_token.pos_)
                     return candidate
                 if candidate.startswith("Pre") and next_token.pos_ in ['NOUN', 'PROPN', 'PRON']:
-                    logging.info(f"Favoring 'ADP' for candidate '{candidate}' based on next token POS '{next_token.pos_}'.")
+                    if TRACE.enabled:
+                        TRACE("Favoring 'ADP' for candidate '%s' based on next token POS '%s'.", candidate, next_token.pos_)
                     return candidate
                 if candidate.startswith("Pro") and next_token.pos_ in ['VERB', 'ADP']:
-                    logging.info(f"Favoring 'PRON' for candidate '{candidate}' based on next token POS '{next_token.pos_}'.")
+                    if TRACE.enabled:
+                        TRACE("Favoring 'PRON' for candidate '%s' based on next token POS '%s'.", candidate, next_token.pos_)
                     return candidate
 
         # Define POS priority for tie-breaking (Adj has higher priority than Nom)
@@ -248,7 +292,8 @@ class Disambiguator:
         # Default behavior: Select the candidate with the highest score and highest priority
         best_pos = max(pos_candidates, key=lambda x: (x[1], -get_pos_priority(x[0], prev_pos)))
         selected_pos = best_pos[0]
-        logging.debug(f"Selected best POS '{selected_pos}' based on highest score and priority.")
+        if TRACE.enabled:
+            TRACE("Selected best POS '%s' based on highest score and priority.", selected_pos)
         
         return selected_pos
 
@@ -278,68 +323,73 @@ class Disambiguator:
             return None
 
         if not lemma_candidates:
-            logging.warning(f"No lemma candidates available for POS '{pos}'. Assigning the token itself as lemma.")
+            logging.warning("No lemma candidates available for POS '%s'. Assigning the token itself as lemma.", pos)
             return token.text.lower()  # Default to the lowercase form of the token itself
 
         # Step 1: Special rule - Reclassify 'VERB' or 'AUX' to 'NOUN' if previous POS is 'DET'
         if pos in ['VERB', 'AUX'] and prev_pos == 'DET':
-            logging.info(f"Reclassifying POS 'VERB' or 'AUX' to 'NOUN' because previous POS is 'DET'.")
+            if TRACE.enabled:
+                TRACE("Reclassifying POS 'VERB' or 'AUX' to 'NOUN' because previous POS is 'DET'.")
             pos = 'NOUN'
 
         pos_matched_lemmas = []
         best_lemma = None
 
-        # Step 2: Evaluate each lemma candidate for POS matching
-        for lemma, score in lemma_candidates:
-            temp_token = Token(lemma)
-            temp_token.pos_candidates = token.pos_candidates
-            temp_token.pos_ = self.disambiguate_pos(None, temp_token.pos_candidates)
-            temp_token.pos_ = self.map_pos_to_spacy(temp_token.pos_)
-            morphological_analyzer.analyze([temp_token], lexicon)
-
-            if temp_token.pos_ == pos:
-                pos_matched_lemmas.append((temp_token, lemma, score))
+        # Step 2: Evaluate each lemma candidate for POS matching.
+        # Le POS du candidat est déduit des POS candidats du token lui-même : il est donc
+        # identique pour tous les lemmes et n'est calculé qu'une fois.
+        candidate_pos = self.map_pos_to_spacy(self.disambiguate_pos(None, token.pos_candidates))
+        lemma_table = self.get_lemma_table(morphological_analyzer, lexicon)
+        if candidate_pos == pos:
+            lemma_table.prefill(lemma for lemma, _ in lemma_candidates)
+            for lemma, score in lemma_candidates:
+                pos_matched_lemmas.append((lemma_table.features(lemma), lemma, score))
 
         # Step 3: If no POS-matched lemmas, return the first lemma
         if not pos_matched_lemmas:
             return lemma_candidates[0][0]
 
         # Step 4: Among POS-matched lemmas, prefer singular candidates
-        singular_lemmas = [lemma_info for lemma_info in pos_matched_lemmas if lemma_info[0].morph.get('Number') == 'Sing']
+        singular_lemmas = [lemma_info for lemma_info in pos_matched_lemmas if lemma_info[0].get('Number') == 'Sing']
         if singular_lemmas:
             pos_matched_lemmas = singular_lemmas
-            logging.debug(f"Filtered lemmas to prefer singular: {[lemma[1] for lemma in pos_matched_lemmas]}")
+            if TRACE.enabled:
+                TRACE("Filtered lemmas to prefer singular: %s", [lemma[1] for lemma in pos_matched_lemmas])
 
         # Step 5: Among remaining lemmas, prefer masculine lemmas
-        masculine_lemmas = [lemma_info for lemma_info in pos_matched_lemmas if lemma_info[0].morph.get('Gender') == 'Mas' and token.pos_ != 'NOUN']
+        masculine_lemmas = [lemma_info for lemma_info in pos_matched_lemmas if lemma_info[0].get('Gender') == 'Mas' and token.pos_ != 'NOUN']
         if masculine_lemmas:
             pos_matched_lemmas = masculine_lemmas
-            logging.debug(f"Filtered lemmas to prefer masculine: {[lemma[1] for lemma in masculine_lemmas]}")
+            if TRACE.enabled:
+                TRACE("Filtered lemmas to prefer masculine: %s", [lemma[1] for lemma in masculine_lemmas])
 
         # Step 6: Return the highest scoring lemma among the remaining filtered ones
         best_lemma = max(pos_matched_lemmas, key=lambda x: x[2])[1]
-        logging.debug(f"Best lemma selected after preferences: {best_lemma}")
+        if TRACE.enabled:
+            TRACE("Best lemma selected after preferences: %s", best_lemma)
 
         # Step 7: Check if a rule from the JSON file applies (occurrences > 15)
         normalized_text = token.text.lower().strip()  # Ensure the text matches the format in the JSON
         key = f"{normalized_text}_{pos}"
 
-        logging.debug(f"Key being used for JSON lookup: {key}")
-
         if key in self.lemma_replacement_rules:
             rule = self.lemma_replacement_rules[key]
-            logging.debug(f"Rule found for key: {key} with occurrences {rule['occurrences']}")
+            if TRACE.enabled:
+                TRACE("Rule found for key: %s with occurrences %s", key, rule['occurrences'])
             if rule["occurrences"] > 15:
                 if best_lemma == rule["structure"]["system_lemma"]:
-                    logging.info(f"Replacing '{best_lemma}' with spaCy lemma '{rule['structure']['spacy_lemma']}' due to occurrence threshold.")
+                    if TRACE.enabled:
+                        TRACE("Replacing '%s' with spaCy lemma '%s' due to occurrence threshold.",
+                              best_lemma, rule['structure']['spacy_lemma'])
                     best_lemma = rule['structure']['spacy_lemma']
                     return rule["structure"]["spacy_lemma"]
-                else:
-                    logging.debug(f"Best lemma '{best_lemma}' does not match system lemma '{rule['structure']['system_lemma']}'")
-            else:
-                logging.debug(f"Occurrences for key '{key}' are less than or equal to 15: {rule['occurrences']}")
-        else:
-            logging.debug(f"No rule found for key: {key}")
+                elif TRACE.enabled:
+                    TRACE("Best lemma '%s' does not match system lemma '%s'", best_lemma,
+                          rule['structure']['system_lemma'])
+            elif TRACE.enabled:
+                TRACE("Occurrences for key '%s' are less than or equal to 15: %s", key, rule['occurrences'])
+        elif TRACE.enabled:
+            TRACE("No rule found for key: %s", key)
 
         return best_lemma
 
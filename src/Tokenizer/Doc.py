@@ -0,0 +1,181 @@
+# src/Doc.py
+
+from array import array
+
+from Tokenizer.Token_ import Token
+
+# Colonnes d'identifiants de chaînes internées (0 = None)
+STRING_COLUMNS = ('text', 'lemma', 'pos', 'dep', 'gender', 'number', 'shape')
+# Colonnes booléennes : 1, 0, ou -1 pour None
+FLAG_COLUMNS = ('is_alpha', 'is_stop')
+
+
+class StringStore:
+    def __init__(self):
+        """
+        Interned strings of a document: POS, dependency labels, lemmas and forms are stored
+        once and referenced by integer ids. Id 0 stands for None.
+        """
+        self.ids = {None: 0}
+        self.strings = [None]
+
+    def intern(self, value):
+        """
+        Return the id of a value (string or hashable tuple), registering it the first time.
+        """
+        value_id = self.ids.get(value)
+        if value_id is None:
+            value_id = self.ids[value] = len(self.strings)
+            self.strings.append(value)
+        return value_id
+
+    def __getitem__(self, value_id):
+        return self.strings[value_id]
+
+    def __len__(self):
+        return len(self.strings) - 1
+
+    def __getstate__(self):
+        # Le dictionnaire inverse se reconstruit depuis la liste
+        return self.strings
+
+    def __setstate__(self, strings):
+        self.strings = strings
+        self.ids = {value: value_id for value_id, value in enumerate(strings)}
+
+
+class Doc:
+    def __init__(self, source=None):
+        """
+        Columnar representation of an analyzed text: one array per token attribute, with
+        interned strings, the head as an index into the document and the morphology as
+        an interned tuple of features. A Doc holds no reference cycle and pickles compactly.
+
+        The analysis intermediates (lemma and POS candidates) are not kept. Existing code
+        reads the document through `tokens`, a list of Token views rebuilt on demand.
+
+        Parameters:
+            source (str): The normalized text the token offsets refer to.
+        """
+        self.source = source
+        self.strings = StringStore()
+        for column in STRING_COLUMNS:
+            setattr(self, column, array('I'))
+        for column in FLAG_COLUMNS:
+            setattr(self, column, array('b'))
+        self.start = array('i')  # -1 : pas d'offset
+        self.end = array('i')
+        self.head = array('i')  # Index de la tête dans le document, -1 : aucune
+        self.token_id = array('i')
+        self.token_pid = array('i')
+        self.morph = array('I')  # Id du tuple trié des traits morphologiques
+        self.groupe = array('I')  # Id du tuple des groupes (type, début, fin)
+        self._tokens = None
+
+    @classmethod
+    def from_tokens(cls, tokens, source=None):
+        """
+        Build a Doc from the tokens of the pipeline. The tokens are kept as the views of the
+        document until it is pickled.
+
+        Parameters:
+            tokens (list): Analyzed tokens.
+            source (str): Normalized text, taken from the tokens when they are spans.
+
+        Returns:
+            Doc: The document.
+        """
+        if source is None and tokens:
+            source = tokens[0].source
+        doc = cls(source)
+        intern = doc.strings.intern
+        positions = {id(token): i for i, token in enumerate(tokens)}
+        for token in tokens:
+            is_span = token.source is source and source is not None
+            # Le texte n'est stocké que s'il diffère de l'intervalle source (ex. apostrophe ajoutée)
+            if is_span and token._text is not None and token._text != source[token.start:token.end]:
+                doc.text.append(intern(token._text))
+            else:
+                doc.text.append(0 if is_span else intern(token.text))
+            doc.lemma.append(intern(token.lemma_))
+            doc.pos.append(intern(token.pos_))
+            doc.dep.append(intern(token.dep_))
+            doc.gender.append(intern(token.gender))
+            doc.number.append(intern(token.number))
+            doc.shape.append(intern(token.shape_))
+            doc.is_alpha.append(-1 if token.is_alpha is None else int(bool(token.is_alpha)))
+            doc.is_stop.append(-1 if token.is_stop is None else int(bool(token.is_stop)))
+            doc.start.append(token.start if is_span else -1)
+            doc.end.append(token.end if is_span else -1)
+            doc.head.append(positions.get(id(token.head), -1))
+            doc.token_id.append(-1 if token.token_id is None else token.token_id)
+            doc.token_pid.append(-1 if token.token_pid is None else token.token_pid)
+            doc.morph.append(intern(tuple(sorted(token.morph.items())) if token.morph else None))
+            doc.groupe.append(intern(tuple((groupe['type'],) + tuple(groupe['range']) for groupe in token.groupe)
+                                     if token.groupe else None))
+        doc._tokens = tokens
+        return doc
+
+    def __len__(self):
+        return len(self.pos)
+
+    def text_of(self, i):
+        """Return the text of the i-th token."""
+        value = self.strings[self.text[i]]
+        if value is None and self.start[i] >= 0:
+            return self.source[self.start[i]:self.end[i]]
+        return value
+
+    @property
+    def tokens(self):
+        """
+        Token views of the document, rebuilt from the columns after unpickling.
+        """
+        if self._tokens is None:
+            self._tokens = self.materialize()
+        return self._tokens
+
+    def materialize(self):
+        strings = self.strings
+        tokens = []
+        for i in range(len(self)):
+            if self.start[i] >= 0:
+                text = strings[self.text[i]]
+                token = Token(text, self.start[i], self.end[i], self.source)
+            else:
+                token = Token(strings[self.text[i]])
+            token.lemma_ = strings[self.lemma[i]]
+            token.pos_ = strings[self.pos[i]]
+            token.dep_ = strings[self.dep[i]]
+            token.gender = strings[self.gender[i]]
+            token.number = strings[self.number[i]]
+            token.shape_ = strings[self.shape[i]]
+            token.is_alpha = None if self.is_alpha[i] < 0 else bool(self.is_alpha[i])
+            token.is_stop = None if self.is_stop[i] < 0 else bool(self.is_stop[i])
+            if self.token_id[i] >= 0:
+                token.token_id = self.token_id[i]
+            if self.token_pid[i] >= 0:
+                token.token_pid = self.token_pid[i]
+            if token.token_id is not None and token.token_pid is not None:
+                token.token_primarykey = (token.token_pid, token.token_id)
+            token.morph = dict(strings[self.morph[i]] or ())
+            groupes = strings[self.groupe[i]]
+            if groupes:
+                token.groupe = [{'type': kind, 'range': (start, end)} for kind, start, end in groupes]
+            tokens.append(token)
+        for token, head in zip(tokens, self.head):
+            if head >= 0:
+                token.head = tokens[head]
+        return tokens
+
+    def __iter__(self):
+        return iter(self.tokens)
+
+    def __getitem__(self, i):
+        return self.tokens[i]
+
+    def __getstate__(self):
+        # Seules les colonnes sont sérialisées, pas les tokens
+        state = self.__dict__.copy()
+        state['_tokens'] = None
+        return state
@@ -0,0 +1,177 @@
+# src/FuzzyLexicon.py
+
+import argparse
+import logging
+import os
+import pickle
+import unicodedata
+
+from Tokenizer.BisectLexicon import line_key
+from Tokenizer.IndexBuilder import write_metadata
+
+FUZZY_INDEX_FILE = 'fuzzy_index.pkl'
+
+
+def fold_accents(text):
+    """
+    Remove the diacritics of a text ('élève' -> 'eleve'); 'œ' and 'æ' are expanded.
+    """
+    text = text.replace('œ', 'oe').replace('æ', 'ae')
+    decomposed = unicodedata.normalize('NFD', text)
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def deletes(word, max_distance):
+    """
+    Return the variants of a word with up to max_distance characters deleted, word included.
+    """
+    variants = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        frontier = {variant[:i] + variant[i + 1:] for variant in frontier for i in range(len(variant))}
+        variants |= frontier
+    return variants
+
+
+def edit_distance(a, b, max_distance):
+    """
+    Optimal string alignment distance (insertions, deletions, substitutions and adjacent
+    transpositions) between a and b, or max_distance + 1 as soon as it is exceeded.
+    """
+    if abs(len(a) - len(b)) > max_distance:
+        return max_distance + 1
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous_previous is not None and i > 1 and j > 1
+                    and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]):
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+        if min(current) > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+    return previous[-1]
+
+
+def read_lexicon_forms(*paths):
+    """
+    Stream the distinct forms (line keys) of sorted lexicon files.
+    """
+    for path in paths:
+        previous = None
+        with open(path, 'rb') as f:
+            for line in f:
+                key = line_key(line)
+                if key != previous and key:
+                    yield key
+                previous = key
+
+
+class FuzzyIndex:
+    def __init__(self, forms=(), max_distance=1, prefix_length=7):
+        """
+        Approximate lookup of lexicon forms with a symmetric-delete index over accent-folded
+        keys: a missing accent costs nothing, and typos up to max_distance edits are found
+        by intersecting the deletions of the query with the precomputed deletions of the keys.
+        As in SymSpell, only the deletions of the first prefix_length characters are indexed;
+        candidates are then checked with the full edit distance.
+
+        Parameters:
+            forms (iterable): Normalized lexicon forms.
+            max_distance (int): Maximal edit distance of a correction.
+            prefix_length (int): Length of the indexed prefix.
+        """
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.folded = {}  # Clé sans accents -> formes du lexique
+        self.variants = {}  # Suppression du préfixe d'une clé -> clés sans accents
+        for form in forms:
+            self.add(form)
+
+    def add(self, form):
+        key = fold_accents(form)
+        forms = self.folded.get(key)
+        if forms is None:
+            self.folded[key] = [form]
+            for variant in deletes(key[:self.prefix_length], self.max_distance):
+                self.variants.setdefault(variant, []).append(key)
+        elif form not in forms:
+            forms.append(form)
+
+    def eligible(self, word):
+        """
+        Only alphabetic words long enough for a correction to be meaningful are looked up.
+        """
+        return len(word) >= 3 and word.replace("'", '').replace('-', '').isalpha()
+
+    def lookup(self, word, limit=3):
+        """
+        Return the lexicon forms closest to a word.
+
+        Parameters:
+            word (str): Normalized word missing from the lexicon.
+            limit (int): Maximal number of forms returned.
+
+        Returns:
+            list: The forms at the smallest edit distance (accents ignored), empty if none
+                  is within max_distance.
+        """
+        key = fold_accents(word)
+        exact = [form for form in self.folded.get(key, ()) if form != word]
+        if exact:
+            return exact[:limit]
+
+        best_distance = self.max_distance + 1
+        best_keys = []
+        seen = set()
+        for variant in deletes(key[:self.prefix_length], self.max_distance):
+            for candidate in self.variants.get(variant, ()):
+                if candidate in seen or candidate == key:
+                    continue
+                seen.add(candidate)
+                distance = edit_distance(key, candidate, self.max_distance)
+                if distance < best_distance:
+                    best_distance, best_keys = distance, [candidate]
+                elif distance == best_distance and distance <= self.max_distance:
+                    best_keys.append(candidate)
+        return [form for candidate in sorted(best_keys) for form in self.folded[candidate]][:limit]
+
+    def __len__(self):
+        return len(self.folded)
+
+
+def build_fuzzy_index(data_dir, max_distance=1, prefix_length=7, with_hash=True):
+    """
+    Build fuzzy_index.pkl from the forms of lemma_clean_utf8.txt and pos_utf8.txt.
+
+    Returns:
+        FuzzyIndex: The index written.
+    """
+    sources = [os.path.join(data_dir, 'lemma_clean_utf8.txt'), os.path.join(data_dir, 'pos_utf8.txt')]
+    index = FuzzyIndex(read_lexicon_forms(*sources), max_distance, prefix_length)
+    path = os.path.join(data_dir, FUZZY_INDEX_FILE)
+    with open(path + '.tmp', 'wb') as f:
+        pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(path + '.tmp', path)
+    write_metadata(path, sources, with_hash, entries=len(index), variants=len(index.variants))
+    logging.info(f"Fuzzy index written to {path} ({len(index)} keys, {len(index.variants)} deletions)")
+    return index
+
+
+if __name__ == "__main__":
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    default_data_dir = os.path.abspath(os.path.join(base_dir, '..', '..', 'data'))
+
+    parser = argparse.ArgumentParser(description="Build the approximate lookup index of the lexicon.")
+    parser.add_argument('--data-dir', default=default_data_dir)
+    parser.add_argument('--max-distance', type=int, default=1)
+    parser.add_argument('--prefix-length', type=int, default=7)
+    parser.add_argument('--no-hash', action='store_true', help="Do not record the SHA-256 of the sources.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    index = build_fuzzy_index(args.data_dir, args.max_distance, args.prefix_length, not args.no_hash)
+    print({'keys': len(index), 'deletions': len(index.variants)})
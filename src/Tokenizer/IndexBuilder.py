@@ -0,0 +1,285 @@
+# src/IndexBuilder.py
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import pickle
+from array import array
+from multiprocessing import Pool
+
+
+def source_signature(path, with_hash=True):
+    """
+    Describe a source file by its size, modification time and (optionally) SHA-256 digest.
+
+    Parameters:
+        path (str): Path to the source file.
+        with_hash (bool): Whether to compute the SHA-256 digest of the content.
+
+    Returns:
+        dict: The signature of the file.
+    """
+    stat = os.stat(path)
+    signature = {'size': stat.st_size, 'mtime': stat.st_mtime}
+    if with_hash:
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                digest.update(block)
+        signature['sha256'] = digest.hexdigest()
+    return signature
+
+
+def metadata_path(artifact_path):
+    """Path of the JSON sidecar holding the metadata of a built artifact."""
+    return artifact_path + '.meta.json'
+
+
+def write_metadata(artifact_path, source_paths, with_hash=True, **extra):
+    """
+    Record the signature of the source files an artifact was built from.
+
+    Parameters:
+        artifact_path (str): Path to the built artifact (index, compiled lexicon...).
+        source_paths (list): Paths of the source files.
+        with_hash (bool): Whether to record the SHA-256 digest of the sources.
+        extra: Additional fields to store (entry counts...).
+    """
+    metadata = dict(extra)
+    metadata['sources'] = {os.path.basename(path): source_signature(path, with_hash) for path in source_paths}
+    dump_metadata(artifact_path, metadata)
+
+
+def dump_metadata(artifact_path, metadata):
+    """
+    Write the metadata sidecar of an artifact atomically: a concurrent reader (a worker
+    building its Lexicon, another service sharing the data dir) never sees a partial file.
+    """
+    path = metadata_path(artifact_path)
+    # Fichier temporaire propre au processus : deux écrivains simultanés ne se mélangent pas
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(metadata, f, indent=2)
+        os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def check_staleness(artifact_path, source_paths):
+    """
+    Compare the sources of an artifact with the signatures recorded when it was built.
+    A file whose size changed is stale; a file whose mtime changed is stale unless its
+    recorded digest still matches. In that case the new mtime is recorded, so the file
+    is not hashed again by the next check (after a clone or a copy, for instance).
+
+    Returns:
+        str: None if the artifact is up to date, otherwise the reason why it is stale.
+    """
+    try:
+        with open(metadata_path(artifact_path), 'r', encoding='utf-8') as f:
+            metadata = json.load(f)
+    except FileNotFoundError:
+        return "no build metadata"
+    except (OSError, ValueError) as e:
+        return f"unreadable build metadata ({e})"
+    recorded = metadata.get('sources', {})
+
+    touched = False
+    for path in source_paths:
+        name = os.path.basename(path)
+        if name not in recorded:
+            return f"{name} was not a source of this build"
+        if not os.path.exists(path):
+            continue
+        expected = recorded[name]
+        current = source_signature(path, with_hash=False)
+        if current['size'] != expected['size']:
+            return f"{name} changed size ({expected['size']} -> {current['size']} bytes)"
+        if current['mtime'] != expected['mtime']:
+            if 'sha256' not in expected or source_signature(path)['sha256'] != expected['sha256']:
+                return f"{name} was modified after the build"
+            # Contenu identique : seule la date a changé
+            expected['mtime'] = current['mtime']
+            touched = True
+
+    if touched:
+        try:
+            dump_metadata(artifact_path, metadata)
+        except OSError as e:
+            logging.info(f"Could not refresh the build metadata of {artifact_path}: {e}")
+    return None
+
+
+def split_chunks(path, n_chunks):
+    """
+    Split a file into byte ranges that start and end on line boundaries.
+
+    Returns:
+        list: List of (start, end) offsets.
+    """
+    size = os.path.getsize(path)
+    if n_chunks <= 1 or size == 0:
+        return [(0, size)]
+    boundaries = [0]
+    with open(path, 'rb') as f:
+        for i in range(1, n_chunks):
+            f.seek(max(size * i // n_chunks, boundaries[-1]))
+            if f.tell() > 0:
+                f.readline()  # Se placer au début de la ligne suivante
+            boundaries.append(min(f.tell(), size))
+    boundaries.append(size)
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+
+def scan_chunk(args):
+    """
+    Scan one byte range of a lexicon file and collect the offsets of each form.
+
+    Parameters:
+        args (tuple): (path, start, end, index_type). For the 'lemma' index only the first
+                      line of each run of consecutive lines of a form is recorded, since
+                      Lexicon reads the following lines of the run; for the 'pos' index every
+                      line is recorded.
+
+    Returns:
+        tuple: (index, first form, last form) of the range.
+    """
+    path, start, end, index_type = args
+    index = {}
+    first_key = last_key = None
+    with open(path, 'rb') as f:
+        f.seek(start)
+        offset = start
+        while offset < end:
+            line = f.readline()
+            if not line:
+                break
+            key = line.split(b';', 1)[0].strip().decode('utf-8', errors='replace').lower()
+            if index_type == 'pos' or key != last_key:
+                offsets = index.get(key)
+                if offsets is None:
+                    offsets = index[key] = array('q')
+                offsets.append(offset)
+            if first_key is None:
+                first_key = key
+            last_key = key
+            offset += len(line)
+    return index, first_key, last_key
+
+
+def build_index(path, index_type='lemma', workers=1):
+    """
+    Build a lemma or POS index in a single streaming pass over the file, optionally in
+    parallel over line-aligned chunks.
+
+    Parameters:
+        path (str): Path to lemma_clean_utf8.txt or pos_utf8.txt.
+        index_type (str): 'lemma' or 'pos'.
+        workers (int): Number of processes scanning the file.
+
+    Returns:
+        dict: Form -> array('q') of byte offsets in the file.
+    """
+    chunks = [(path, start, end, index_type) for start, end in split_chunks(path, workers)]
+    if len(chunks) > 1:
+        with Pool(min(workers, len(chunks))) as pool:
+            parts = pool.map(scan_chunk, chunks)
+    else:
+        parts = [scan_chunk(chunk) for chunk in chunks]
+
+    index = {}
+    previous_last_key = None
+    for (part, first_key, last_key), (_, start, _, _) in zip(parts, chunks):
+        for key, offsets in part.items():
+            if index_type == 'lemma' and key == first_key == previous_last_key and offsets[0] == start:
+                # La série de lignes a commencé dans le morceau précédent
+                offsets = offsets[1:]
+                if not offsets:
+                    continue
+            if key in index:
+                index[key].extend(offsets)
+            else:
+                index[key] = offsets
+        if last_key is not None:
+            previous_last_key = last_key
+    return index
+
+
+def build_reverse_index(path):
+    """
+    Build the reverse lemma index in a single streaming pass over lemma_clean_utf8.txt,
+    with the same filter as the lemma lookups (three columns, strictly positive score).
+
+    Returns:
+        dict: Lemma -> tuple of the surface forms it can be realized by.
+    """
+    forms_by_lemma = {}
+    interned = {}  # Une seule chaîne par forme, partagée dans le pickle
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            columns = [col.strip() for col in line.strip().split(';')]
+            if len(columns) == 3 and columns[2].isdigit() and int(columns[2]) > 0:
+                form = interned.setdefault(columns[0].lower(), columns[0].lower())
+                forms = forms_by_lemma.setdefault(columns[1].lower(), [])
+                if form not in forms:
+                    forms.append(form)
+    return {lemma: tuple(forms) for lemma, forms in forms_by_lemma.items()}
+
+
+def build_indexes(data_dir, workers=1, with_hash=True):
+    """
+    Build lemma_index.pkl, pos_index.pkl and the reverse index lemma_forms.pkl, and record
+    the signature of their sources.
+
+    Returns:
+        dict: Number of forms of each index.
+    """
+    counts = {}
+    for index_type, source_name, index_name in (('lemma', 'lemma_clean_utf8.txt', 'lemma_index.pkl'),
+                                                ('pos', 'pos_utf8.txt', 'pos_index.pkl')):
+        source_path = os.path.join(data_dir, source_name)
+        index_path = os.path.join(data_dir, index_name)
+        logging.info(f"Building {index_type} index from {source_path} with {workers} worker(s)")
+        index = build_index(source_path, index_type, workers)
+        with open(index_path + '.tmp', 'wb') as f:
+            pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(index_path + '.tmp', index_path)
+        write_metadata(index_path, [source_path], with_hash, entries=len(index))
+        counts[index_type] = len(index)
+        logging.info(f"{index_type.capitalize()} index written to {index_path} ({len(index)} forms)")
+
+    source_path = os.path.join(data_dir, 'lemma_clean_utf8.txt')
+    index_path = os.path.join(data_dir, 'lemma_forms.pkl')
+    reverse_index = build_reverse_index(source_path)
+    with open(index_path + '.tmp', 'wb') as f:
+        pickle.dump(reverse_index, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(index_path + '.tmp', index_path)
+    write_metadata(index_path, [source_path], with_hash, entries=len(reverse_index))
+    counts['reverse'] = len(reverse_index)
+    logging.info(f"Reverse lemma index written to {index_path} ({len(reverse_index)} lemmas)")
+    return counts
+
+
+if __name__ == "__main__":
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    default_data_dir = os.path.abspath(os.path.join(base_dir, '..', '..', 'data'))
+
+    parser = argparse.ArgumentParser(description="Build the lemma and POS indexes of the lexicon.")
+    parser.add_argument('--data-dir', default=default_data_dir)
+    parser.add_argument('--workers', type=int, default=1, help="Number of processes scanning each file.")
+    parser.add_argument('--no-hash', action='store_true', help="Do not record the SHA-256 of the sources.")
+    parser.add_argument('--check', action='store_true', help="Only report whether the indexes are stale.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    if args.check:
+        for source_name, index_name in (('lemma_clean_utf8.txt', 'lemma_index.pkl'), ('pos_utf8.txt', 'pos_index.pkl'),
+                                        ('lemma_clean_utf8.txt', 'lemma_forms.pkl')):
+            reason = check_staleness(os.path.join(args.data_dir, index_name), [os.path.join(args.data_dir, source_name)])
+            print(f"{index_name}: {'stale (' + reason + ')' if reason else 'up to date'}")
+    else:
+        print(build_indexes(args.data_dir, workers=args.workers, with_hash=not args.no_hash))
@@ -0,0 +1,48 @@
+# src/LemmaMorphology.py
+
+from Tokenizer.Token_ import Token
+
+
+class LemmaMorphologyTable:
+    def __init__(self, morphological_analyzer, lexicon):
+        """
+        Memoized table from a lemma to its dominant POS tag and its Gender/Number features,
+        derived from the lexicon entries of the lemma itself.
+
+        Parameters:
+            morphological_analyzer (MorphologicalAnalyzer): Analyzer used to fill the table.
+            lexicon (Lexicon): Lexicon the features are read from.
+        """
+        self.morphological_analyzer = morphological_analyzer
+        self.lexicon = lexicon
+        self.entries = {}
+
+    def prefill(self, lemmas):
+        """
+        Analyze in one batch every lemma not yet in the table.
+
+        Parameters:
+            lemmas (iterable): Lemma strings.
+        """
+        missing = [lemma for lemma in dict.fromkeys(lemmas) if lemma not in self.entries]
+        if not missing:
+            return
+        tokens = self.morphological_analyzer.analyze([Token(lemma) for lemma in missing], self.lexicon)
+        for lemma, token in zip(missing, tokens):
+            dominant_pos = token.pos_candidates[0][0] if token.pos_candidates else None
+            features = {key: value for key, value in token.morph.items() if key in ('Gender', 'Number')}
+            self.entries[lemma] = (dominant_pos, features)
+
+    def get(self, lemma):
+        """
+        Return the (dominant POS tag, {'Gender': ..., 'Number': ...}) entry of a lemma.
+        """
+        if lemma not in self.entries:
+            self.prefill([lemma])
+        return self.entries[lemma]
+
+    def features(self, lemma):
+        """
+        Return the Gender/Number features of a lemma.
+        """
+        return self.get(lemma)[1]
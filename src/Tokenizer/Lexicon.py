@@ -4,21 +4,46 @@ import os
 import pickle
 import logging
 
-# Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
-# Désactive les messages de log de niveau DEBUG et inférieur
-logging.disable(logging.DEBUG)
+from Tokenizer.BisectLexicon import BisectLexicon
+from Tokenizer.CompiledLexicon import CompiledLexicon, compile_lexicon
+from Tokenizer.FuzzyLexicon import FUZZY_INDEX_FILE, FuzzyIndex, read_lexicon_forms
+from Tokenizer.IndexBuilder import build_indexes, build_reverse_index, check_staleness, metadata_path
+from Tokenizer.LexiconClient import DEFAULT_SOCKET_PATH, LexiconClient
+from Tokenizer.LexiconOverlay import OVERLAY_FILE, LexiconOverlay
+from Tokenizer.TagTable import TAG_TABLE
+from Tokenizer.Trace import LEXICON_TRACE as TRACE
+from Tokenizer.TrieLexicon import TrieLexicon
 
 class Lexicon:
-    def __init__(self):
+    def __init__(self, data_dir=None, mode=None, rebuild_stale=False, store=None, socket_path=None, fuzzy=False):
         """
         Initialize the Lexicon class by loading the indexes for lemma and POS extraction.
+
+        Parameters:
+            data_dir (str): Directory holding the lexicon files. Defaults to the repository 'data' folder.
+            mode (str): 'index' for the pickled indexes with seek/readline lookups, 'compiled'
+                        for the memory-mapped binary lexicon (see CompiledLexicon), 'trie' for the
+                        memory-mapped marisa-trie files (see TrieLexicon), 'bisect' to binary-search
+                        the sorted text files without loading any index (see BisectLexicon),
+                        'daemon' to query a running LexiconServer. When None, the compiled lexicon is used if
+                        'lexicon.bin' exists.
+            rebuild_stale (bool): Rebuild the indexes (or the compiled lexicon) when their source
+                                  files changed since they were built, instead of only warning.
+            store: An already opened store (e.g. a CompiledLexicon attached to a shared memory
+                   block, see SharedResources) to use instead of loading one; mode is then 'store'.
+            socket_path (str): Socket of the lexicon daemon in 'daemon' mode (see LexiconClient).
+            fuzzy (bool): Replace the candidates of a word missing from the lexicon (missing
+                          accent, typo...) by those of its closest forms (see FuzzyLexicon).
         """
         logging.info("Initializing Lexicon")
         
         # Définir les chemins relatifs à ce fichier
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        data_dir = os.path.join(base_dir,'..', '..', 'data')
+        if data_dir is None:
+            base_dir = os.path.dirname(os.path.abspath(__file__))
+            data_dir = os.path.join(base_dir,'..', '..', 'data')
+        self.data_dir = data_dir
+        # Espace de noms des analyses mises en cache (une entrée par forme et par lexique)
+        self.base_namespace = self.cache_namespace = os.path.abspath(data_dir) + ('#fuzzy' if fuzzy else '')
         
         # Chemins vers les fichiers de lemme et POS
         self.lemma_file_path = os.path.join(data_dir, 'lemma_clean_utf8.txt')
@@ -27,10 +52,118 @@ class Lexicon:
         # Chemins vers les fichiers d'index
         self.lemma_index_path = os.path.join(data_dir, 'lemma_index.pkl')
         self.pos_index_path = os.path.join(data_dir, 'pos_index.pkl')
+        self.reverse_index_path = os.path.join(data_dir, 'lemma_forms.pkl')
+        self.compiled_path = os.path.join(data_dir, 'lexicon.bin')
+
+        if store is not None:
+            mode = 'store'
+        elif mode is None:
+            mode = 'compiled' if os.path.exists(self.compiled_path) else 'index'
+        if mode not in ('index', 'compiled', 'trie', 'bisect', 'daemon', 'store'):
+            raise ValueError(f"Unknown lexicon mode: {mode}")
+        self.mode = mode
+
+        # Stockage alternatif aux index pickle (mêmes méthodes search_lemmas/search_pos/search)
+        self.store = None
+        self.compiled = None
+        self.lemma_index = {}
+        self.pos_index = {}
+        # Index inverse lemme -> formes, chargé au premier appel de forms_of
+        self.reverse_index = None
+        # Artefacts dont les fichiers sources ont changé depuis leur construction
+        self.stale_artifacts = {}
+        if mode == 'store':
+            self.store = store
+            if isinstance(store, CompiledLexicon):
+                self.compiled = store
+        elif mode == 'compiled':
+            reason = self.check_artifact(self.compiled_path, [self.lemma_file_path, self.pos_file_path])
+            if reason and rebuild_stale:
+                compile_lexicon(self.lemma_file_path, self.pos_file_path, self.compiled_path)
+                self.stale_artifacts.pop(self.compiled_path)
+            # Lexique binaire projeté en mémoire : aucun index à désérialiser
+            self.compiled = self.store = CompiledLexicon(self.compiled_path)
+            logging.info(f"Compiled lexicon mapped from {self.compiled_path}")
+        elif mode == 'trie':
+            self.store = TrieLexicon(data_dir)
+            logging.info(f"Trie lexicon mapped from {data_dir}")
+        elif mode == 'bisect':
+            # Aucun index en mémoire : recherche dichotomique dans les fichiers triés
+            self.store = BisectLexicon(self.lemma_file_path, self.pos_file_path)
+        elif mode == 'daemon':
+            # Le démon détient le lexique chargé : aucun index à charger ici
+            self.store = LexiconClient(socket_path or DEFAULT_SOCKET_PATH)
+        else:
+            reasons = [self.check_artifact(self.lemma_index_path, [self.lemma_file_path]),
+                       self.check_artifact(self.pos_index_path, [self.pos_file_path])]
+            if any(reasons) and rebuild_stale:
+                build_indexes(data_dir)
+                self.stale_artifacts.clear()
+            # Charger les index
+            self.lemma_index = self.load_index(self.lemma_index_path, index_type='lemma')
+            self.pos_index = self.load_index(self.pos_index_path, index_type='pos')
+        if self.store is not None:
+            # Inventaire fermé des tags : analysé une fois pour toutes
+            TAG_TABLE.compile(self.store.tags)
+
+        # Ajouts et corrections consultés avant le lexique de base (voir LexiconOverlay)
+        self.overlay = LexiconOverlay(os.path.join(data_dir, OVERLAY_FILE))
+        # Recherche approchée des formes absentes du lexique
+        self.fuzzy = self.load_fuzzy_index() if fuzzy else None
+        self.update_cache_namespace()
+
+    def update_cache_namespace(self):
+        """
+        Derive the cache namespace from the overlay version, so that the analyses cached
+        before an overlay update are no longer used.
+        """
+        if self.overlay.version:
+            self.cache_namespace = f"{self.base_namespace}#overlay{self.overlay.version}"
+        else:
+            self.cache_namespace = self.base_namespace
 
-        # Charger les index
-        self.lemma_index = self.load_index(self.lemma_index_path, index_type='lemma')
-        self.pos_index = self.load_index(self.pos_index_path, index_type='pos')
+    def add_lemma(self, form, lemma, score):
+        """
+        Add or correct a lemma entry in the overlay, without rebuilding the lexicon.
+        A score lower or equal to 0 removes the lemma from the candidates of the form.
+        """
+        form = self.overlay.add('lemma', form, lemma, score)
+        if self.fuzzy is not None:
+            self.fuzzy.add(form)
+        self.update_cache_namespace()
+
+    def add_pos(self, form, pos_tag, score):
+        """
+        Add or correct a POS entry in the overlay, without rebuilding the lexicon.
+        A score lower or equal to 0 removes the tag from the candidates of the form.
+        """
+        form = self.overlay.add('pos', form, pos_tag, score)
+        if self.fuzzy is not None:
+            self.fuzzy.add(form)
+        self.update_cache_namespace()
+
+    def check_artifact(self, artifact_path, source_paths):
+        """
+        Check that an index or compiled lexicon is still in sync with its source files.
+
+        Parameters:
+            artifact_path (str): Path to the built artifact.
+            source_paths (list): Paths of the text files it was built from.
+
+        Returns:
+            str: None if the artifact is up to date, otherwise the reason why it is stale.
+        """
+        if not os.path.exists(artifact_path):
+            return None
+        if not os.path.exists(metadata_path(artifact_path)):
+            logging.info(f"No build metadata for {artifact_path}, cannot check whether it is stale")
+            return None
+        reason = check_staleness(artifact_path, source_paths)
+        if reason:
+            self.stale_artifacts[artifact_path] = reason
+            logging.warning(f"{os.path.basename(artifact_path)} may be stale: {reason}. "
+                            f"Rebuild it with IndexBuilder.py / CompiledLexicon.py.")
+        return reason
 
     def load_index(self, index_file_path, index_type='lemma'):
         """
@@ -53,6 +186,76 @@ class Lexicon:
             logging.error(f"Error loading {index_type} index: {e}")
             return {}
 
+    def load_reverse_index(self):
+        """
+        Load the reverse lemma index built by IndexBuilder, or build it in memory from the
+        lemma file when it is missing or stale.
+
+        Returns:
+            dict: Lemma -> tuple of surface forms.
+        """
+        if os.path.exists(self.reverse_index_path) and not self.check_artifact(self.reverse_index_path,
+                                                                               [self.lemma_file_path]):
+            return self.load_index(self.reverse_index_path, index_type='reverse')
+        if not os.path.exists(self.lemma_file_path):
+            logging.error(f"No reverse lemma index and no lemma file in {self.data_dir}")
+            return {}
+        logging.info(f"Building the reverse lemma index from {self.lemma_file_path}")
+        return build_reverse_index(self.lemma_file_path)
+
+    def load_fuzzy_index(self):
+        """
+        Load the approximate lookup index built by FuzzyLexicon.py, or build it in memory from
+        the lexicon files when it is missing or stale.
+
+        Returns:
+            FuzzyIndex: The index, overlay forms included.
+        """
+        path = os.path.join(self.data_dir, FUZZY_INDEX_FILE)
+        sources = [self.lemma_file_path, self.pos_file_path]
+        if os.path.exists(path) and not self.check_artifact(path, sources):
+            logging.info(f"Loading fuzzy index from {path}")
+            with open(path, 'rb') as f:
+                index = pickle.load(f)
+        else:
+            logging.warning(f"No up-to-date {FUZZY_INDEX_FILE} in {self.data_dir}, building the fuzzy index "
+                            f"in memory (build it once with FuzzyLexicon.py)")
+            index = FuzzyIndex(read_lexicon_forms(*[path for path in sources if os.path.exists(path)]))
+        for form in self.overlay.forms():
+            index.add(form)
+        return index
+
+    def forms_of(self, lemma):
+        """
+        Return the surface forms that can realize a lemma (e.g. 'chat' -> ('chat', 'chats')),
+        overlay included.
+
+        Parameters:
+            lemma (str): The lemma.
+
+        Returns:
+            tuple: The surface forms, empty if the lemma is unknown.
+        """
+        if self.reverse_index is None:
+            self.reverse_index = self.load_reverse_index()
+        lemma = lemma.strip().lower()
+        forms = self.reverse_index.get(lemma, ())
+        for form, changes in self.overlay.entries['lemma'].items():
+            score = changes.get(lemma)
+            if score is None:
+                continue
+            if score > 0 and form not in forms:
+                forms += (form,)
+            elif score <= 0:
+                forms = tuple(other for other in forms if other != form)
+        return forms
+
+    def normalize(self, text):
+        """
+        Normalize a token text into the form used as lexicon key.
+        """
+        return text.lower().lstrip('-').strip("-")  # Supprimer les tirets initiaux et finaux
+
     def extract_lemmas(self, tokens: list) -> list:
         """
         Extracts all lemma candidates for a list of tokens and assigns them to each token.
@@ -64,14 +267,147 @@ class Lexicon:
             list: The list of tokens with all lemma candidates.
         """
         logging.info("Starting lemma extraction")
-        target_words = [token.text.lower().lstrip('-').strip("-") for token in tokens]  # Supprimer les tirets initiaux et les apostrophes
-        logging.debug(f"Target words for lemma extraction: {target_words}")
+        # Chaque forme distincte n'est cherchée qu'une fois, puis diffusée aux tokens
+        words = [self.normalize(token.text) for token in tokens]
+        target_words = list(dict.fromkeys(words))
+        if TRACE.enabled:
+            TRACE("Target words for lemma extraction: %s", target_words)
+
+        results = self.search_lemmas(target_words)
+
+        candidates_by_word = self.rank_lemma_candidates(results, target_words)
+        for token, word in zip(tokens, words):
+            # Assigner les lemmes uniques avec leurs scores au token (liste de tuples (lemme, score))
+            token.lemma_candidates = list(candidates_by_word[word])
 
-        results = self.search_lemmas_with_index(self.lemma_file_path, self.lemma_index, target_words)
+        logging.info("Lemma extraction completed")
+        return tokens
+
+    def extract_lexical(self, tokens: list) -> list:
+        """
+        Extract lemma and POS candidates in a single batched lookup: each distinct form is
+        searched once, and each lexicon file is opened at most once for the whole batch.
+
+        Parameters:
+            tokens (list): List of Token objects.
 
-        for token in tokens:
-            # Nettoyer le mot
-            word = token.text.lower().lstrip('-').strip("-")
+        Returns:
+            list: The list of tokens with all lemma and POS candidates.
+        """
+        logging.info("Starting fused lemma and POS extraction")
+        words = [self.normalize(token.text) for token in tokens]
+        target_words = list(dict.fromkeys(words))
+
+        lemma_results, pos_results = self.search(target_words)
+
+        lemmas_by_word = self.rank_lemma_candidates(lemma_results, target_words)
+        pos_by_word = self.rank_pos_candidates(pos_results, target_words)
+        for token, word in zip(tokens, words):
+            token.lemma_candidates = list(lemmas_by_word[word])
+            token.pos_candidates = list(pos_by_word[word])
+
+        logging.info("Fused lemma and POS extraction completed")
+        return tokens
+
+    def search(self, target_words):
+        """
+        Look up the raw lemma and POS candidates of normalized words, whatever the storage mode.
+
+        Parameters:
+            target_words (list): Distinct normalized words.
+
+        Returns:
+            tuple: (lemma results, POS results), two dictionaries mapping each word found
+                   to a list of (candidate, score) tuples.
+        """
+        if self.store is not None:
+            lemma_results, pos_results = self.store.search(target_words)
+        else:
+            lemma_results = self.search_lemmas_with_index(self.lemma_file_path, self.lemma_index, target_words)
+            pos_results = self.search_pos_with_index(self.pos_file_path, self.pos_index, target_words)
+        lemma_results = self.overlay.merge('lemma', lemma_results, target_words)
+        pos_results = self.overlay.merge('pos', pos_results, target_words)
+        return (self.correct_misses('lemma', lemma_results, target_words),
+                self.correct_misses('pos', pos_results, target_words))
+
+    def search_lemmas(self, target_words):
+        """
+        Look up the raw lemma candidates of normalized words, overlay included.
+
+        Returns:
+            dict: A dictionary mapping each word to a list of (lemma, score) tuples.
+        """
+        return self.correct_misses('lemma', self.lookup('lemma', target_words), target_words)
+
+    def search_pos(self, target_words):
+        """
+        Look up the raw POS candidates of normalized words, overlay included.
+
+        Returns:
+            dict: A dictionary mapping each word to a list of (tag, score) tuples.
+        """
+        return self.correct_misses('pos', self.lookup('pos', target_words), target_words)
+
+    def lookup(self, kind, target_words):
+        """
+        Look up the raw candidates of one kind ('lemma' or 'pos') in the base lexicon and the overlay.
+        """
+        if kind == 'lemma':
+            if self.store is not None:
+                results = self.store.search_lemmas(target_words)
+            else:
+                results = self.search_lemmas_with_index(self.lemma_file_path, self.lemma_index, target_words)
+        elif self.store is not None:
+            results = self.store.search_pos(target_words)
+        else:
+            results = self.search_pos_with_index(self.pos_file_path, self.pos_index, target_words)
+        return self.overlay.merge(kind, results, target_words)
+
+    def correct_misses(self, kind, results, target_words):
+        """
+        Give the words without any candidate the candidates of their closest lexicon forms,
+        when the fuzzy lookup is enabled.
+
+        Parameters:
+            kind (str): 'lemma' or 'pos'.
+            results (dict): Word -> list of (candidate, score), modified in place.
+            target_words (list): Distinct normalized words.
+
+        Returns:
+            dict: The results.
+        """
+        if self.fuzzy is None:
+            return results
+        corrections = {}
+        for word in target_words:
+            if not results.get(word) and self.fuzzy.eligible(word):
+                forms = self.fuzzy.lookup(word)
+                if forms:
+                    corrections[word] = forms
+        if not corrections:
+            return results
+
+        # Une seule recherche groupée pour toutes les formes proposées
+        found = self.lookup(kind, list(dict.fromkeys(form for forms in corrections.values() for form in forms)))
+        for word, forms in corrections.items():
+            results[word] = [candidate for form in forms for candidate in found.get(form, ())]
+            if TRACE.enabled:
+                TRACE("Fuzzy %s lookup: '%s' -> %s", kind, word, forms)
+        return results
+
+    def rank_lemma_candidates(self, results, target_words):
+        """
+        Keep the maximal score of each lemma and sort the candidates by decreasing score.
+
+        Parameters:
+            results (dict): Word -> list of (lemma, score) tuples, as returned by the searches.
+            target_words (list): Distinct normalized words.
+
+        Returns:
+            dict: Word -> sorted list of (lemma, score); unknown words get [(word, 0)].
+        """
+        candidates_by_word = {}
+        for word in target_words:
             if word in results and results[word]:
                 # Créer un dictionnaire pour conserver le score maximal de chaque lemme
                 lemma_scores = {}
@@ -80,17 +416,44 @@ class Lexicon:
                         lemma_scores[lemma] = score
                 # Convertir en liste de tuples et trier par score décroissant
                 possible_lemmas_sorted = sorted(lemma_scores.items(), key=lambda x: x[1], reverse=True)
-                logging.info(f"All lemmas for '{word}': {possible_lemmas_sorted}")
-                # Assigner les lemmes uniques avec leurs scores au token
-                token.lemma_candidates = possible_lemmas_sorted  # Liste de tuples (lemme, score)
-                logging.info(f"Lemmas with scores assigned to token: {token.lemma_candidates}")
+                if TRACE.enabled:
+                    TRACE("All lemmas for '%s': %s", word, possible_lemmas_sorted)
+                candidates_by_word[word] = possible_lemmas_sorted
             else:
                 # Si aucun lemme trouvé, assigner le mot lui-même comme lemme avec un score par défaut (0)
-                token.lemma_candidates = [(word, 0)]
-                logging.warning(f"No lemma found for '{word}', using the word itself with score 0")
+                candidates_by_word[word] = [(word, 0)]
+                logging.warning("No lemma found for '%s', using the word itself with score 0", word)
+        return candidates_by_word
 
-        logging.info("Lemma extraction completed")
-        return tokens
+    def rank_pos_candidates(self, results, target_words):
+        """
+        Keep the maximal score of each POS tag and sort the candidates by decreasing score.
+
+        Parameters:
+            results (dict): Word -> list of (tag, score) tuples, as returned by the searches.
+            target_words (list): Distinct normalized words.
+
+        Returns:
+            dict: Word -> sorted list of (tag, score); unknown words get an empty list.
+        """
+        candidates_by_word = {}
+        for word in target_words:
+            if results.get(word):
+                pos_candidates = {}
+                for pos_tag, score in results[word]:
+                    # Conserver le score maximal pour chaque pos_tag
+                    if pos_tag not in pos_candidates or score > pos_candidates[pos_tag]:
+                        pos_candidates[pos_tag] = score
+                # Trier les POS candidates par score décroissant
+                sorted_pos_candidates = sorted(pos_candidates.items(), key=lambda x: x[1], reverse=True)
+                candidates_by_word[word] = sorted_pos_candidates
+                if TRACE.enabled:
+                    TRACE("POS candidates for '%s': %s", word, sorted_pos_candidates)
+            else:
+                # Si aucun POS trouvé, assigner une liste vide
+                candidates_by_word[word] = []
+                logging.warning("No POS found for '%s'", word)
+        return candidates_by_word
 
     def search_lemmas_with_index(self, txt_file_path, index, target_words):
         """
@@ -119,18 +482,21 @@ class Lexicon:
                             columns = [col.strip() for col in line.split(';')]  # Séparer les colonnes
 
                             while line:
-                                logging.debug(f"Reading at position {position} for '{word}': {line}")
+                                if TRACE.enabled:
+                                    TRACE("Reading at position %s for '%s': %s", position, word, line)
 
                                 # Vérification stricte : le mot dans columns[0] doit correspondre exactement au mot cible
                                 if columns[0].lower() != word or len(columns[0]) != len(word):
-                                    logging.debug(f"Word mismatch at position {position}: '{columns[0].lower()}' != '{word}'")
+                                    if TRACE.enabled:
+                                        TRACE("Word mismatch at position %s: '%s' != '%s'", position, columns[0].lower(), word)
                                     break  # Arrêter la lecture si le mot ne correspond plus
 
                                 if len(columns) == 3 and columns[2].isdigit():
                                     lemma = columns[1].strip().lower()  # Convertir le lemme en minuscules
                                     score = int(columns[2].strip())
                                     if score > 0:  # Ne considérer que les scores positifs
-                                        logging.debug(f"Lemma found at position {position}: '{lemma}', Score: {score}")
+                                        if TRACE.enabled:
+                                            TRACE("Lemma found at position %s: '%s', Score: %s", position, lemma, score)
                                         results[word].append((lemma, score))
 
                                 # Lire la ligne suivante pour vérifier d'autres lemmes pour le même mot
@@ -154,47 +520,58 @@ class Lexicon:
             list: The list of tokens with all POS candidates.
         """
         logging.info("Starting POS extraction")
+        # Chaque forme distincte n'est cherchée qu'une fois, puis diffusée aux tokens
+        words = [self.normalize(token.text) for token in tokens]
+        target_words = list(dict.fromkeys(words))
 
-        for token in tokens:
-            # Nettoyer le mot
-            word = token.text.lower().lstrip('-').strip("-")
-            if word in self.pos_index:
-                positions = self.pos_index[word]  # Récupérer les positions depuis l'index
-                pos_candidates = {}
-                try:
-                    with open(self.pos_file_path, 'rb') as file:
-                        for pos_position in positions:
-                            file.seek(pos_position)
-                            line_bytes = file.readline()
-                            try:
-                                line = line_bytes.decode('utf-8').strip()
-                            except UnicodeDecodeError:
-                                logging.error(f"Unicode decode error at position {pos_position} for word '{word}'")
-                                continue
-
-                            columns = line.split(';')
-
-                            if len(columns) > 3 and columns[3].isdigit():
-                                score = int(columns[3])
-                                if score > 0:
-                                    pos_tag = columns[2].strip()
-                                    # Conserver le score maximal pour chaque pos_tag
-                                    if pos_tag not in pos_candidates or score > pos_candidates[pos_tag]:
-                                        pos_candidates[pos_tag] = score
-                                    logging.debug(f"Found POS: '{pos_tag}' with score: {score} for word: '{word}'")
-
-                except Exception as e:
-                    logging.error(f"Error extracting POS for '{word}': {e}")
-                    pos_candidates = {}
+        results = self.search_pos(target_words)
 
-                # Trier les POS candidates par score décroissant
-                sorted_pos_candidates = sorted(pos_candidates.items(), key=lambda x: x[1], reverse=True)
-                token.pos_candidates = sorted_pos_candidates
-                logging.info(f"POS candidates for '{word}': {sorted_pos_candidates}")
-            else:
-                # Si aucun POS trouvé, assigner une liste vide
-                token.pos_candidates = []
-                logging.warning(f"No POS found for '{word}'")
+        candidates_by_word = self.rank_pos_candidates(results, target_words)
+        for token, word in zip(tokens, words):
+            token.pos_candidates = list(candidates_by_word[word])
 
         logging.info("POS extraction completed")
         return tokens
+
+    def search_pos_with_index(self, txt_file_path, index, target_words):
+        """
+        Searches for POS tags in the file using the index, opening the file once for all words.
+
+        Parameters:
+            txt_file_path (str): Path to the POS text file.
+            index (dict): POS index mapping words to file positions.
+            target_words (list): List of target words to extract POS tags for.
+
+        Returns:
+            dict: A dictionary mapping each word to a list of (tag, score) tuples.
+        """
+        results = {word: [] for word in target_words}
+        words = [word for word in target_words if word in index]
+        if not words:
+            return results
+
+        try:
+            with open(txt_file_path, 'rb') as file:
+                for word in words:
+                    for pos_position in index[word]:  # Récupérer les positions depuis l'index
+                        file.seek(pos_position)
+                        line_bytes = file.readline()
+                        try:
+                            line = line_bytes.decode('utf-8').strip()
+                        except UnicodeDecodeError:
+                            logging.error("Unicode decode error at position %s for word '%s'", pos_position, word)
+                            continue
+
+                        columns = line.split(';')
+
+                        if len(columns) > 3 and columns[3].isdigit():
+                            score = int(columns[3])
+                            if score > 0:
+                                pos_tag = columns[2].strip()
+                                results[word].append((pos_tag, score))
+                                if TRACE.enabled:
+                                    TRACE("Found POS: '%s' with score: %s for word: '%s'", pos_tag, score, word)
+        except Exception as e:
+            logging.error(f"Error during POS search: {e}")
+
+        return results
@@ -0,0 +1,168 @@
+# src/LexiconClient.py
+
+import json
+import logging
+import os
+import socket
+import tempfile
+import threading
+
+from cache import CacheLRU
+
+# Socket par défaut du démon de lexique (voir LexiconServer)
+DEFAULT_SOCKET_PATH = os.path.join(tempfile.gettempdir(), 'extracteur_lexicon.sock')
+
+
+class LexiconClient:
+    def __init__(self, socket_path=DEFAULT_SOCKET_PATH, batch_size=512, cache_size=100000, timeout=30.0,
+                 max_in_flight=4):
+        """
+        Client of the lexicon daemon (see LexiconServer). It exposes the same search methods
+        as the other lexicon stores, so Lexicon(mode='daemon') uses it transparently.
+
+        Parameters:
+            socket_path (str): Path of the Unix domain socket of the daemon.
+            batch_size (int): Maximum number of words per request; larger batches are split
+                              into several pipelined requests.
+            cache_size (int): Number of forms kept in the local LRU cache.
+            timeout (float): Socket timeout in seconds.
+            max_in_flight (int): Maximum number of requests sent whose answers are not read yet.
+        """
+        self.socket_path = socket_path
+        self.batch_size = batch_size
+        self.max_in_flight = max(1, max_in_flight)
+        self.cache = CacheLRU(cache_size)
+        self._lock = threading.Lock()
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        try:
+            self._socket.connect(socket_path)
+        except OSError as e:
+            self._socket.close()
+            raise ConnectionError(f"No lexicon daemon listening on {socket_path}: {e}") from e
+        self._reader = self._socket.makefile('rb')
+        self.tags = self.request([{'op': 'tags'}])[0]['tags']
+        logging.info(f"Connected to the lexicon daemon on {socket_path}")
+
+    def request(self, requests):
+        """
+        Send several requests and read their answers, in order. At most max_in_flight requests
+        wait for their answer: the following ones are sent as the answers are read, so neither
+        side blocks writing to a full socket buffer while the other one is not reading.
+
+        Parameters:
+            requests (list): JSON-serializable request dictionaries.
+
+        Returns:
+            list: The answer dictionaries.
+        """
+        lines = [json.dumps(req, ensure_ascii=False).encode('utf-8') + b'\n' for req in requests]
+        with self._lock:
+            answers = []
+            sent = 0
+            while len(answers) < len(lines):
+                # Compléter la fenêtre des requêtes en attente de réponse
+                end = min(len(lines), len(answers) + self.max_in_flight)
+                if sent < end:
+                    self._socket.sendall(b''.join(lines[sent:end]))
+                    sent = end
+                line = self._reader.readline()
+                if not line:
+                    raise ConnectionError("The lexicon daemon closed the connection.")
+                answers.append(json.loads(line))
+        for answer in answers:
+            if 'error' in answer:
+                raise RuntimeError(f"Lexicon daemon error: {answer['error']}")
+        return answers
+
+    def search(self, target_words):
+        """
+        Look up both the lemma and the POS candidates of several words, asking the daemon
+        only for the words missing from the local cache.
+
+        Returns:
+            tuple: (lemma results, POS results), two dictionaries keyed by word.
+        """
+        lemma_results, pos_results = {}, {}
+        missing = []
+        for word in target_words:
+            entry = self.cache.obtenir(word)
+            if entry is None:
+                missing.append(word)
+            else:
+                lemma_results[word], pos_results[word] = entry
+
+        if missing:
+            batches = [missing[i:i + self.batch_size] for i in range(0, len(missing), self.batch_size)]
+            answers = self.request([{'op': 'search', 'words': batch} for batch in batches])
+            for batch, answer in zip(batches, answers):
+                for word in batch:
+                    # JSON ne connaît pas les tuples : on reconstruit les (candidat, score)
+                    lemmas = [tuple(candidate) for candidate in answer['lemmas'].get(word, ())]
+                    pos = [tuple(candidate) for candidate in answer['pos'].get(word, ())]
+                    self.cache.ajouter(word, (lemmas, pos))
+                    lemma_results[word], pos_results[word] = lemmas, pos
+        return lemma_results, pos_results
+
+    def search_lemmas(self, target_words):
+        """
+        Look up the lemma candidates of several words.
+
+        Returns:
+            dict: A dictionary mapping each word to a list of (lemma, score) tuples.
+        """
+        return self.search(target_words)[0]
+
+    def search_pos(self, target_words):
+        """
+        Look up the POS candidates of several words.
+
+        Returns:
+            dict: A dictionary mapping each word to a list of (tag, score) tuples.
+        """
+        return self.search(target_words)[1]
+
+    def compounds(self, words):
+        """
+        Tell which words are compound words of the daemon's dictionary.
+
+        Returns:
+            list: One boolean per word.
+        """
+        return self.request([{'op': 'compounds', 'words': list(words)}])[0]['compounds']
+
+    def compounds_with_prefix(self, prefix):
+        """
+        Return the compound words of the daemon's dictionary starting with prefix.
+        """
+        return self.request([{'op': 'prefix', 'prefix': prefix}])[0]['compounds']
+
+    def close(self):
+        """Close the connection to the daemon."""
+        self._reader.close()
+        self._socket.close()
+
+
+class RemoteCompounds:
+    def __init__(self, client, cache_size=100000):
+        """
+        Compound word dictionary held by the lexicon daemon. It supports `in` like the set
+        built by Tokenizer, with a local cache of the answers.
+        """
+        self.client = client
+        self.cache = CacheLRU(cache_size)
+        self.size = client.request([{'op': 'stats'}])[0]['compounds']
+
+    def __contains__(self, word):
+        known = self.cache.obtenir(word)
+        if known is None:
+            known = self.client.compounds([word])[0]
+            self.cache.ajouter(word, known)
+        return known
+
+    def __len__(self):
+        return self.size
+
+    def keys(self, prefix=''):
+        """Return the compound words starting with prefix."""
+        return self.client.compounds_with_prefix(prefix)
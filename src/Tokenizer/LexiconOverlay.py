@@ -0,0 +1,213 @@
+# src/LexiconOverlay.py
+
+import argparse
+import logging
+import os
+
+from Tokenizer.BisectLexicon import line_key
+from Tokenizer.CompiledLexicon import compile_lexicon, normalize_form
+from Tokenizer.IndexBuilder import build_indexes
+from Tokenizer.TrieLexicon import TRIE_FILES, build_lexicon_tries
+
+OVERLAY_FILE = 'lexicon_overlay.txt'
+KINDS = ('lemma', 'pos')
+
+
+class LexiconOverlay:
+    def __init__(self, path):
+        """
+        Small delta of lexicon entries checked before the base lexicon. Entries are appended
+        to a text file ("kind;form;candidate;score" per line) and kept in memory.
+
+        For a form, an overlay entry replaces the base entry of the same candidate (lemma or
+        tag); a score lower or equal to 0 removes the candidate. Other base candidates are kept.
+
+        Parameters:
+            path (str): Path of the overlay file; it is created on the first addition.
+        """
+        self.path = path
+        self.entries = {kind: {} for kind in KINDS}
+        # Nombre de modifications appliquées, pour invalider les analyses en cache
+        self.version = 0
+        self.offset = 0
+        self.refresh()
+
+    def refresh(self):
+        """
+        Read the entries appended to the file since the last read (e.g. by another process).
+        """
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'rb') as f:
+            f.seek(self.offset)
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break  # Ligne en cours d'écriture : relue au prochain appel
+                self.offset += len(line)
+                columns = line.decode('utf-8').rstrip('\n').split(';')
+                if len(columns) == 4 and columns[0] in KINDS and columns[3].lstrip('-').isdigit():
+                    self.apply(columns[0], columns[1], columns[2], int(columns[3]))
+                else:
+                    logging.warning(f"Ignoring malformed overlay line in {self.path}: {line!r}")
+
+    def apply(self, kind, form, candidate, score):
+        self.entries[kind].setdefault(form, {})[candidate] = score
+        self.version += 1
+
+    def add(self, kind, form, candidate, score):
+        """
+        Add (or correct) one entry and append it to the overlay file.
+
+        Parameters:
+            kind (str): 'lemma' or 'pos'.
+            form (str): Surface form, normalized like the lexicon keys.
+            candidate (str): Lemma or POS tag.
+            score (int): Score of the candidate; 0 or less removes it.
+
+        Returns:
+            str: The normalized form.
+        """
+        if kind not in KINDS:
+            raise ValueError(f"Unknown overlay entry kind: {kind}")
+        form = normalize_form(form)
+        candidate = candidate.strip()
+        if kind == 'lemma':
+            candidate = candidate.lower()
+        if not form or not candidate or ';' in form + candidate or '\n' in form + candidate:
+            raise ValueError(f"Invalid overlay entry: {form!r} -> {candidate!r}")
+        self.refresh()
+        line = f"{kind};{form};{candidate};{int(score)}\n".encode('utf-8')
+        with open(self.path, 'ab') as f:
+            f.write(line)
+        self.offset += len(line)
+        self.apply(kind, form, candidate, int(score))
+        return form
+
+    def forms(self):
+        """Return the set of forms touched by the overlay."""
+        return set(self.entries['lemma']) | set(self.entries['pos'])
+
+    def merge(self, kind, results, target_words):
+        """
+        Apply the overlay to the raw results of a base lexicon search.
+
+        Parameters:
+            kind (str): 'lemma' or 'pos'.
+            results (dict): Word -> list of (candidate, score), modified in place.
+            target_words (list): Distinct normalized words of the search.
+
+        Returns:
+            dict: The results.
+        """
+        entries = self.entries[kind]
+        if not entries:
+            return results
+        for word in target_words:
+            changes = entries.get(word)
+            if changes:
+                kept = [(candidate, score) for candidate, score in results.get(word, ()) if candidate not in changes]
+                results[word] = kept + [(candidate, score) for candidate, score in changes.items() if score > 0]
+        return results
+
+    def __len__(self):
+        return sum(len(changes) for entries in self.entries.values() for changes in entries.values())
+
+
+def fold_into_file(path, changes, candidate_column, format_line):
+    """
+    Rewrite a sorted lexicon file with the overlay changes of one kind: base lines of an
+    overridden candidate are dropped and the new lines are written after the remaining lines
+    of their form, so the file stays sorted by line key.
+
+    Parameters:
+        path (str): Lexicon text file.
+        changes (dict): Form -> {candidate: score}.
+        candidate_column (int): Column of the candidate (1 for the lemmas, 2 for the tags).
+        format_line (callable): (form, candidate, score) -> line without the newline.
+    """
+    def candidate_of(line):
+        columns = line.decode('utf-8', errors='replace').strip().split(';')
+        if len(columns) <= candidate_column:
+            return None
+        candidate = columns[candidate_column].strip()
+        # Les lemmes sont comparés en minuscules, comme à la lecture du lexique
+        return candidate.lower() if candidate_column == 1 else candidate
+
+    pending = sorted(changes)
+    position = 0
+
+    def new_lines(form):
+        return [(format_line(form, candidate, score) + '\n').encode('utf-8')
+                for candidate, score in changes[form].items() if score > 0]
+
+    with open(path, 'rb') as source, open(path + '.tmp', 'wb') as output:
+        for line in source:
+            key = line_key(line)
+            # Écrire les formes de l'overlay qui précèdent cette ligne
+            while position < len(pending) and pending[position] < key:
+                output.writelines(new_lines(pending[position]))
+                position += 1
+            if key in changes and candidate_of(line) in changes[key]:
+                continue
+            if not line.endswith(b'\n'):
+                line += b'\n'
+            output.write(line)
+        for form in pending[position:]:
+            output.writelines(new_lines(form))
+    os.replace(path + '.tmp', path)
+
+
+def compact_overlay(data_dir):
+    """
+    Fold the overlay into lemma_clean_utf8.txt and pos_utf8.txt, rebuild the indexes (and
+    the compiled lexicon and tries when they exist), then empty the overlay. This is an
+    offline operation: running processes keep their overlay until they are restarted.
+
+    Returns:
+        int: Number of overlay entries folded.
+    """
+    overlay = LexiconOverlay(os.path.join(data_dir, OVERLAY_FILE))
+    count = len(overlay)
+    if not count:
+        return 0
+    lemma_path = os.path.join(data_dir, 'lemma_clean_utf8.txt')
+    pos_path = os.path.join(data_dir, 'pos_utf8.txt')
+    fold_into_file(lemma_path, overlay.entries['lemma'], 1,
+                   lambda form, lemma, score: f"{form};{lemma};{score}")
+    # La deuxième colonne du fichier POS n'est pas lue par le lexique
+    fold_into_file(pos_path, overlay.entries['pos'], 2,
+                   lambda form, tag, score: f"{form};{form};{tag};{score}")
+
+    build_indexes(data_dir)
+    compiled_path = os.path.join(data_dir, 'lexicon.bin')
+    if os.path.exists(compiled_path):
+        compile_lexicon(lemma_path, pos_path, compiled_path)
+    if os.path.exists(os.path.join(data_dir, TRIE_FILES['lemmas'])):
+        build_lexicon_tries(lemma_path, pos_path, data_dir)
+    os.truncate(overlay.path, 0)
+    logging.info(f"Folded {count} overlay entries into {data_dir}")
+    return count
+
+
+if __name__ == "__main__":
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    default_data_dir = os.path.abspath(os.path.join(base_dir, '..', '..', 'data'))
+
+    parser = argparse.ArgumentParser(description="Add entries to the lexicon overlay or fold it into the lexicon.")
+    parser.add_argument('--data-dir', default=default_data_dir)
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    add_parser = subparsers.add_parser('add', help="Add or correct an entry (a score of 0 removes it).")
+    add_parser.add_argument('kind', choices=KINDS)
+    add_parser.add_argument('form')
+    add_parser.add_argument('candidate', help="Lemma or POS tag.")
+    add_parser.add_argument('score', type=int)
+    subparsers.add_parser('compact', help="Fold the overlay into the lexicon files and rebuild the indexes.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    if args.command == 'add':
+        overlay = LexiconOverlay(os.path.join(args.data_dir, OVERLAY_FILE))
+        overlay.add(args.kind, args.form, args.candidate, args.score)
+        print(f"{len(overlay)} overlay entries")
+    else:
+        print(f"{compact_overlay(args.data_dir)} overlay entries folded")
@@ -0,0 +1,98 @@
+# src/LexiconServer.py
+
+import argparse
+import json
+import logging
+import os
+import socketserver
+
+from Tokenizer.Lexicon import Lexicon
+from Tokenizer.LexiconClient import DEFAULT_SOCKET_PATH
+from Tokenizer.Tokenizer import Tokenizer, compounds_with_prefix
+
+# Protocole : une requête JSON par ligne, une réponse JSON par ligne, dans le même ordre.
+#   {"op": "search", "words": [...]}    -> {"lemmas": {mot: [[lemme, score], ...]}, "pos": {mot: [[tag, score], ...]}}
+#   {"op": "compounds", "words": [...]} -> {"compounds": [true, false, ...]}
+#   {"op": "prefix", "prefix": "..."}   -> {"compounds": [mot, ...]}
+#   {"op": "tags"}                      -> {"tags": [...]}
+#   {"op": "stats"}                     -> {"mode": ..., "compounds": n}
+# Une requête invalide reçoit {"error": "..."} sans fermer la connexion.
+
+
+class LexiconRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        # Le client peut envoyer plusieurs requêtes avant de lire les réponses
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            try:
+                answer = self.server.answer(json.loads(line))
+            except Exception as e:
+                logging.warning(f"Invalid lexicon request: {e}")
+                answer = {'error': str(e)}
+            self.wfile.write(json.dumps(answer, ensure_ascii=False).encode('utf-8') + b'\n')
+            self.wfile.flush()
+
+
+class LexiconServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path, lexicon, compounds=frozenset()):
+        """
+        Local daemon holding a loaded Lexicon and the compound word dictionary, answering
+        batched lookups over a Unix domain socket (see LexiconClient).
+
+        Parameters:
+            socket_path (str): Path of the socket; a leftover socket file is replaced.
+            lexicon (Lexicon): The loaded lexicon.
+            compounds (container): Compound words, e.g. Tokenizer.mots_composes.
+        """
+        self.lexicon = lexicon
+        self.compounds = compounds
+        self.socket_path = socket_path
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        super().__init__(socket_path, LexiconRequestHandler)
+
+    def answer(self, request):
+        """
+        Compute the answer to one request.
+        """
+        op = request.get('op')
+        if op == 'search':
+            lemma_results, pos_results = self.lexicon.search(list(dict.fromkeys(request['words'])))
+            return {'lemmas': lemma_results, 'pos': pos_results}
+        if op == 'compounds':
+            return {'compounds': [word in self.compounds for word in request['words']]}
+        if op == 'prefix':
+            return {'compounds': list(compounds_with_prefix(self.compounds, request['prefix']))}
+        if op == 'tags':
+            store = self.lexicon.store
+            return {'tags': list(store.tags) if store is not None else []}
+        if op == 'stats':
+            return {'mode': self.lexicon.mode, 'compounds': len(self.compounds)}
+        raise ValueError(f"Unknown operation: {op}")
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve lexicon lookups over a Unix domain socket.")
+    parser.add_argument('--data-dir', default=None, help="Directory holding the lexicon files.")
+    parser.add_argument('--socket', default=DEFAULT_SOCKET_PATH)
+    parser.add_argument('--mode', default=None, choices=['index', 'compiled', 'trie'])
+    parser.add_argument('--compound-mode', default=None, choices=['set', 'packed', 'trie'])
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    lexicon = Lexicon(data_dir=args.data_dir, mode=args.mode)
+    compounds = Tokenizer(data_dir=args.data_dir, compound_mode=args.compound_mode).mots_composes
+    with LexiconServer(args.socket, lexicon, compounds) as server:
+        logging.info(f"Lexicon daemon listening on {args.socket}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            logging.info("Lexicon daemon stopped")
@@ -1,17 +1,30 @@
 # src/MorphologicalAnalyzer.py
 #todo : reparer les genders et numbers mixtes  (extraction du det d'avant si le mot est multigender , sinon du mot qui viens après)
 from Tokenizer.Lexicon import Lexicon
-import re
+from Tokenizer.TagTable import TAG_TABLE
+from Tokenizer.Token_ import Token
+from cache import CacheLRU
+import itertools
 import logging
 
+# Cache partagé des analyses par forme de surface, commun à toutes les instances
+# et persistant d'un document à l'autre
+FORM_ANALYSIS_CACHE = CacheLRU(capacite=200000)
+
 class MorphologicalAnalyzer:
-    def __init__(self, stop_words=None):
+    def __init__(self, stop_words=None, cache=FORM_ANALYSIS_CACHE, metriques=None):
         """
         Initialize the MorphologicalAnalyzer class.
 
         Parameters:
             stop_words (set): A set of stop words. If None, a default set is used.
+            cache (CacheLRU): Cache of per-form analyses (lemma and POS candidates, shape,
+                              gender/number and verbal features). Shared by default; None disables it.
+            metriques (MesuresPipeline): Optional metrics receiving the time of the lexicon lookups
+                                         (stage 'lexicon', lemmas and POS found in one search).
         """
+        self.cache = cache
+        self.metriques = metriques
         # Définir une liste de mots-vides (stop words). Vous pouvez la personnaliser selon vos besoins.
         if stop_words is None:
             self.stop_words = {'les', 'le', 'la', 'les', 'un', 'une', 'et', 'ou', 'mais', 'en', 'dans', 'de', 'du', 'des'}
@@ -29,7 +42,22 @@ class MorphologicalAnalyzer:
         Returns:
             list: The list of tokens with added morphological information.
         """
+        # Regrouper les occurrences par forme de surface : chaque forme distincte
+        # n'est analysée qu'une fois et le résultat est diffusé aux autres occurrences
+        groups = {}
         for token in tokens:
+            groups.setdefault(token.text, []).append(token)
+
+        missing = []
+        for text, group in groups.items():
+            entry = self.cache.obtenir((lexicon.cache_namespace, text)) if self.cache is not None else None
+            if entry is not None:
+                self.apply_cached_analysis(group[0], entry)
+            else:
+                missing.append(text)
+        representatives = [groups[text][0] for text in missing]
+
+        for token in representatives:
             # Définir si le token est alphabétique
             token.set_alpha(token.text.isalpha())
 
@@ -39,66 +67,132 @@ class MorphologicalAnalyzer:
             
                 token.text += "'"
 
+        # Extraire les lemmes et les POS candidates des formes distinctes non encore en cache,
+        # en une seule recherche groupée dans le lexique
+        if representatives and self.metriques is not None:
+            with self.metriques.mesurer('lexicon', len(representatives)):
+                lexicon.extract_lexical(representatives)
+        elif representatives:
+            lexicon.extract_lexical(representatives)
+
+        for token in representatives:
+            self.assign_morphological_features(token)
+
+        if self.cache is not None:
+            for text, token in zip(missing, representatives):
+                self.cache.ajouter((lexicon.cache_namespace, text), self.cached_analysis(token))
+
+        for group in groups.values():
             # Définir si le token est un mot-vidage
-            token.set_stop(token.text.lower() in self.stop_words)
-            
-            # Extraire les lemmes pour le token
-            lexicon.extract_lemmas([token])
-
-            # Extraire les POS candidates et les trier par score décroissant
-            lexicon.extract_pos([token])
-            pos_results_sorted = sorted(token.pos_candidates, key=lambda x: x[1], reverse=True)
-
-            # Initialiser les caractéristiques morphologiques
-            morphological_features = {}
-            gender = None
-            number = None
-
-            # Parcourir tous les candidats POS pour extraire les caractéristiques morphologiques
-            for pos, score in pos_results_sorted:
-                # Extraction des caractéristiques morphologiques en fonction du POS
-                if pos.startswith(('Det', 'Nom', 'Adj', 'Pro')):
-                    gender_number = self.extract_gender_number(pos)
-                    # Mettre à jour le genre si trouvé et non encore défini
-                    if 'Gender' in gender_number and not gender:
-                        gender = gender_number['Gender']
-                        morphological_features['Gender'] = gender
-                    # Mettre à jour le nombre si trouvé et non encore défini
-                    if 'Number' in gender_number and not number:
-                        number = gender_number['Number']
-                        morphological_features['Number'] = number
-                elif pos.startswith(('Number:', 'Gender:')):
-                    gender_number = self.extract_gender_number(pos)
-                    # Mettre à jour le genre si trouvé et non encore défini
-                    if 'Gender' in gender_number and not gender:
-                        gender = gender_number['Gender']
-                        morphological_features['Gender'] = gender
-                    # Mettre à jour le nombre si trouvé et non encore défini
-                    if 'Number' in gender_number and not number:
-                        number = gender_number['Number']
-                        morphological_features['Number'] = number
-                elif pos.startswith('Ver'):
-                    verbal_features = self.extract_verbal_features(pos)
-                    # Mettre à jour les caractéristiques verbales
-                    for feature, value in verbal_features.items():
-                        if feature not in morphological_features:
-                            morphological_features[feature] = value
-
-                # Continuer à parcourir tous les POS pour extraire toutes les caractéristiques disponibles
-
-            # Assignation des caractéristiques morphologiques au token
-            if gender:
-                token.set_gender(gender)
-            if number:
-                token.set_number(number)
-
-            # Assignation des autres caractéristiques morphologiques
-            token.set_morphological_features(morphological_features)
-
-            # **Ne pas définir l'entité nommée, les dépendances, etc. pour le moment**
+            group[0].set_stop(group[0].text.lower() in self.stop_words)
+            for token in group[1:]:
+                token.copy_lexical_features(group[0])
 
         return tokens
 
+    def preload(self, lexicon, forms, limit=None):
+        """
+        Warm the analysis cache with the most frequent surface forms.
+
+        Parameters:
+            lexicon (Lexicon): Instance of Lexicon to look up word forms.
+            forms (iterable or str): Forms ordered by decreasing frequency, or the path of a file
+                                     with one form per line (extra ';'-separated columns are ignored).
+            limit (int): Maximum number of forms to preload.
+
+        Returns:
+            int: The number of forms analyzed.
+        """
+        if self.cache is None:
+            return 0
+        if isinstance(forms, str):
+            with open(forms, 'r', encoding='utf-8') as f:
+                lines = (line.split(';')[0].strip() for line in f if line.strip())
+                forms = list(itertools.islice(lines, limit))
+        else:
+            forms = list(itertools.islice(forms, limit))
+        self.analyze([Token(form) for form in forms], lexicon)
+        logging.info(f"Preloaded {len(forms)} forms into the analysis cache: {self.cache.statistiques()}")
+        return len(forms)
+
+    def cached_analysis(self, token):
+        """
+        Build the immutable cache entry holding the analysis of a token's surface form.
+        """
+        return (token.text, token.is_alpha, token.shape_, tuple(token.lemma_candidates),
+                tuple(token.pos_candidates), token.gender, token.number, tuple(token.morph.items()))
+
+    def apply_cached_analysis(self, token, entry):
+        """
+        Assign a cached surface-form analysis to a token.
+        """
+        text, is_alpha, shape, lemma_candidates, pos_candidates, gender, number, morph = entry
+        token.text = text
+        token.set_alpha(is_alpha)
+        token.set_shape(shape)
+        token.lemma_candidates = list(lemma_candidates)
+        token.pos_candidates = list(pos_candidates)
+        token.set_gender(gender)
+        token.set_number(number)
+        token.set_morphological_features(dict(morph))
+
+    def assign_morphological_features(self, token):
+        """
+        Derive gender, number and verbal features of a token from its POS candidates.
+
+        Parameters:
+            token (Token): Token whose POS candidates are already extracted.
+        """
+        pos_results_sorted = sorted(token.pos_candidates, key=lambda x: x[1], reverse=True)
+
+        # Initialiser les caractéristiques morphologiques
+        morphological_features = {}
+        gender = None
+        number = None
+
+        # Parcourir tous les candidats POS pour extraire les caractéristiques morphologiques
+        for pos, score in pos_results_sorted:
+            # Extraction des caractéristiques morphologiques en fonction du POS
+            if pos.startswith(('Det', 'Nom', 'Adj', 'Pro')):
+                gender_number = TAG_TABLE.info(pos).gender_number
+                # Mettre à jour le genre si trouvé et non encore défini
+                if 'Gender' in gender_number and not gender:
+                    gender = gender_number['Gender']
+                    morphological_features['Gender'] = gender
+                # Mettre à jour le nombre si trouvé et non encore défini
+                if 'Number' in gender_number and not number:
+                    number = gender_number['Number']
+                    morphological_features['Number'] = number
+            elif pos.startswith(('Number:', 'Gender:')):
+                gender_number = TAG_TABLE.info(pos).gender_number
+                # Mettre à jour le genre si trouvé et non encore défini
+                if 'Gender' in gender_number and not gender:
+                    gender = gender_number['Gender']
+                    morphological_features['Gender'] = gender
+                # Mettre à jour le nombre si trouvé et non encore défini
+                if 'Number' in gender_number and not number:
+                    number = gender_number['Number']
+                    morphological_features['Number'] = number
+            elif pos.startswith('Ver'):
+                verbal_features = TAG_TABLE.info(pos).verbal_features
+                # Mettre à jour les caractéristiques verbales
+                for feature, value in verbal_features.items():
+                    if feature not in morphological_features:
+                        morphological_features[feature] = value
+
+            # Continuer à parcourir tous les POS pour extraire toutes les caractéristiques disponibles
+
+        # Assignation des caractéristiques morphologiques au token
+        if gender:
+            token.set_gender(gender)
+        if number:
+            token.set_number(number)
+
+        # Assignation des autres caractéristiques morphologiques
+        token.set_morphological_features(morphological_features)
+
+        # **Ne pas définir l'entité nommée, les dépendances, etc. pour le moment**
+
     def extract_gender_number(self, pos_tag: str) -> dict:
         """
         Extract gender and number from the POS tag.
@@ -109,22 +203,8 @@ class MorphologicalAnalyzer:
         Returns:
             dict: Dictionary with 'Gender' and 'Number' if found.
         """
-        features = {}
-        # Séparer le POS tag par ':' et '+'
-        parts = re.split(r'[:+]', pos_tag)
-
-        # Mapping des abréviations
-        gender_map = {'Mas': 'Mas', 'Fem': 'Fem'}
-        number_map = {'Sing': 'Sing', 'Plur': 'Plur', 'SG': 'Sing', 'SGN': 'Sing', 'PL': 'Plur'}
-
-        for part in parts:
-            if part in gender_map:
-                features['Gender'] = gender_map[part]
-            elif part in number_map:
-                features['Number'] = number_map[part]
-
-        logging.debug(f"Extracted features from POS tag '{pos_tag}': {features}")
-        return features
+        # Les tags sont analysés une seule fois dans la table partagée
+        return dict(TAG_TABLE.info(pos_tag).gender_number)
 
     def extract_verbal_features(self, pos_tag: str) -> dict:
         """
@@ -136,29 +216,7 @@ class MorphologicalAnalyzer:
         Returns:
             dict: Dictionary with verbal morphological features.
         """
-        features = {}
-        verbal_time_match = re.search(r'VerbalTime:([^:]+)', pos_tag)
-        verbal_mode_match = re.search(r'VerbalMode:([^:]+)', pos_tag)
-        verbal_pers_match = re.search(r'VerbalPers:([^:]+)', pos_tag)
-        verbal_number_match = re.search(r'VerbalNumber:([^:]+)', pos_tag)
-
-        if verbal_time_match:
-            features['VerbalTime'] = verbal_time_match.group(1)
-        if verbal_mode_match:
-            features['VerbalMode'] = verbal_mode_match.group(1)
-        if verbal_pers_match:
-            features['VerbalPers'] = verbal_pers_match.group(1)
-        if verbal_number_match:
-            # Gestion des abréviations pour le nombre verbal
-            verbal_number = verbal_number_match.group(1)
-            if verbal_number == 'PL':
-                verbal_number = 'Plur'
-            elif verbal_number == 'SG':
-                verbal_number = 'Sing'
-            features['VerbalNumber'] = verbal_number
-
-        logging.debug(f"Extracted verbal features from POS tag '{pos_tag}': {features}")
-        return features
+        return dict(TAG_TABLE.info(pos_tag).verbal_features)
 
     def get_shape(self, text: str) -> str:
         """
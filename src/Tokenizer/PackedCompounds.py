@@ -0,0 +1,143 @@
+# src/PackedCompounds.py
+
+import argparse
+import logging
+import mmap
+import os
+import struct
+import sys
+
+from Tokenizer.IndexBuilder import check_staleness, write_metadata
+from Tokenizer.TrieLexicon import read_compounds
+
+# Format binaire (little-endian) : magic, nombre de mots, puis les offsets uint32
+# (count + 1) et le blob UTF-8 des mots composés en minuscules, triés par octets
+MAGIC = b'MCP1'
+HEADER = struct.Struct('<4sI')
+PACKED_FILE = 'motsComposes.bin'
+
+
+def build_packed_compounds(compounds_file_path, output_path):
+    """
+    Pack the compound words of motsComposés.txt into a sorted string array.
+
+    Returns:
+        int: Number of compound words.
+    """
+    words = sorted({word.encode('utf-8') for word in read_compounds(compounds_file_path)})
+    offsets = [0]
+    for word in words:
+        offsets.append(offsets[-1] + len(word))
+    if offsets[-1] >= 1 << 32:
+        raise ValueError("Compound dictionary too large for 32-bit offsets.")
+    with open(output_path + '.tmp', 'wb') as f:
+        f.write(HEADER.pack(MAGIC, len(words)))
+        f.write(struct.pack(f'<{len(offsets)}I', *offsets))
+        f.writelines(words)
+    os.replace(output_path + '.tmp', output_path)
+    write_metadata(output_path, [compounds_file_path], with_hash=False, entries=len(words))
+    logging.info(f"Packed {len(words)} compound words into {output_path}")
+    return len(words)
+
+
+class PackedCompounds:
+    def __init__(self, path):
+        """
+        Compound word dictionary read from the packed artifact. The file is memory-mapped on
+        the first lookup, and only the pages touched by the binary searches are read.
+        It supports `in` and len() like the set built by Tokenizer.
+        """
+        if sys.byteorder != 'little':
+            raise RuntimeError("The packed compound format is little-endian only.")
+        self.path = path
+        self._file = None
+        self.mm = None
+        self.count = None
+
+    def open(self):
+        self._file = open(self.path, 'rb')
+        self.mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count = HEADER.unpack_from(self.mm, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a packed compound file: {self.path}")
+        self.offsets = memoryview(self.mm)[HEADER.size:HEADER.size + 4 * (self.count + 1)].cast('I')
+        self.blob_start = HEADER.size + 4 * (self.count + 1)
+
+    def word(self, i):
+        """Return the UTF-8 bytes of the i-th compound word."""
+        return self.mm[self.blob_start + self.offsets[i]:self.blob_start + self.offsets[i + 1]]
+
+    def lower_bound(self, key):
+        """Return the index of the first word not lower than key (bytes)."""
+        if self.mm is None:
+            self.open()
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.word(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def __contains__(self, word):
+        key = word.encode('utf-8')
+        i = self.lower_bound(key)
+        return i < self.count and self.word(i) == key
+
+    def keys(self, prefix=''):
+        """Return the compound words starting with prefix."""
+        key = prefix.encode('utf-8')
+        words = []
+        i = self.lower_bound(key)
+        while i < self.count:
+            word = self.word(i)
+            if not word.startswith(key):
+                break
+            words.append(word.decode('utf-8'))
+            i += 1
+        return words
+
+    def __len__(self):
+        if self.mm is None:
+            self.open()
+        return self.count
+
+    def close(self):
+        """Release the memory map."""
+        if self.mm is not None:
+            self.offsets.release()
+            self.mm.close()
+            self._file.close()
+            self.mm = None
+
+
+def packed_compounds_path(compounds_file_path):
+    """Path of the packed artifact next to motsComposés.txt."""
+    return os.path.join(os.path.dirname(compounds_file_path), PACKED_FILE)
+
+
+def is_packed_compounds_fresh(compounds_file_path):
+    """Tell whether the packed artifact exists and matches motsComposés.txt."""
+    path = packed_compounds_path(compounds_file_path)
+    if not os.path.exists(path):
+        return False
+    if not os.path.exists(compounds_file_path):
+        return True  # Artefact déployé sans la source
+    reason = check_staleness(path, [compounds_file_path])
+    if reason:
+        logging.warning(f"{PACKED_FILE} is stale ({reason}), parsing motsComposés.txt instead")
+    return reason is None
+
+
+if __name__ == "__main__":
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    default_file = os.path.abspath(os.path.join(base_dir, '..', '..', 'data', 'motsComposés.txt'))
+
+    parser = argparse.ArgumentParser(description="Pack the compound word dictionary for fast Tokenizer startup.")
+    parser.add_argument('--compounds-file', default=default_file)
+    parser.add_argument('--output', default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    print(build_packed_compounds(args.compounds_file, args.output or packed_compounds_path(args.compounds_file)))
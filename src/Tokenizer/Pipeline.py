@@ -0,0 +1,192 @@
+# src/Pipeline.py
+
+import itertools
+import multiprocessing
+
+from evaluateur_performance import METRIQUES, MesuresPipeline
+from Tokenizer.DependencyExtractor import DependencyExtractor
+from Tokenizer.Doc import Doc
+from Tokenizer.GroupsExtractor import GroupExtractor
+from Tokenizer.MorphologicalAnalyzer import MorphologicalAnalyzer
+from Tokenizer.SharedResources import SharedResources, current_resources
+
+# Pipeline par défaut, chargée au premier usage et partagée par SyntaxicExtraction et MoteurDeRegles
+_DEFAULT_PIPELINE = None
+# Pipeline d'un processus de travail de Pipeline.pipe(n_process=N)
+_WORKER_PIPELINE = None
+
+
+class Pipeline:
+    def __init__(self, data_dir=None, lexicon_mode=None, compound_mode=None, json_file_path='struct_lemma.json',
+                 resources=None, metriques=METRIQUES, pos_decoder='greedy'):
+        """
+        Long-lived NLP pipeline: the lexicon, compound words and lemma rules are loaded once and
+        reused for every text (tokenizer, morphological analysis, disambiguation, dependencies
+        and groups).
+
+        Parameters:
+            data_dir (str): Directory holding the lexicon files.
+            lexicon_mode (str): Lexicon mode (see Lexicon).
+            compound_mode (str): Tokenizer compound mode (see Tokenizer).
+            json_file_path (str): Lemma replacement rules of the Disambiguator.
+            resources (SharedResources): Already loaded resources to use instead.
+            metriques (MesuresPipeline): Per-stage timings and token counts (tokenize, lexicon,
+                                         morph, disambiguate, dependencies, groups).
+            pos_decoder (str): POS decoder of the Disambiguator ('greedy', 'viterbi' or 'beam').
+        """
+        # Paramètres de chargement, pour les processus lancés sans fork
+        self.config = None if resources is not None else {
+            'data_dir': data_dir, 'lexicon_mode': lexicon_mode, 'compound_mode': compound_mode,
+            'json_file_path': json_file_path, 'pos_decoder': pos_decoder}
+        if resources is None:
+            resources = SharedResources(data_dir=data_dir, lexicon_mode=lexicon_mode,
+                                        compound_mode=compound_mode, json_file_path=json_file_path,
+                                        pos_decoder=pos_decoder)
+        self.resources = resources
+        self.tokenizer = resources.tokenizer
+        self.lexicon = resources.lexicon
+        self.disambiguator = resources.disambiguator
+        self.metriques = metriques
+        self.morph_analyzer = MorphologicalAnalyzer(metriques=metriques)
+        self.dependency_extractor = DependencyExtractor()
+        self.group_extractor = GroupExtractor()
+        # Pool de processus de travail de pipe(n_process=N), créé au premier appel et réutilisé
+        self._pool = None
+        self._pool_processes = 0
+
+    def analyze(self, text):
+        """
+        Analyze one text.
+
+        Returns:
+            list: The analyzed tokens.
+        """
+        with self.metriques.mesurer('tokenize') as mesure:
+            tokens = self.tokenizer.tokenize(text)
+            mesure['elements'] = len(tokens)
+        # L'analyse morphologique extrait lemmes, POS et morphologie en une seule passe sur le lexique
+        with self.metriques.mesurer('morph', len(tokens)):
+            tokens = self.morph_analyzer.analyze(tokens, self.lexicon)
+        return self.analyze_syntax(tokens)
+
+    def analyze_syntax(self, tokens):
+        """
+        Run the per-document stages on tokens that went through the morphological analysis.
+        """
+        with self.metriques.mesurer('disambiguate', len(tokens)):
+            tokens = self.disambiguator.disambiguate(tokens, self.morph_analyzer, self.lexicon)
+        with self.metriques.mesurer('dependencies', len(tokens)):
+            tokens = self.dependency_extractor.extract_dependencies(tokens)
+        with self.metriques.mesurer('groups', len(tokens)):
+            return self.group_extractor.extract_groups(tokens)
+
+    def __call__(self, text):
+        return Doc.from_tokens(self.analyze(text))
+
+    def pipe(self, texts, batch_size=64, n_process=1):
+        """
+        Analyze a stream of texts lazily, in order. The texts of a batch share a single
+        morphological analysis, so each distinct form of the batch is looked up once.
+
+        With n_process > 1, the batches are analyzed by a pool of worker processes. Forked
+        workers inherit the loaded resources (see SharedResources.pool); without fork, each
+        worker loads them once in its initializer. The workers send back compact Docs, whose
+        columns are pickled instead of the Token objects. The pool is created on the first call
+        and reused by the following ones with the same n_process, until close().
+
+        Parameters:
+            texts (iterable): Texts to analyze.
+            batch_size (int): Number of texts analyzed together, and sent to a worker at once.
+            n_process (int): Number of worker processes.
+
+        Yields:
+            Doc: One document per text.
+        """
+        texts = iter(texts)
+        batches = iter(lambda: list(itertools.islice(texts, batch_size)), [])
+        if n_process <= 1:
+            for batch in batches:
+                yield from self.analyze_batch(batch)
+            return
+
+        # imap conserve l'ordre des lots
+        for docs, metriques in self.pool(n_process).imap(_analyze_batch, batches):
+            # Les mesures des processus de travail sont reportées dans celles de la pipeline
+            self.metriques.fusionner(metriques)
+            yield from docs
+
+    def pool(self, n_process):
+        """
+        Return the pool of worker processes of pipe(), creating it on first use (or when the
+        number of processes changes).
+        """
+        if self._pool is not None and self._pool_processes != n_process:
+            self.close()
+        if self._pool is None:
+            if 'fork' in multiprocessing.get_all_start_methods():
+                self._pool = self.resources.pool(n_process, _init_worker)
+            elif self.config is not None:
+                self._pool = multiprocessing.get_context('spawn').Pool(n_process, _init_worker, (self.config,))
+            else:
+                raise RuntimeError("A pipeline built from existing resources can only fork its workers.")
+            self._pool_processes = n_process
+        return self._pool
+
+    def close(self):
+        """
+        Stop the worker processes of pipe(), if any.
+        """
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+            self._pool = None
+            self._pool_processes = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def analyze_batch(self, batch):
+        """
+        Analyze a batch of texts with a single morphological analysis.
+
+        Returns:
+            list: One Doc per text.
+        """
+        with self.metriques.mesurer('tokenize') as mesure:
+            documents = [self.tokenizer.tokenize(text) for text in batch]
+            all_tokens = [token for tokens in documents for token in tokens]
+            mesure['elements'] = len(all_tokens)
+        # L'analyse morphologique ne dépend que de la forme : une passe pour tout le lot
+        with self.metriques.mesurer('morph', len(all_tokens)):
+            self.morph_analyzer.analyze(all_tokens, self.lexicon)
+        return [Doc.from_tokens(self.analyze_syntax(tokens)) for tokens in documents]
+
+
+def _init_worker(config=None):
+    """
+    Build the pipeline of a worker: from the inherited resources after a fork, by loading
+    the resources otherwise.
+    """
+    global _WORKER_PIPELINE
+    # Mesures propres au processus, transmises avec chaque lot
+    if config is None:
+        _WORKER_PIPELINE = Pipeline(resources=current_resources(), metriques=MesuresPipeline())
+    else:
+        _WORKER_PIPELINE = Pipeline(metriques=MesuresPipeline(), **config)
+
+
+def _analyze_batch(batch):
+    return _WORKER_PIPELINE.analyze_batch(batch), _WORKER_PIPELINE.metriques.extraire()
+
+
+def default_pipeline():
+    """
+    Return the shared default pipeline, loading it on first use.
+    """
+    global _DEFAULT_PIPELINE
+    if _DEFAULT_PIPELINE is None:
+        _DEFAULT_PIPELINE = Pipeline()
+    return _DEFAULT_PIPELINE
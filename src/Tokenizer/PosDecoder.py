@@ -0,0 +1,183 @@
+# src/PosDecoder.py
+
+import numpy as np
+
+from Tokenizer.TagTable import TAG_TABLE
+
+# Classes de tags utilisées par les règles de contexte du désambiguïseur
+OTHER, DET, PRE, PRO, VER, NOM, ADJ, VERB_OTHER, VER_AS_NOM = range(9)
+N_CLASSES = 9
+CLASS_PREFIXES = (('Det', DET), ('Pre', PRE), ('Pro', PRO), ('Ver', VER), ('Nom', NOM), ('Adj', ADJ))
+
+# Lecture d'un token sans candidat, comme dans disambiguate_pos
+NO_CANDIDATE = [('X', 0)]
+
+# Priorité de départage de Disambiguator.disambiguate_pos (Adj avant Nom...)
+POS_PRIORITY = ['Adj', 'Nom', 'Ver', 'Adv', 'Pro', 'Det', 'Punct', 'Pre']
+
+
+def _transition_tables():
+    """
+    Build the class-to-class transition features from the hand rules of disambiguate_pos:
+    the allowed transitions, the lookahead rules fired by a transition, and its gain in
+    tie-break priority.
+    """
+    allowed = np.ones((N_CLASSES, N_CLASSES), dtype=bool)
+    lookahead = np.zeros((N_CLASSES, N_CLASSES))
+    priority = np.zeros((N_CLASSES, N_CLASSES))
+
+    # Un verbe après un déterminant est lu comme un nom (état VER_AS_NOM, atteint seulement depuis DET)
+    allowed[:, VER_AS_NOM] = False
+    allowed[DET, VER_AS_NOM] = True
+    allowed[DET, VER] = False
+    # Déterminant devant un nom, préposition devant un nom ou un pronom, pronom devant un verbe ou une préposition
+    for following in (NOM, VER_AS_NOM):
+        lookahead[DET, following] = 1
+        lookahead[PRE, following] = 1
+    lookahead[PRE, PRO] = 1
+    for following in (VER, VERB_OTHER, PRE):
+        lookahead[PRO, following] = 1
+    # Priorités de contexte : Adj après Nom (-1 au lieu de 0), Nom après Det (-2 au lieu de 1)
+    for previous in (NOM, VER_AS_NOM):
+        priority[previous, ADJ] = 1
+    priority[DET, NOM] = 3
+    priority[DET, VER_AS_NOM] = 3
+    return allowed, lookahead, priority
+
+
+ALLOWED, LOOKAHEAD, CONTEXT_PRIORITY = _transition_tables()
+
+
+class ViterbiPosDecoder:
+    def __init__(self, beam_size=None):
+        """
+        Sentence-level POS decoder. The candidate tags of every token are scored as NumPy arrays:
+        the lexicon score of the candidate, and as transition features the context rules of
+        Disambiguator.disambiguate_pos (verb after a determiner read as a noun; determiner or
+        preposition before a noun, pronoun before a verb; ADJ after NOUN and NOUN after DET in the
+        priority table). The best tag sequence is found with Viterbi, or with a beam search when
+        beam_size is given. Ties are broken by candidate order, so decoding is deterministic.
+
+        Parameters:
+            beam_size (int): Number of states kept at each token (None for an exact Viterbi search).
+        """
+        if beam_size is not None and beam_size < 1:
+            raise ValueError("The beam size must be at least 1.")
+        self.beam_size = beam_size
+        # États de chaque tag déjà rencontré : ((étiquette, classe, priorité), ...)
+        self.tag_states = {}
+
+    def tag_class(self, tag):
+        for prefix, tag_class in CLASS_PREFIXES:
+            if tag.startswith(prefix):
+                return tag_class
+        return VERB_OTHER if TAG_TABLE.info(tag).upos == 'VERB' else OTHER
+
+    def tag_priority(self, tag):
+        for idx, prefix in enumerate(POS_PRIORITY):
+            if tag.startswith(prefix):
+                return idx
+        return len(POS_PRIORITY)
+
+    def states_of(self, tag):
+        """
+        Return the decoder states of a candidate tag, computing them the first time the tag is seen.
+        """
+        states = self.tag_states.get(tag)
+        if states is None:
+            states = ((tag, self.tag_class(tag), self.tag_priority(tag)),)
+            if tag.startswith('Ver'):
+                # État supplémentaire : le même verbe lu comme un nom après un déterminant
+                states += (('Nom', VER_AS_NOM, self.tag_priority('Nom')),)
+            self.tag_states[tag] = states
+        return states
+
+    def encode(self, candidate_lists):
+        """
+        Encode the candidates of all the tokens as (tokens x states) arrays, padded to the
+        largest number of states. A token without candidates gets a single 'X' state.
+
+        Returns:
+            tuple: (labels, classes, emissions, priorities), padding states having a -inf emission
+                   and the OTHER class.
+        """
+        labels, rows, columns, classes, scores, priorities = [], [], [], [], [], []
+        for i, candidates in enumerate(candidate_lists):
+            token_labels = []
+            for tag, score in candidates or NO_CANDIDATE:
+                for label, tag_class, priority in self.states_of(tag):
+                    rows.append(i)
+                    columns.append(len(token_labels))
+                    token_labels.append(label)
+                    classes.append(tag_class)
+                    scores.append(score)
+                    priorities.append(priority)
+            labels.append(token_labels)
+
+        shape = (len(labels), max(columns) + 1)
+        padded_classes = np.full(shape, OTHER, dtype=np.intp)
+        emissions = np.full(shape, -np.inf)
+        padded_priorities = np.zeros(shape)
+        padded_classes[rows, columns] = classes
+        emissions[rows, columns] = scores
+        padded_priorities[rows, columns] = priorities
+        return labels, padded_classes, emissions, padded_priorities
+
+    def decode(self, candidate_lists):
+        """
+        Find the best tag sequence of a sentence.
+
+        Parameters:
+            candidate_lists (list): POS candidates (list of (tag, score) tuples) of each token.
+
+        Returns:
+            list: The selected tag of each token ('X' for a token without candidates).
+        """
+        if not candidate_lists:
+            return []
+        labels, classes, emissions, priorities = self.encode(candidate_lists)
+
+        # Une règle l'emporte sur tout écart de score d'un token, comme dans disambiguate_pos ;
+        # la priorité ne départage que des séquences de même score (somme toujours < 1)
+        finite = emissions[np.isfinite(emissions)]
+        rule_weight = finite.max() - finite.min() + 1
+        priority_weight = 1.0 / (16 * len(candidate_lists))
+        emissions = emissions - priority_weight * priorities
+
+        # Scores de toutes les transitions de la phrase, calculés en une fois : (token, état précédent, état)
+        previous, current = classes[:-1, :, None], classes[1:, None, :]
+        scores = np.where(ALLOWED[previous, current], priority_weight * CONTEXT_PRIORITY[previous, current], -np.inf)
+        # Les règles d'anticipation départagent les lectures du token précédent selon la lecture
+        # du token courant, sans favoriser aucune lecture de celui-ci : pour chaque lecture, le
+        # meilleur candidat précédent est ramené à 0 (les états de remplissage valent 0).
+        lookahead = LOOKAHEAD[previous, current]
+        scores += rule_weight * (lookahead - lookahead.max(axis=1, keepdims=True))
+        scores += emissions[1:, None, :]
+
+        # Début de phrase : aucun contexte à gauche
+        best = self.prune(emissions[0] + np.where(ALLOWED[OTHER, classes[0]], 0, -np.inf))
+        backpointers = np.zeros((len(candidate_lists) - 1, classes.shape[1]), dtype=np.intp)
+        for i, transition in enumerate(scores):
+            totals = best[:, None] + transition
+            # argmax retient le premier maximum : départage par l'ordre des candidats
+            backpointers[i] = totals.argmax(axis=0)
+            best = self.prune(totals.max(axis=0))
+
+        state = int(best.argmax())
+        path = [state]
+        for pointers in backpointers[::-1].tolist():
+            state = pointers[state]
+            path.append(state)
+        path.reverse()
+        return [token_labels[state] for token_labels, state in zip(labels, path)]
+
+    def prune(self, scores):
+        """
+        Keep the beam_size best states of a token (the first ones on ties).
+        """
+        if self.beam_size is None or len(scores) <= self.beam_size:
+            return scores
+        keep = np.argsort(-scores, kind='stable')[:self.beam_size]
+        pruned = np.full_like(scores, -np.inf)
+        pruned[keep] = scores[keep]
+        return pruned
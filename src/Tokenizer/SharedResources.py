@@ -0,0 +1,136 @@
+# src/SharedResources.py
+
+import gc
+import logging
+import multiprocessing
+import os
+from multiprocessing import resource_tracker, shared_memory
+
+from Tokenizer.CompiledLexicon import CompiledLexicon
+from Tokenizer.Disambiguator import Disambiguator
+from Tokenizer.Lexicon import Lexicon
+from Tokenizer.Tokenizer import Tokenizer
+
+# Ressources héritées par les processus de travail créés par SharedResources.pool
+_SHARED = None
+
+
+class SharedResources:
+    def __init__(self, data_dir=None, lexicon_mode=None, compound_mode=None, json_file_path='struct_lemma.json',
+                 lexicon=None, pos_decoder='greedy'):
+        """
+        Load the read-only lexical resources (lexicon, compound words, lemma rules) once in the
+        parent process, so that forked workers share them instead of loading their own copy.
+
+        Parameters:
+            data_dir (str): Directory holding the lexicon files.
+            lexicon_mode (str): Lexicon mode ('index', 'compiled' or 'trie').
+            compound_mode (str): Tokenizer compound mode ('set', 'packed' or 'trie', see Tokenizer).
+            json_file_path (str): Lemma replacement rules of the Disambiguator.
+            lexicon (Lexicon): An already built lexicon to share instead of loading one.
+            pos_decoder (str): POS decoder of the Disambiguator ('greedy', 'viterbi' or 'beam').
+        """
+        self.lexicon = lexicon if lexicon is not None else Lexicon(data_dir=data_dir, mode=lexicon_mode)
+        self.tokenizer = Tokenizer(data_dir=data_dir, compound_mode=compound_mode)
+        self.disambiguator = Disambiguator(json_file_path, pos_decoder=pos_decoder)
+
+    def freeze(self):
+        """
+        Move every object allocated so far to the permanent GC generation. The collector then
+        never touches them, so the workers do not dirty (and copy) the shared pages. The parent
+        must call gc.unfreeze() once the workers are forked (see pool).
+        """
+        gc.collect()
+        gc.freeze()
+        logging.info(f"Froze {gc.get_freeze_count()} objects before forking workers")
+
+    def pool(self, processes, initializer=None, initargs=()):
+        """
+        Freeze the resources and fork a pool of workers that inherit them. The parent unfreezes
+        as soon as the workers are forked: only the workers keep the frozen heap, the parent's
+        objects stay collectable.
+
+        Parameters:
+            processes (int): Number of worker processes.
+            initializer (callable): Optional per-worker initializer.
+
+        Returns:
+            multiprocessing.pool.Pool: The pool; workers reach the resources with current_resources().
+        """
+        global _SHARED
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            raise RuntimeError("Sharing loaded resources requires the 'fork' start method.")
+        _SHARED = self
+        self.freeze()
+        try:
+            return multiprocessing.get_context('fork').Pool(processes, initializer, initargs)
+        finally:
+            # Les processus de travail sont créés par le constructeur du pool
+            gc.unfreeze()
+
+
+def current_resources():
+    """
+    Return the resources inherited from the parent process (inside a worker of SharedResources.pool).
+    """
+    return _SHARED
+
+
+class SharedLexiconBlock:
+    def __init__(self, shm, owner):
+        self.shm = shm
+        self.owner = owner
+        self.compiled = None
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    @classmethod
+    def publish(cls, compiled_path, name=None):
+        """
+        Copy a compiled lexicon (see CompiledLexicon) into a named shared memory block.
+
+        Parameters:
+            compiled_path (str): Path to lexicon.bin.
+            name (str): Name of the block, generated when None.
+
+        Returns:
+            SharedLexiconBlock: The block; pass its name to the workers.
+        """
+        size = os.path.getsize(compiled_path)
+        shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        with open(compiled_path, 'rb') as f:
+            f.readinto(shm.buf[:size])
+        logging.info(f"Published {compiled_path} ({size} bytes) in shared memory block '{shm.name}'")
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name):
+        """
+        Attach to a block published by another process.
+        """
+        shm = shared_memory.SharedMemory(name=name)
+        # Avant Python 3.13, le resource_tracker supprime aussi les blocs simplement ouverts
+        # à la sortie du processus : seul le processus qui publie doit en être responsable.
+        resource_tracker.unregister(shm._name, 'shared_memory')
+        return cls(shm, owner=False)
+
+    def lexicon(self, data_dir=None):
+        """
+        Build a Lexicon reading directly from the shared block, without any copy.
+        """
+        if self.compiled is None:
+            self.compiled = CompiledLexicon(buffer=self.shm.buf)
+        return Lexicon(data_dir=data_dir, store=self.compiled)
+
+    def close(self):
+        """
+        Detach from the block, and destroy it if this process published it.
+        """
+        if self.compiled is not None:
+            self.compiled.close()
+            self.compiled = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
@@ -0,0 +1,111 @@
+# src/TagTable.py
+
+import re
+from collections import namedtuple
+
+# Correspondance entre les préfixes des tags du lexique et les POS universels (spaCy),
+# testés dans l'ordre
+POS_MAPPING = {
+    "Adj": "ADJ",
+    "Pre": "ADP",
+    "Adv": "ADV",
+    "Ver": "VERB",
+    "Conj:Coord": "CCONJ",
+    "Conj": "SCONJ",
+    "Con": "SCONJ",
+    "con": "SCONJ",
+    "Det": "DET",
+    "Int": "INTJ",
+    "Nom": "NOUN",
+    "Part": "PART",
+    "Pro": "PRON",
+    "Punct": "PUNCT",
+    "Symbole": "SYM",
+    "Unit": "VERB"
+}
+
+GENDER_MAP = {'Mas': 'Mas', 'Fem': 'Fem'}
+NUMBER_MAP = {'Sing': 'Sing', 'Plur': 'Plur', 'SG': 'Sing', 'SGN': 'Sing', 'PL': 'Plur'}
+VERBAL_NUMBER_MAP = {'PL': 'Plur', 'SG': 'Sing'}
+VERBAL_FEATURES = ('VerbalTime', 'VerbalMode', 'VerbalPers', 'VerbalNumber')
+VERBAL_PATTERNS = {feature: re.compile(feature + r':([^:]+)') for feature in VERBAL_FEATURES}
+
+TagInfo = namedtuple('TagInfo', ['tag_id', 'tag', 'upos', 'gender_number', 'verbal_features'])
+
+
+class TagTable:
+    def __init__(self, tags=()):
+        """
+        Interned table of POS tags: each distinct tag string gets an integer id and its
+        features (UPOS, gender/number and verbal features) are parsed once.
+
+        Parameters:
+            tags (iterable): Tags to compile up front, e.g. the tag inventory of the lexicon.
+        """
+        self.ids = {}
+        self.infos = []
+        self.compile(tags)
+
+    def compile(self, tags):
+        """
+        Intern and parse several tags at once.
+        """
+        for tag in tags:
+            self.intern(tag)
+
+    def intern(self, tag):
+        """
+        Return the id of a tag, parsing and registering it the first time it is seen.
+        """
+        tag_id = self.ids.get(tag)
+        if tag_id is None:
+            tag_id = len(self.infos)
+            self.infos.append(self.parse(tag_id, tag))
+            self.ids[tag] = tag_id
+        return tag_id
+
+    def info(self, tag):
+        """
+        Return the TagInfo of a tag.
+        """
+        tag_id = self.ids.get(tag)
+        if tag_id is None:
+            tag_id = self.intern(tag)
+        return self.infos[tag_id]
+
+    def parse(self, tag_id, tag):
+        """
+        Parse a tag string into its TagInfo.
+        """
+        upos = "X"  # Par défaut si aucun préfixe ne correspond
+        for key, value in POS_MAPPING.items():
+            if tag.startswith(key):
+                upos = value
+                break
+
+        # Séparer le tag par ':' et '+'
+        gender_number = {}
+        for part in re.split(r'[:+]', tag):
+            if part in GENDER_MAP:
+                gender_number['Gender'] = GENDER_MAP[part]
+            elif part in NUMBER_MAP:
+                gender_number['Number'] = NUMBER_MAP[part]
+
+        verbal_features = {}
+        for feature, pattern in VERBAL_PATTERNS.items():
+            match = pattern.search(tag)
+            if match:
+                value = match.group(1)
+                if feature == 'VerbalNumber':
+                    # Gestion des abréviations pour le nombre verbal
+                    value = VERBAL_NUMBER_MAP.get(value, value)
+                verbal_features[feature] = value
+
+        return TagInfo(tag_id, tag, upos, gender_number, verbal_features)
+
+    def __len__(self):
+        return len(self.infos)
+
+
+# Table partagée par le lexique, l'analyseur morphologique et le désambiguïseur
+TAG_TABLE = TagTable()
@@ -1,8 +1,16 @@
 # src/Token.py
 
 class Token:
-    def __init__(self, text):
-        self.text = text #texte de base
+    # Pas de __dict__ par instance : les attributs sont fixés (voir Doc pour le stockage en colonnes)
+    __slots__ = ('_text', 'start', 'end', 'source', 'lemma_candidates', 'pos_candidates', 'pos_', 'lemma_',
+                 'gender', 'number', 'shape_', 'is_alpha', 'is_stop', 'morph', 'dep_', 'head', 'token_id',
+                 'token_pid', 'token_primarykey', 'groupe')
+
+    def __init__(self, text=None, start=None, end=None, source=None):
+        self._text = text #texte de base, extrait de source à la première lecture
+        self.start = start #offset du premier caractère dans le texte normalisé
+        self.end = end #offset de fin (exclu)
+        self.source = source #texte normalisé partagé par tous les tokens
         self.lemma_candidates = [] #candidats de lemmes
         self.pos_candidates = [] #candidats de pos 
         self.pos_ = None # pos gagnant (peut etre X)
@@ -20,6 +28,24 @@ class Token:
         self.token_primarykey=None#clé primaire unique de chaque token
         self.groupe=None
 
+    @property
+    def text(self):
+        if self._text is None and self.source is not None:
+            self._text = self.source[self.start:self.end]
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        # L'analyse morphologique peut réécrire le texte sans toucher aux offsets
+        self._text = value
+
+    @property
+    def span_text(self):
+        # Texte exact de l'intervalle (start, end), même si l'analyse a réécrit token.text
+        if self.source is not None:
+            return self.source[self.start:self.end]
+        return self.text
+
     # Méthodes pour définir les attributs
     def set_alpha(self, is_alpha):
         self.is_alpha = is_alpha
@@ -47,6 +73,18 @@ class Token:
     def set_pid(self, pid):
         self.token_pid = pid
 
+    def copy_lexical_features(self, other):
+        # Recopier les résultats des étapes lexicales et morphologiques d'un token de même forme
+        self.text = other.text
+        self.is_alpha = other.is_alpha
+        self.shape_ = other.shape_
+        self.is_stop = other.is_stop
+        self.lemma_candidates = list(other.lemma_candidates)
+        self.pos_candidates = list(other.pos_candidates)
+        self.gender = other.gender
+        self.number = other.number
+        self.morph = dict(other.morph)
+
     def __repr__(self):
         # Afficher uniquement le texte de la tête pour éviter la récursion
         head_text = self.head.text if isinstance(self.head, Token) else self.head
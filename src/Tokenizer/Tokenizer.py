@@ -1,20 +1,84 @@
 # src/Tokenizer.py
 
-import re
+from Tokenizer.CompoundMatcher import WORD_PATTERN, CompoundMatcher, load_compound_matcher
+from Tokenizer.LexiconClient import DEFAULT_SOCKET_PATH, LexiconClient, RemoteCompounds
+from Tokenizer.PackedCompounds import PackedCompounds, is_packed_compounds_fresh, packed_compounds_path
 from Tokenizer.Token_ import Token
+from Tokenizer.TrieLexicon import TRIE_FILES, load_compound_trie
 import os
 import logging
 
+
+def compounds_with_prefix(compounds, prefix):
+    """
+    Return the words of a compound word container starting with prefix: the trie, packed and
+    daemon containers answer with keys(), a plain set is scanned.
+
+    Returns:
+        list: The compound words, sorted for a set.
+    """
+    if hasattr(compounds, 'keys'):
+        return compounds.keys(prefix)
+    return sorted(word for word in compounds if word.startswith(prefix))
+
+
 class Tokenizer:
-    def __init__(self):
+    def __init__(self, data_dir=None, compound_mode=None, socket_path=None, merge_multiword=False,
+                 sentence_splitter=None):
+        """
+        Parameters:
+            data_dir (str): Directory holding motsComposés.txt.
+            compound_mode (str): 'set' to parse motsComposés.txt into a Python set, 'packed' to
+                                 memory-map lazily the sorted string array built by PackedCompounds.py,
+                                 'trie' to memory-map the marisa-trie built by TrieLexicon.py, which is
+                                 shared between processes and supports prefix queries, 'daemon' to
+                                 query the dictionary held by a running LexiconServer. When None,
+                                 the packed array is used if it is up to date, the set otherwise.
+            socket_path (str): Socket of the lexicon daemon in 'daemon' mode.
+            merge_multiword (bool): Merge the space-separated expressions of motsComposés.txt
+                                    ("pomme de terre") into single tokens (see CompoundMatcher).
+            sentence_splitter (TextSplitter): Splitter giving the sentence ends (token_pid), so that
+                                              "M. Dupont" or "etc. et" do not end a sentence. By
+                                              default every '.', '!' or '?' ends a sentence.
+        """
         # Définir les chemins
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        data_dir = os.path.join(base_dir, '..', 'data')
+        if data_dir is None:
+            base_dir = os.path.dirname(os.path.abspath(__file__))
+            data_dir = os.path.join(base_dir, '..', 'data')
         mots_composes_path = os.path.join(data_dir, 'motsComposés.txt')
         
-        # Charger les mots composés dans un ensemble
-        self.mots_composes = self.load_mots_composes(mots_composes_path)
-        logging.info(f"Loaded {len(self.mots_composes)} compound words.")
+        if compound_mode is None:
+            compound_mode = 'packed' if is_packed_compounds_fresh(mots_composes_path) else 'set'
+        if compound_mode == 'packed':
+            # Projeté en mémoire au premier mot composé recherché : aucun fichier à analyser
+            self.mots_composes = PackedCompounds(packed_compounds_path(mots_composes_path))
+        elif compound_mode == 'trie':
+            self.mots_composes = load_compound_trie(os.path.join(data_dir, TRIE_FILES['compounds']))
+        elif compound_mode == 'daemon':
+            self.mots_composes = RemoteCompounds(LexiconClient(socket_path or DEFAULT_SOCKET_PATH))
+        elif compound_mode == 'set':
+            # Charger les mots composés dans un ensemble
+            self.mots_composes = self.load_mots_composes(mots_composes_path)
+        else:
+            raise ValueError(f"Unknown compound mode: {compound_mode}")
+        self.compound_mode = compound_mode
+        if compound_mode != 'packed':
+            logging.info(f"Loaded {len(self.mots_composes)} compound words.")
+
+        self.sentence_splitter = sentence_splitter
+        self.compound_matcher = None
+        if merge_multiword:
+            try:
+                self.compound_matcher = load_compound_matcher(mots_composes_path)
+            except Exception as e:
+                logging.error(f"Erreur lors du chargement des expressions de motsComposés.txt: {e}")
+                self.compound_matcher = CompoundMatcher()
+
+    def compounds_with_prefix(self, prefix):
+        """
+        Return the compound words starting with prefix.
+        """
+        return compounds_with_prefix(self.mots_composes, prefix.lower())
 
     def load_mots_composes(self, filepath):
         """
@@ -47,58 +111,175 @@ class Tokenizer:
         """
         Tokenize the input text into a list of Token objects, assigning a unique token ID
         to each token and resetting the ID after each sentence-ending punctuation.
+
+        Tokens are (start, end) spans of the normalized text, which has the same length as
+        the input text; their text is only extracted when it is read.
+        """
+        tokens, _, _ = self.tokenize_chunk(text)
+        if self.compound_matcher is not None:
+            # Fusionner les expressions de plusieurs mots en une seule passe
+            tokens = self.compound_matcher.merge(tokens)
+        return tokens
+
+    def tokenize_chunk(self, text, token_id=0, token_pid=0):
+        """
+        Tokenize a piece of text, numbering the tokens from the given counters.
+
+        Parameters:
+            text (str): Text to tokenize; its tokens are spans of its normalized copy.
+            token_id (int): Id of the first token.
+            token_pid (int): Id of the current sentence.
+
+        Returns:
+            tuple: (tokens, token_id, token_pid), with the counters after the last token.
         """
+        if self.sentence_splitter is not None:
+            # Découpage sur le texte d'origine (même longueur) : « et » y restent distincts
+            sentence_ends = self.sentence_splitter.fins_de_phrase(text)
+            sentence_end = next(sentence_ends, None)
+
         # Normalize the text
         text = self.normalize_text(text)
-
         tokens = []
-        # Regular expression to match words, punctuation, and sentence-ending punctuation
-        pattern = re.compile(r"\b\w+(?:-\w+)*\b|[.!?;\"()\[\]{}\-]", re.UNICODE)
-        raw_tokens = pattern.findall(text)
 
-        token_id = 0  # Initialize token ID
-        token_pid = 0
-        
-        
-        for raw_token in raw_tokens:
-            if raw_token in ".!?":  # Punctuation marks that indicate the end of a sentence
-                token = Token(raw_token)  # Create the token object for the punctuation
-                token.token_id = token_id  # Assign the token ID to punctuation
-                token.token_pid=token_pid
-                token.token_primarykey=(token_pid,token_id)
-                tokens.append(token)
-                token_id += 1  # Increment ID for the punctuation (optional)
-                token_id = 0  # Reset token ID for the next token after punctuation
+        def add_token(start, end):
+            token = Token(start=start, end=end, source=text)
+            token.token_id = token_id
+            token.token_pid = token_pid
+            token.token_primarykey = (token_pid, token_id)
+            tokens.append(token)
 
-                token_pid+=1
-            else:
-                if '-' in raw_token:
-                    # Check if the full word is in compound words
-                    if raw_token.lower() in self.mots_composes:
-                        token = Token(raw_token)  # Create the token object
-                        token.token_id = token_id  # Assign the token ID
-                        token.token_pid=token_pid
-                        token.token_primarykey=(token_pid,token_id)
-                        tokens.append(token)
-                        token_id += 1
-                    else:
-                        # Split the word by dashes and tokenize each part
-                        split_tokens = re.split(r'(-)', raw_token)
-                        for part in split_tokens:
-                            if part == '-':
-                                continue  # Skip dashes
-                            token = Token(part)  # Create the token object
-                            token.token_id = token_id  # Assign the token ID
-                            token.token_pid=token_pid
-                            token.token_primarykey=(token_pid,token_id)
-                            tokens.append(token)
-                            token_id += 1
-                else:
-                    token = Token(raw_token)  # Create the token object
-                    token.token_id = token_id  # Assign the token ID
-                    token.token_pid=token_pid
-                    token.token_primarykey=(token_pid,token_id)
-                    tokens.append(token)
+        for match in WORD_PATTERN.finditer(text):
+            start, end = match.span()
+            if self.sentence_splitter is not None:
+                # Le premier token après une fin de phrase ouvre la phrase suivante
+                if sentence_end is not None and start >= sentence_end:
+                    while sentence_end is not None and start >= sentence_end:
+                        sentence_end = next(sentence_ends, None)
+                    if token_id:
+                        token_id = 0
+                        token_pid += 1
+            elif end - start == 1 and text[start] in ".!?":  # Punctuation marks that indicate the end of a sentence
+                add_token(start, end)
+                token_id = 0  # Reset token ID for the next token after punctuation
+                token_pid += 1
+                continue
+            if text.find('-', start, end) != -1 and match.group().lower() not in self.mots_composes:
+                # Split the word by dashes, on offsets, and tokenize each part
+                part_start = start
+                dash = text.find('-', start, end)
+                while dash != -1:
+                    add_token(part_start, dash)
                     token_id += 1
+                    part_start = dash + 1
+                    dash = text.find('-', part_start, end)
+                add_token(part_start, end)
+                token_id += 1
+            else:
+                add_token(start, end)
+                token_id += 1
 
-        return tokens
+        if self.sentence_splitter is not None and sentence_end is not None and token_id:
+            # La dernière phrase du morceau est close
+            token_id = 0
+            token_pid += 1
+        return tokens, token_id, token_pid
+
+    def iter_sentences(self, source, block_size=1 << 16, max_sentence_tokens=10000):
+        """
+        Tokenize a text stream sentence by sentence, with the token_id/token_pid numbering
+        of tokenize over the whole stream. Only the current sentence and one block of text
+        are held in memory. With a sentence splitter, the text after the last sentence end
+        of a block is carried into the next one, whose first characters may decide that end.
+
+        Each token is a span of the normalized piece of text it was read from (token.source),
+        so its offsets are relative to that piece.
+
+        Parameters:
+            source (str | file | iterable): Path of a UTF-8 text file, text file object read
+                                            by blocks, or iterable of lines (each item ends a line).
+            block_size (int): Number of characters read at once from a file.
+            max_sentence_tokens (int): A sentence longer than this (e.g. a dump without
+                                       punctuation) is yielded in several parts sharing its
+                                       token_pid; multi-word expressions are not merged in them.
+
+        Yields:
+            list: The tokens of one sentence.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, 'r', encoding='utf-8') as f:
+                yield from self.iter_sentences(f, block_size, max_sentence_tokens)
+            return
+
+        if hasattr(source, 'read'):
+            chunks = self.read_blocks(source, block_size)
+        else:
+            # Chaque élément termine une ligne
+            chunks = (line if line.endswith('\n') else line + '\n' for line in source)
+        if self.sentence_splitter is not None:
+            chunks = self.sentence_pieces(chunks, 16 * block_size)
+
+        sentence = []
+        token_id, token_pid = 0, 0
+        for chunk in chunks:
+            tokens, token_id, token_pid = self.tokenize_chunk(chunk, token_id, token_pid)
+            for i, token in enumerate(tokens):
+                sentence.append(token)
+                # Le dernier token d'une phrase est suivi d'un changement de token_pid
+                next_pid = tokens[i + 1].token_pid if i + 1 < len(tokens) else token_pid
+                if next_pid != token.token_pid:
+                    if self.compound_matcher is not None and sentence[0].token_id == 0:
+                        sentence = self.compound_matcher.merge(sentence)
+                    yield sentence
+                    sentence = []
+                elif len(sentence) >= max_sentence_tokens:
+                    yield sentence
+                    sentence = []
+        if sentence:
+            if self.compound_matcher is not None and sentence[0].token_id == 0:
+                sentence = self.compound_matcher.merge(sentence)
+            yield sentence
+
+    def sentence_pieces(self, chunks, max_carry):
+        """
+        Regroup chunks of text into pieces cut after a sentence end that the sentence splitter
+        could decide, so that iter_sentences splits sentences like tokenize. The text after the
+        last decided end is carried into the next piece, up to max_carry characters.
+        """
+        carry = ''
+        for chunk in chunks:
+            text = carry + chunk
+            cut = 0
+            for cut in self.sentence_splitter.fins_de_phrase(text, fin_de_texte=False):
+                pass
+            if cut == 0:
+                if len(text) < max_carry:
+                    carry = text  # Aucune fin tranchée : lire la suite
+                    continue
+                cut = len(text)  # Phrase sans fin : couper quand même pour borner la mémoire
+            carry = text[cut:]
+            yield text[:cut]
+        if carry:
+            yield carry
+
+    @staticmethod
+    def read_blocks(f, block_size):
+        """
+        Read a text file by blocks cut after the last whitespace, so that no token is split.
+        """
+        carry = ''
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            block = carry + block
+            cut = max(block.rfind(' '), block.rfind('\n'), block.rfind('\t')) + 1
+            if cut == 0:
+                if len(block) < 16 * block_size:
+                    carry = block  # Mot plus long que le bloc : lire la suite
+                    continue
+                cut = len(block)  # Aucun blanc : couper quand même pour borner la mémoire
+            carry = block[cut:]
+            yield block[:cut]
+        if carry:
+            yield carry
@@ -0,0 +1,88 @@
+# src/Trace.py
+
+import logging
+import os
+
+# Composants à tracer au démarrage, ex. EXTRACTEUR_TRACE="lexicon,disambiguator:0.01"
+TRACE_ENV = 'EXTRACTEUR_TRACE'
+
+
+class Tracer:
+    def __init__(self, component):
+        """
+        Per-token trace of one component of the pipeline (lexicon, disambiguator...). Disabled,
+        a trace point costs one attribute test at the call site:
+
+            if TRACE.enabled:
+                TRACE("POS candidates for '%s': %s", word, candidates)
+
+        Enabled, the messages go to the logger 'extracteur.<component>' at DEBUG level and are
+        only formatted when a handler emits them.
+        """
+        self.component = component
+        self.logger = logging.getLogger(f"extracteur.{component}")
+        self.enabled = False
+        self.every = 1
+        self._countdown = 1
+
+    def enable(self, sample_rate=1.0):
+        """
+        Enable the trace, keeping one message out of round(1 / sample_rate) (deterministic sampling).
+        """
+        if not 0 < sample_rate <= 1:
+            raise ValueError("The sample rate must be in (0, 1].")
+        self.every = max(1, round(1 / sample_rate))
+        self._countdown = 1
+        self.logger.setLevel(logging.DEBUG)
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def __call__(self, message, *args):
+        self._countdown -= 1
+        if self._countdown:
+            return
+        self._countdown = self.every
+        self.logger.debug(message, *args)
+
+
+_TRACERS = {}
+
+
+def get_tracer(component):
+    """
+    Return the tracer of a component, shared by all the modules that use it.
+    """
+    tracer = _TRACERS.get(component)
+    if tracer is None:
+        tracer = _TRACERS[component] = Tracer(component)
+    return tracer
+
+
+def configure_tracing(spec):
+    """
+    Enable the tracers listed in a specification like "lexicon,disambiguator:0.01"
+    (component, optionally followed by its sample rate). "all" enables every tracer created so far.
+    """
+    for item in spec.split(','):
+        component, _, rate = item.strip().partition(':')
+        if not component:
+            continue
+        sample_rate = float(rate) if rate else 1.0
+        tracers = list(_TRACERS.values()) if component == 'all' else [get_tracer(component)]
+        for tracer in tracers:
+            tracer.enable(sample_rate)
+
+
+def disable_tracing():
+    for tracer in _TRACERS.values():
+        tracer.disable()
+
+
+# Composants tracés par le pipeline
+LEXICON_TRACE = get_tracer('lexicon')
+DISAMBIGUATOR_TRACE = get_tracer('disambiguator')
+
+if os.environ.get(TRACE_ENV):
+    configure_tracing(os.environ[TRACE_ENV])
@@ -0,0 +1,173 @@
+# src/TrieLexicon.py
+
+import argparse
+import logging
+import os
+
+from Tokenizer.CompiledLexicon import collect_candidates, read_lemma_entries, read_pos_entries
+
+try:
+    import marisa_trie
+except ImportError:  # Dépendance optionnelle, seulement nécessaire pour le mode 'trie'
+    marisa_trie = None
+
+# Chaque enregistrement : (rang du candidat, id de la chaîne, score)
+RECORD_FORMAT = '<IIi'
+
+TRIE_FILES = {
+    'lemmas': 'lexicon_lemmas.marisa',
+    'pos': 'lexicon_pos.marisa',
+    'strings': 'lexicon_strings.marisa',
+    'tags': 'lexicon_tags.marisa',
+    'compounds': 'motsComposes.marisa',
+}
+
+
+def require_marisa_trie():
+    if marisa_trie is None:
+        raise ImportError("The trie storage mode requires the 'marisa-trie' package (pip install marisa-trie).")
+
+
+def read_compounds(compounds_file_path):
+    """
+    Stream the compound words of motsComposés.txt, lowercased, like Tokenizer.load_mots_composes.
+    """
+    with open(compounds_file_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            parts = line.strip().split(';')
+            if len(parts) >= 2:
+                yield parts[1].strip('"').lower()
+
+
+def build_lexicon_tries(lemma_file_path, pos_file_path, output_dir):
+    """
+    Build the marisa-trie files of the lexicon: one RecordTrie per kind of candidate,
+    plus string tries for the lemmas and the tags.
+
+    Returns:
+        dict: Number of forms of each trie.
+    """
+    require_marisa_trie()
+    lemmas = collect_candidates(read_lemma_entries(lemma_file_path))
+    pos = collect_candidates(read_pos_entries(pos_file_path))
+
+    strings = marisa_trie.Trie(lemma for candidates in lemmas.values() for lemma, _ in candidates)
+    tags = marisa_trie.Trie(tag for candidates in pos.values() for tag, _ in candidates)
+    lemma_trie = marisa_trie.RecordTrie(RECORD_FORMAT, (
+        (form, (rank, strings[lemma], score))
+        for form, candidates in lemmas.items() for rank, (lemma, score) in enumerate(candidates)
+    ))
+    pos_trie = marisa_trie.RecordTrie(RECORD_FORMAT, (
+        (form, (rank, tags[tag], score))
+        for form, candidates in pos.items() for rank, (tag, score) in enumerate(candidates)
+    ))
+
+    strings.save(os.path.join(output_dir, TRIE_FILES['strings']))
+    tags.save(os.path.join(output_dir, TRIE_FILES['tags']))
+    lemma_trie.save(os.path.join(output_dir, TRIE_FILES['lemmas']))
+    pos_trie.save(os.path.join(output_dir, TRIE_FILES['pos']))
+    counts = {'lemma_forms': len(lemmas), 'pos_forms': len(pos), 'strings': len(strings), 'tags': len(tags)}
+    logging.info(f"Lexicon tries written to {output_dir}: {counts}")
+    return counts
+
+
+def build_compound_trie(compounds_file_path, output_path):
+    """
+    Build the marisa-trie of the compound words.
+
+    Returns:
+        int: Number of compound words.
+    """
+    require_marisa_trie()
+    trie = marisa_trie.Trie(read_compounds(compounds_file_path))
+    trie.save(output_path)
+    logging.info(f"Compound trie written to {output_path} ({len(trie)} entries)")
+    return len(trie)
+
+
+def load_compound_trie(path):
+    """
+    Memory-map the compound word trie. It supports `in` like the set built by Tokenizer,
+    plus prefix queries (`keys(prefix)`, `prefixes(text)`).
+    """
+    require_marisa_trie()
+    return marisa_trie.Trie().mmap(path)
+
+
+class TrieLexicon:
+    def __init__(self, data_dir):
+        """
+        Open the marisa-trie lexicon files. The tries are memory-mapped, so their pages are
+        shared between the processes using the same files.
+
+        Parameters:
+            data_dir (str): Directory holding the *.marisa files built by build_lexicon_tries.
+        """
+        require_marisa_trie()
+        self.strings = marisa_trie.Trie().mmap(os.path.join(data_dir, TRIE_FILES['strings']))
+        tag_trie = marisa_trie.Trie().mmap(os.path.join(data_dir, TRIE_FILES['tags']))
+        self.lemma_trie = marisa_trie.RecordTrie(RECORD_FORMAT).mmap(os.path.join(data_dir, TRIE_FILES['lemmas']))
+        self.pos_trie = marisa_trie.RecordTrie(RECORD_FORMAT).mmap(os.path.join(data_dir, TRIE_FILES['pos']))
+        # Le jeu de tags est petit et fermé : on le décode une fois pour toutes
+        self.tags = [tag_trie.restore_key(i) for i in range(len(tag_trie))]
+
+    def lemmas_of(self, word):
+        """Return the (lemma, score) candidates of a form, sorted by decreasing score."""
+        records = sorted(self.lemma_trie.get(word, ()))
+        return [(self.strings.restore_key(string_id), score) for _, string_id, score in records]
+
+    def pos_of(self, word):
+        """Return the (tag, score) candidates of a form, sorted by decreasing score."""
+        records = sorted(self.pos_trie.get(word, ()))
+        return [(self.tags[tag_id], score) for _, tag_id, score in records]
+
+    def search_lemmas(self, target_words):
+        """
+        Look up the lemma candidates of several words.
+
+        Returns:
+            dict: A dictionary mapping each word to a list of (lemma, score) tuples.
+        """
+        return {word: self.lemmas_of(word) for word in target_words}
+
+    def search_pos(self, target_words):
+        """
+        Look up the POS candidates of several words.
+
+        Returns:
+            dict: A dictionary mapping each word to a list of (tag, score) tuples.
+        """
+        return {word: self.pos_of(word) for word in target_words}
+
+    def search(self, target_words):
+        """
+        Look up both the lemma and the POS candidates of several words.
+
+        Returns:
+            tuple: (lemma results, POS results), two dictionaries keyed by word.
+        """
+        return self.search_lemmas(target_words), self.search_pos(target_words)
+
+    def forms_with_prefix(self, prefix):
+        """Return the distinct forms of the lexicon starting with prefix."""
+        return sorted(set(self.lemma_trie.keys(prefix)) | set(self.pos_trie.keys(prefix)))
+
+    def close(self):
+        """Nothing to release explicitly: the mappings are freed with the tries."""
+
+
+if __name__ == "__main__":
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    data_dir = os.path.abspath(os.path.join(base_dir, '..', '..', 'data'))
+
+    parser = argparse.ArgumentParser(description="Build the marisa-trie lexicon and compound word files.")
+    parser.add_argument('--lemma-file', default=os.path.join(data_dir, 'lemma_clean_utf8.txt'))
+    parser.add_argument('--pos-file', default=os.path.join(data_dir, 'pos_utf8.txt'))
+    parser.add_argument('--compounds-file', default=os.path.join(data_dir, 'motsComposés.txt'))
+    parser.add_argument('--output-dir', default=data_dir)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    print(build_lexicon_tries(args.lemma_file, args.pos_file, args.output_dir))
+    if os.path.exists(args.compounds_file):
+        print(build_compound_trie(args.compounds_file, os.path.join(args.output_dir, TRIE_FILES['compounds'])))
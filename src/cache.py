@@ -1,3 +1,7 @@
+import threading
+from collections import OrderedDict
+
+
 class Cache:
     def __init__(self):
         self.relations_cachees = {}
@@ -7,3 +11,65 @@ class Cache:
 
     def ajouter_relation(self, cle, relation):
         self.relations_cachees[cle] = relation
+
+
+class CacheLRU:
+    def __init__(self, capacite=100000):
+        """
+        Cache borné : au-delà de `capacite` entrées, l'entrée la moins récemment
+        utilisée est évincée. Les compteurs de succès, d'échecs et d'évictions
+        permettent de suivre son efficacité.
+        """
+        if capacite <= 0:
+            raise ValueError("La capacité du cache doit être strictement positive.")
+        self.capacite = capacite
+        self.entrees = OrderedDict()
+        self.succes = 0
+        self.echecs = 0
+        self.evictions = 0
+        self._verrou = threading.Lock()
+
+    def obtenir(self, cle, defaut=None):
+        with self._verrou:
+            try:
+                valeur = self.entrees[cle]
+            except KeyError:
+                self.echecs += 1
+                return defaut
+            self.entrees.move_to_end(cle)
+            self.succes += 1
+            return valeur
+
+    def ajouter(self, cle, valeur):
+        with self._verrou:
+            self.entrees[cle] = valeur
+            self.entrees.move_to_end(cle)
+            while len(self.entrees) > self.capacite:
+                self.entrees.popitem(last=False)
+                self.evictions += 1
+
+    def invalider(self, cle):
+        with self._verrou:
+            self.entrees.pop(cle, None)
+
+    def vider(self):
+        with self._verrou:
+            self.entrees.clear()
+
+    def statistiques(self):
+        with self._verrou:
+            total = self.succes + self.echecs
+            return {
+                'taille': len(self.entrees),
+                'capacite': self.capacite,
+                'succes': self.succes,
+                'echecs': self.echecs,
+                'evictions': self.evictions,
+                'taux_succes': self.succes / total if total else 0.0,
+            }
+
+    def __contains__(self, cle):
+        return cle in self.entrees
+
+    def __len__(self):
+        return len(self.entrees)
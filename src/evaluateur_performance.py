@@ -1,7 +1,124 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+
+class MesuresPipeline:
+    def __init__(self):
+        """
+        Compteurs par étape de l'analyse (tokenize, morph, desambiguisation, règles, CSV...) :
+        nombre d'appels, temps total et maximal, nombre d'éléments traités (tokens, relations).
+        Consultables en cours d'exécution et exportables en JSON ou au format texte de Prometheus.
+        """
+        self.etapes = {}
+        self._verrou = threading.Lock()
+
+    @contextmanager
+    def mesurer(self, etape, elements=0):
+        """
+        Chronométrer un bloc et l'enregistrer sous le nom de l'étape. Le bloc reçoit un
+        dictionnaire dont il peut fixer 'elements' quand le nombre n'est connu qu'à la fin.
+        """
+        mesure = {'elements': elements}
+        debut = time.perf_counter()
+        try:
+            yield mesure
+        finally:
+            self.enregistrer(etape, time.perf_counter() - debut, mesure['elements'])
+
+    def enregistrer(self, etape, duree, elements=0, appels=1, duree_max=None):
+        with self._verrou:
+            compteurs = self.etapes.get(etape)
+            if compteurs is None:
+                compteurs = self.etapes[etape] = {'appels': 0, 'duree_totale': 0.0, 'duree_max': 0.0, 'elements': 0}
+            compteurs['appels'] += appels
+            compteurs['duree_totale'] += duree
+            compteurs['duree_max'] = max(compteurs['duree_max'], duree if duree_max is None else duree_max)
+            compteurs['elements'] += elements
+
+    def instantane(self):
+        """
+        Copie des compteurs, avec le débit (éléments par seconde) de chaque étape.
+        """
+        with self._verrou:
+            etapes = {etape: dict(compteurs) for etape, compteurs in self.etapes.items()}
+        for compteurs in etapes.values():
+            duree = compteurs['duree_totale']
+            compteurs['debit'] = compteurs['elements'] / duree if duree > 0 else 0.0
+        return etapes
+
+    def extraire(self):
+        """
+        Retourner les compteurs bruts et les remettre à zéro (transfert depuis un processus de travail).
+        """
+        with self._verrou:
+            etapes, self.etapes = self.etapes, {}
+        return etapes
+
+    def fusionner(self, etapes):
+        """
+        Ajouter les compteurs bruts d'un autre processus (voir extraire).
+        """
+        for etape, compteurs in etapes.items():
+            self.enregistrer(etape, compteurs['duree_totale'], compteurs['elements'], compteurs['appels'],
+                             compteurs['duree_max'])
+
+    def reinitialiser(self):
+        with self._verrou:
+            self.etapes = {}
+
+    def exporter_json(self, chemin=None):
+        """
+        Exporter les compteurs en JSON, dans un fichier si un chemin est donné.
+        """
+        texte = json.dumps(self.instantane(), ensure_ascii=False, indent=2, sort_keys=True)
+        if chemin is not None:
+            with open(chemin, 'w', encoding='utf-8') as f:
+                f.write(texte)
+        return texte
+
+    def exporter_texte(self, chemin=None, prefixe='extracteur'):
+        """
+        Exporter les compteurs au format texte d'exposition de Prometheus (fichier lu par
+        le textfile collector de node_exporter, par exemple).
+        """
+        etapes = self.instantane()
+        series = [
+            ('etape_appels_total', 'counter', "Nombre d'appels de l'étape.", 'appels'),
+            ('etape_duree_secondes_total', 'counter', "Temps total passé dans l'étape.", 'duree_totale'),
+            ('etape_duree_max_secondes', 'gauge', "Durée maximale d'un appel de l'étape.", 'duree_max'),
+            ('etape_elements_total', 'counter', "Éléments (tokens, relations) traités par l'étape.", 'elements'),
+        ]
+        lignes = []
+        for nom, type_serie, aide, cle in series:
+            lignes.append(f"# HELP {prefixe}_{nom} {aide}")
+            lignes.append(f"# TYPE {prefixe}_{nom} {type_serie}")
+            for etape in sorted(etapes):
+                etiquette = etape.replace('\\', '\\\\').replace('"', '\\"')
+                lignes.append(f'{prefixe}_{nom}{{etape="{etiquette}"}} {etapes[etape][cle]}')
+        texte = '\n'.join(lignes) + '\n'
+        if chemin is not None:
+            # Écriture atomique : le collecteur ne lit jamais un fichier partiel
+            with open(chemin + '.tmp', 'w', encoding='utf-8') as f:
+                f.write(texte)
+            os.replace(chemin + '.tmp', chemin)
+        return texte
+
+
+# Mesures partagées par la pipeline d'analyse et le moteur de règles
+METRIQUES = MesuresPipeline()
+
+
 class EvaluateurPerformance:
-    def mesurer_temps_execution(self):
-        # Mesure le temps d'exécution du système
-        pass
+    def __init__(self, metriques=METRIQUES):
+        self.metriques = metriques
+
+    def mesurer_temps_execution(self, fonction, *args, etape=None, **kwargs):
+        # Mesure le temps d'exécution d'une fonction du système et l'enregistre dans les mesures
+        with self.metriques.mesurer(etape or fonction.__name__):
+            return fonction(*args, **kwargs)
 
     def calculer_precision(self):
         # Calcule la précision du système
@@ -33,10 +33,14 @@ class GrapheSemantique:
                 self.relation_colors[relation] = '#%02X%02X%02X' % (r(), r(), r())
         return self.relation_colors[relation]
 
-    def ajouter_noeud(self, nom, type_noeud, valeur):
-        """Ajouter un nœud avec son type et sa valeur au graphe."""
+    def ajouter_noeud(self, nom, type_noeud, valeur, debut=None, fin=None, texte=None):
+        """Ajouter un nœud avec son type et sa valeur au graphe, et la position (debut, fin) du mot dans le texte si elle est connue, avec le texte exact de cet intervalle."""
         if not self.G.has_node(nom):
-            self.G.add_node(nom, type=type_noeud, valeur=valeur)
+            if debut is not None:
+                self.G.add_node(nom, type=type_noeud, valeur=valeur, debut=debut, fin=fin,
+                                texte=valeur if texte is None else texte)
+            else:
+                self.G.add_node(nom, type=type_noeud, valeur=valeur)
             logging.debug(f"Ajout du nœud: {nom}, type: {type_noeud}, valeur: {valeur}")
         else:
             logging.debug(f"Nœud déjà existant: {nom}")
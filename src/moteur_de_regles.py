@@ -6,13 +6,20 @@ import os
 import csv
 import logging
 from collections import defaultdict
+from evaluateur_performance import METRIQUES
 from ressources_lexicales import RessourcesLexicales
 from graphe_semantique import GrapheSemantique
 from SyntaxicExtraction import SyntaxicExtraction
 
 class MoteurDeRegles:
-    def __init__(self, graphe):
+    def __init__(self, graphe, lexicon=None, pipeline=None, metriques=METRIQUES):
         self.graphe = graphe
+        # Temps et volumes par étape : relations de base, chaque règle, écritures CSV
+        self.metriques = metriques
+        # Pipeline d'analyse réutilisée à chaque appel (la pipeline par défaut si None)
+        self.pipeline = pipeline
+        # Lexique utilisé pour retrouver les formes fléchies d'un lemme (index inverse)
+        self.lexicon = lexicon
         self.regles = []
         self.relation_types = [
             'r_associated', 'r_raff_sem', 'r_pos',
@@ -34,6 +41,8 @@ class MoteurDeRegles:
         self.initialiser_csv()
         self.word_counter = 0  # Compteur pour générer des identifiants uniques
         self.token_to_word_id = {}  # Mapping des token_primarykey aux word_ids
+        self.word_id_par_valeur = {}  # Texte en minuscules -> premier word_id du texte courant portant ce texte
+        self.word_id_par_lemme = {}  # Lemme -> premier word_id du texte courant portant ce lemme
 
     def initialiser_csv(self):
         """Créer les fichiers CSV pour chaque type de relation avec les en-têtes s'ils n'existent pas."""
@@ -75,13 +84,17 @@ class MoteurDeRegles:
     def appliquer_regles(self, texte):
         """Appliquer les règles après analyse du texte."""
         try:
-            self.ressources = RessourcesLexicales(texte)
-            syntaxic_extraction = SyntaxicExtraction(texte)
+            syntaxic_extraction = SyntaxicExtraction(texte, self.pipeline)
             tokens = syntaxic_extraction.tokens
-
-            self.appliquer_relations(tokens)
-            for regle in self.regles:
-                self.appliquer_regle(regle, tokens)
+            if self.lexicon is None:
+                self.lexicon = syntaxic_extraction.lexicon
+            self.ressources = RessourcesLexicales(texte, self.lexicon)
+
+            with self.metriques.mesurer('base_relations', len(tokens)):
+                self.appliquer_relations(tokens)
+            for numero, regle in enumerate(self.regles):
+                with self.metriques.mesurer(f'rule:{numero}', len(tokens)):
+                    self.appliquer_regle(regle, tokens)
             # Les relations sont déjà enregistrées au fur et à mesure
         except Exception as e:
             logging.error(f"Erreur lors de l'application des règles: {e}")
@@ -89,6 +102,9 @@ class MoteurDeRegles:
     def appliquer_relations(self, tokens):
         """Appliquer les relations prédéfinies entre les tokens."""
         previous_word_id = None
+        # Les mots d'un texte précédent ne doivent plus répondre aux recherches par texte ou lemme
+        self.word_id_par_valeur = {}
+        self.word_id_par_lemme = {}
 
         for mot in tokens:
             self.word_counter += 1
@@ -101,7 +117,10 @@ class MoteurDeRegles:
 
             try:
                 # Ajouter le nœud central du mot avec un identifiant unique
-                self.graphe.ajouter_noeud(word_id, 'word', mot.text)
+                self.graphe.ajouter_noeud(word_id, 'word', mot.text, debut=mot.start, fin=mot.end,
+                                          texte=mot.span_text)
+                self.word_id_par_valeur.setdefault(mot.text.lower(), word_id)
+                self.word_id_par_lemme.setdefault(mot_lemma, word_id)
 
                 # Mapper le token_primarykey à word_id
                 if mot.token_primarykey:
@@ -426,7 +445,11 @@ class MoteurDeRegles:
         # Vérifier si source et cible sont identiques, si oui, ignorer la relation
         if source == cible:
             return  # Ne pas ajouter cette relation
+        with self.metriques.mesurer('csv', 1):
+            self.ecrire_relation_csv(source, relation, cible)
 
+    def ecrire_relation_csv(self, source, relation, cible):
+        """Relire le CSV de la relation, incrémenter sa récurrence et le réécrire."""
         current_dir = os.path.dirname(os.path.abspath(__file__))
         data_dir = os.path.join(current_dir, '..', 'data')
         data_dir = os.path.abspath(data_dir)
@@ -458,12 +481,18 @@ class MoteurDeRegles:
             logging.error(f"Erreur lors de l'ajout ou de la mise à jour de la relation '{relation}' dans '{csv_path}': {e}")
 
     def get_word_id_by_lemma(self, lemma):
-        """Retourne le word_id correspondant au lemme donné."""
-        for token_primarykey, word_id in self.token_to_word_id.items():
-            if self.graphe.existe_noeud(word_id):
-                node_data = self.graphe.G.nodes[word_id]
-                if node_data['type'] == 'word' and node_data['valeur'].lower() == lemma:
-                    return word_id
+        """
+        Retourne le word_id d'un mot du graphe réalisant le lemme donné : mot de même texte,
+        mot de même lemme, ou forme fléchie du lemme connue du lexique (index inverse).
+        """
+        word_id = self.word_id_par_valeur.get(lemma) or self.word_id_par_lemme.get(lemma)
+        if word_id is None and self.lexicon is not None:
+            for forme in self.lexicon.forms_of(lemma):
+                word_id = self.word_id_par_valeur.get(forme)
+                if word_id is not None:
+                    break
+        if word_id is not None and self.graphe.existe_noeud(word_id):
+            return word_id
         return None
 
     def get_word_text_by_lemma(self, lemma):
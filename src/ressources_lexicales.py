@@ -9,23 +9,34 @@ from nltk.corpus import wordnet
 # nltk.download('omw-1.4')
 
 class RessourcesLexicales:
-    def __init__(self, texte):
+    def __init__(self, texte, lexicon=None):
         # Convertir le texte en une liste de mots pour le filtrage
         self.mots_du_texte = set(word.lower() for word in texte.split())
+        # Avec un lexique, un lemme est aussi présent si l'une de ses formes fléchies l'est
+        self.lexicon = lexicon
+
+    def dans_le_texte(self, mot):
+        """Indique si le mot, ou l'une de ses formes fléchies, apparaît dans le texte."""
+        mot = mot.lower()
+        if mot in self.mots_du_texte:
+            return True
+        if self.lexicon is None:
+            return False
+        return any(forme in self.mots_du_texte for forme in self.lexicon.forms_of(mot))
 
     def synonymes(self, mot):
         synonyms = set()
         for syn in wordnet.synsets(mot, lang='fra'):
             for lemma in syn.lemmas('fra'):
                 synonym = lemma.name().replace('_', ' ')
-                if synonym.lower() in self.mots_du_texte:
+                if self.dans_le_texte(synonym):
                     synonyms.add(synonym)
         # Ajouter des synonymes manuellement si nécessaire, mais uniquement s'ils sont dans le texte
         manual_synonyms = {
 
         }
         for syn in manual_synonyms.get(mot, []):
-            if syn.lower() in self.mots_du_texte:
+            if self.dans_le_texte(syn):
                 synonyms.add(syn)
         return list(synonyms)
 
@@ -36,14 +47,14 @@ class RessourcesLexicales:
                 if lemma.antonyms():
                     for ant in lemma.antonyms():
                         antonym = ant.name().replace('_', ' ')
-                        if antonym.lower() in self.mots_du_texte:
+                        if self.dans_le_texte(antonym):
                             antonyms.add(antonym)
         # Ajouter des antonymes manuellement si nécessaire, mais uniquement s'ils sont dans le texte
         manual_antonyms = {
 
         }
         for ant in manual_antonyms.get(mot, []):
-            if ant.lower() in self.mots_du_texte:
+            if self.dans_le_texte(ant):
                 antonyms.add(ant)
         return list(antonyms)
 
@@ -53,14 +64,14 @@ class RessourcesLexicales:
             for hyper in syn.hypernyms():
                 for lemma in hyper.lemmas('fra'):
                     hyperonym = lemma.name().replace('_', ' ')
-                    if hyperonym.lower() in self.mots_du_texte:
+                    if self.dans_le_texte(hyperonym):
                         hyperonyms.add(hyperonym)
         # Ajouter des hyperonymes manuellement si nécessaire, mais uniquement s'ils sont dans le texte
         manual_hyperonyms = {
 
         }
         for hyper in manual_hyperonyms.get(mot, []):
-            if hyper.lower() in self.mots_du_texte:
+            if self.dans_le_texte(hyper):
                 hyperonyms.add(hyper)
                 print(list(hyperonyms))
         return list(hyperonyms)
@@ -71,13 +82,13 @@ class RessourcesLexicales:
             for hypo in syn.hyponyms():
                 for lemma in hypo.lemmas('fra'):
                     hyponym = lemma.name().replace('_', ' ')
-                    if hyponym.lower() in self.mots_du_texte:
+                    if self.dans_le_texte(hyponym):
                         hyponyms.add(hyponym)
         # Ajouter des hyponyms manuellement si nécessaire, mais uniquement s'ils sont dans le texte
         manual_hyponyms = {
 
         }
         for hypo in manual_hyponyms.get(mot, []):
-            if hypo.lower() in self.mots_du_texte:
+            if self.dans_le_texte(hypo):
                 hyponyms.add(hypo)
         return list(hyponyms)
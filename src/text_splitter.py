@@ -1,35 +1,125 @@
 import re
 
+# Abréviations reconnues devant un point (titres, renvois)
+ABREVIATIONS = frozenset({
+    'm', 'mm', 'mme', 'mmes', 'mlle', 'mlles', 'dr', 'drs', 'pr', 'me', 'mgr', 'st', 'ste', 'sts',
+    'cf', 'p', 'pp', 'ex', 'fig', 'chap', 'vol', 'art', 'al', 'av', 'bd', 'env', 'hab', 'min', 'max',
+    'no', 'nos', 'tél', 'éd', 'coll', 'dir', 'resp', 'sq', 'sqq', 'op', 'cit', 'ibid', 'id', 'etc',
+})
+# Titres, toujours suivis d'un nom : jamais en fin de phrase avec une majuscule (« M. Dupont »,
+# « Dr. Martin »), alors qu'en minuscule ce sont souvent des unités (« 3.5 m. », « 2 mm. »).
+TITRES = frozenset({
+    'm', 'mm', 'mme', 'mmes', 'mlle', 'mlles', 'dr', 'drs', 'pr', 'me', 'mgr', 'st', 'ste', 'sts',
+})
+# Abréviations qui terminent la phrase si la suite commence par une majuscule : toutes sauf
+# « cf. », toujours suivi d'un nom. Plusieurs sont aussi des mots courants (« l'art. »,
+# « le vol. », « mon ex. ») et ne restent des abréviations que devant un chiffre ou une
+# minuscule (« art. 3 », « vol. 2 », « p. ex. en »).
+ABREVIATIONS_FINALES = ABREVIATIONS - frozenset({'cf'})
+
+# Ponctuation finale, éventuellement suivie de guillemets ou parenthèses fermants, puis d'un blanc
+FIN_DE_PHRASE = re.compile(r'[.!?…]+(?:[ \u00a0\u202f]*[»"]|[\')\]])*(?=\s|$)')
+MOT_PRECEDENT = re.compile(r'(\w+)$')
+SUITE = re.compile(r'\s*(\S)')
+
+
 class TextSplitter:
-    def __init__(self):
-        pass
-    
+    def __init__(self, abreviations=ABREVIATIONS, abreviations_finales=ABREVIATIONS_FINALES, titres=TITRES):
+        """
+        Découpeur de phrases : repère les fins de phrase sans copier le texte, en ignorant
+        les points d'abréviation (« M. Dupont », « p. ex. ») et d'initiale (« J. Dupont »).
+
+        :param abreviations: ensemble des abréviations en minuscules, sans le point
+        :param abreviations_finales: abréviations pouvant aussi clore la phrase (« etc. »)
+        :param titres: abréviations qui ne closent jamais la phrase quand elles ont une majuscule
+        """
+        self.abreviations = abreviations
+        self.abreviations_finales = abreviations_finales
+        self.titres = titres
+
+    def est_fin_de_phrase(self, texte, match):
+        """
+        Indique si la ponctuation trouvée par FIN_DE_PHRASE termine la phrase.
+        """
+        if texte[match.start()] != '.' or match.group().startswith('..'):
+            # Une incise en minuscule prolonge la phrase : « Quoi ? » dit-il.
+            suite = SUITE.match(texte, match.end())
+            return suite is None or not suite.group(1).islower()
+        mot = MOT_PRECEDENT.search(texte, max(0, match.start() - 20), match.start())
+        if mot is None:
+            return True
+        mot = mot.group(1)
+        if len(mot) == 1 and mot.isupper():
+            return False  # Initiale d'un prénom
+        if mot.lower() not in self.abreviations:
+            return True
+        if mot[0].isupper() and mot.lower() in self.titres:
+            return False  # Titre : « Mme. Dupont »
+        if mot.lower() in self.abreviations_finales:
+            suite = SUITE.match(texte, match.end())
+            return suite is None or suite.group(1).isupper()
+        return False
+
+    def fins_de_phrase(self, texte, fin_de_texte=True):
+        """
+        Itère sur les offsets de fin de chaque phrase (juste après sa ponctuation finale).
+
+        :param texte: str, le texte à découper
+        :param fin_de_texte: False si le texte se poursuit (lecture par blocs) : une ponctuation
+                             suivie seulement de blancs dépend alors de la suite et n'est pas tranchée
+        :return: générateur d'entiers
+        """
+        for match in FIN_DE_PHRASE.finditer(texte):
+            if not fin_de_texte and SUITE.match(texte, match.end()) is None:
+                return
+            if self.est_fin_de_phrase(texte, match):
+                yield match.end()
+
+    def split_spans(self, texte):
+        """
+        Itère sur les phrases sous forme d'intervalles (début, fin) du texte, blancs exclus.
+        Un reste sans ponctuation finale forme la dernière phrase.
+
+        :param texte: str, le texte à découper
+        :return: générateur de tuples (début, fin)
+        """
+        debut = 0
+        for fin in self.fins_de_phrase(texte):
+            while debut < fin and texte[debut].isspace():
+                debut += 1
+            yield debut, fin
+            debut = fin
+        while debut < len(texte) and texte[debut].isspace():
+            debut += 1
+        fin = len(texte)
+        while fin > debut and texte[fin - 1].isspace():
+            fin -= 1
+        if debut < fin:
+            yield debut, fin
+
     def split_text_into_sentences(self, texte):
         """
         Divise un texte complet en phrases, tout en conservant les virgules à l'intérieur des phrases.
-        
+
         :param texte: str, le texte à diviser
         :return: list, une liste de phrases
         """
-        # Utiliser une expression régulière pour diviser en phrases par les ponctuations finales (., !, ?)
-        phrase_endings = re.compile(r'(?<=[.!?])\s+')
-        phrases = phrase_endings.split(texte.strip())
-        
-        # Retourner les phrases après suppression des espaces superflus
-        return [phrase.strip() for phrase in phrases if phrase]
+        return [texte[debut:fin] for debut, fin in self.split_spans(texte)]
+
 
-# Exemple d'utilisation
-texte = """
-Le chat dort sur le canapé, il est fatigué. Marie mange une pomme rouge, tout en regardant la télévision. 
-Le pilote contrôle l'avion avec précision, et tout se passe bien !
-"""
+if __name__ == "__main__":
+    # Exemple d'utilisation
+    texte = """
+    Le chat dort sur le canapé, il est fatigué. M. Dupont mange une pomme rouge, etc. en regardant la télévision.
+    Le pilote contrôle l'avion avec précision, et tout se passe bien !
+    """
 
-# Initialiser l'instance de TextSplitter
-splitter = TextSplitter()
+    # Initialiser l'instance de TextSplitter
+    splitter = TextSplitter()
 
-# Diviser le texte en phrases
-phrases = splitter.split_text_into_sentences(texte)
+    # Diviser le texte en phrases
+    phrases = splitter.split_text_into_sentences(texte)
 
-# Afficher les phrases divisées
-for i, phrase in enumerate(phrases, 1):
-    print(f"Phrase {i}: {phrase}")
+    # Afficher les phrases divisées
+    for i, phrase in enumerate(phrases, 1):
+        print(f"Phrase {i}: {phrase}")
@@ -1,4 +1,51 @@
 class VisualisateurGraphe:
     def exporter_en_BRAT(self, graphe, chemin_fichier):
-        # Exporte le graphe dans un format lisible par BRAT
-        pass
+        """
+        Exporte le graphe dans un fichier d'annotations BRAT (.ann) : une entité par nœud 'word'
+        positionné dans le texte (type = son POS), une relation par arc entre deux de ces nœuds.
+        Retourne le nombre d'entités écrites.
+        """
+        G = getattr(graphe, 'G', graphe)
+        entites = {}
+        lignes = []
+        for nom, attributs in G.nodes(data=True):
+            if attributs.get('type') != 'word' or attributs.get('debut') is None:
+                continue
+            # Le POS du mot est porté par le nœud relié par r_pos
+            type_entite = 'word'
+            for _, cible, arc in G.out_edges(nom, data=True):
+                if arc.get('relation') == 'r_pos':
+                    type_entite = str(G.nodes[cible].get('valeur', 'word')).upper()
+                    break
+            entites[nom] = f"T{len(entites) + 1}"
+            # Texte de l'intervalle lui-même : la valeur peut avoir été réécrite par l'analyse (l', d'...)
+            texte = attributs.get('texte', attributs['valeur'])
+            fragments = self.fragments_BRAT(attributs['debut'], texte)
+            positions = ';'.join(f"{debut} {fin}" for debut, fin, _ in fragments)
+            texte = ' '.join(morceau for _, _, morceau in fragments)
+            lignes.append(f"{entites[nom]}\t{type_entite} {positions}\t{texte}")
+
+        numero = 0
+        for source, cible, arc in G.edges(data=True):
+            if source in entites and cible in entites:
+                numero += 1
+                lignes.append(f"R{numero}\t{arc.get('relation')} Arg1:{entites[source]} Arg2:{entites[cible]}")
+
+        with open(chemin_fichier, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lignes) + ('\n' if lignes else ''))
+        return len(entites)
+
+    @staticmethod
+    def fragments_BRAT(debut, texte):
+        """
+        Découpe un intervalle aux retours à la ligne, qu'une ligne du fichier .ann ne peut pas
+        contenir : BRAT représente alors l'entité par des fragments discontinus.
+        Retourne la liste des (début, fin, texte) des fragments non vides.
+        """
+        fragments = []
+        position = debut
+        for morceau in texte.split('\n'):
+            if morceau:
+                fragments.append((position, position + len(morceau), morceau))
+            position += len(morceau) + 1
+        return fragments or [(debut, debut + len(texte), texte.strip())]
@@ -0,0 +1,38 @@
+import os
+import sys
+import unittest
+
+# Ajouter dynamiquement le chemin vers src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from cache import CacheLRU
+
+
+class TestCacheLRU(unittest.TestCase):
+
+    def test_eviction_moins_recemment_utilise(self):
+        cache = CacheLRU(capacite=2)
+        cache.ajouter('a', 1)
+        cache.ajouter('b', 2)
+        self.assertEqual(cache.obtenir('a'), 1)
+        cache.ajouter('c', 3)
+        self.assertNotIn('b', cache)
+        self.assertIn('a', cache)
+        self.assertEqual(cache.evictions, 1)
+
+    def test_compteurs(self):
+        cache = CacheLRU(capacite=10)
+        cache.ajouter('chat', 'chat')
+        cache.obtenir('chat')
+        cache.obtenir('chien')
+        stats = cache.statistiques()
+        self.assertEqual((stats['succes'], stats['echecs'], stats['taille']), (1, 1, 1))
+        self.assertEqual(stats['taux_succes'], 0.5)
+
+    def test_capacite_invalide(self):
+        with self.assertRaises(ValueError):
+            CacheLRU(capacite=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+# Ajouter dynamiquement le chemin vers src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from Tokenizer.CompoundMatcher import AUTOMATON_FILE, CompoundMatcher, load_compound_matcher
+from Tokenizer.Tokenizer import Tokenizer
+
+COMPOUND_LINES = [
+    '1;"pomme de terre";',
+    '2;"pomme de terre cuite";',
+    '3;"tout à fait";',
+    '4;"arc-en-ciel";',
+    '5;"de terre";',
+    '6;"terre cuite au four";',
+]
+
+
+class TestCompoundMatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        with open(os.path.join(self.data_dir, 'motsComposés.txt'), 'w', encoding='utf-8') as f:
+            f.write('\n'.join(COMPOUND_LINES) + '\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_plus_longue_expression_a_gauche(self):
+        matcher = CompoundMatcher(["pomme de terre", "pomme de terre cuite", "de terre", "terre cuite au four",
+                                   "arc-en-ciel"])
+        self.assertEqual(len(matcher), 4)
+        words = "une pomme de terre cuite au four et de terre".split()
+        self.assertEqual(matcher.find(words), [(1, 5), (8, 10)])
+        self.assertEqual(matcher.find("la terre cuite au four".split()), [(1, 5)])
+        self.assertEqual(matcher.find("pomme de pomme de terre".split()), [(2, 5)])
+        # Une expression plus courte, terminée au même endroit qu'une expression rejetée, est conservée
+        self.assertEqual(CompoundMatcher(['a b', 'b c d', 'c d']).find('a b c d'.split()), [(0, 2), (2, 4)])
+
+    def test_fusion_dans_le_tokenizer(self):
+        tokenizer = Tokenizer(data_dir=self.data_dir, merge_multiword=True)
+        tokens = tokenizer.tokenize("Une Pomme de terre cuite. C'est tout à fait un arc-en-ciel.")
+        self.assertEqual([t.text for t in tokens],
+                         ["Une", "Pomme de terre cuite", ".", "C", "est", "tout à fait", "un", "arc-en-ciel", "."])
+        self.assertEqual([t.token_primarykey for t in tokens],
+                         [(0, 0), (0, 1), (0, 2), (1, 0), (1, 1), (1, 2), (1, 3), (1, 4), (1, 5)])
+        # Une expression ne traverse pas la fin de phrase
+        self.assertEqual([t.text for t in tokenizer.tokenize("Une pomme de. Terre cuite.")],
+                         ["Une", "pomme", "de", ".", "Terre", "cuite", "."])
+
+        # L'automate est mis en cache à côté du fichier et relu sans reconstruction
+        self.assertTrue(os.path.exists(os.path.join(self.data_dir, AUTOMATON_FILE)))
+        with mock.patch('Tokenizer.CompoundMatcher.CompoundMatcher.add') as add:
+            cached = Tokenizer(data_dir=self.data_dir, merge_multiword=True)
+        add.assert_not_called()
+        self.assertEqual(len(cached.compound_matcher), 5)
+
+        # Un automate d'une version antérieure est reconstruit
+        cached.compound_matcher.version = 1
+        with open(os.path.join(self.data_dir, AUTOMATON_FILE), 'wb') as f:
+            pickle.dump(cached.compound_matcher, f)
+        self.assertEqual(load_compound_matcher(os.path.join(self.data_dir, 'motsComposés.txt')).version,
+                         CompoundMatcher.FORMAT_VERSION)
+
+        self.assertEqual(len(Tokenizer(data_dir=self.data_dir).tokenize("tout à fait")), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Ajouter dynamiquement le chemin vers src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from Tokenizer.Disambiguator import Disambiguator
+from Tokenizer.Lexicon import Lexicon
+from Tokenizer.MorphologicalAnalyzer import MorphologicalAnalyzer
+from Tokenizer.Token_ import Token
+from tests.test_lexicon import write_lexicon_files
+
+
+class TestDisambiguator(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        write_lexicon_files(self.data_dir)
+        self.lexicon = Lexicon(data_dir=self.data_dir)
+        self.analyzer = MorphologicalAnalyzer(cache=None)
+        self.disambiguator = Disambiguator()
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def analyser(self, words):
+        tokens = self.analyzer.analyze([Token(word) for word in words], self.lexicon)
+        return self.disambiguator.disambiguate(tokens, self.analyzer, self.lexicon)
+
+    def test_desambiguisation(self):
+        le, chat, mangent, la, petite = self.analyser(["le", "chat", "mangent", "la", "petite"])
+        self.assertEqual((le.pos_, le.lemma_), ('DET', 'le'))
+        self.assertEqual((chat.pos_, chat.lemma_), ('NOUN', 'chat'))
+        self.assertEqual((mangent.pos_, mangent.lemma_), ('VERB', 'manger'))
+        self.assertEqual((la.pos_, la.lemma_), ('DET', 'le'))
+        # Le lemme singulier connu du lexique est préféré
+        self.assertEqual((petite.pos_, petite.lemma_), ('ADJ', 'petite'))
+
+    def test_table_des_lemmes(self):
+        tokens = self.analyzer.analyze([Token(w) for w in ["la", "chats", "la"]], self.lexicon)
+        calls = []
+        extract_lexical = self.lexicon.extract_lexical
+
+        def counting_extract(batch):
+            calls.append([token.text for token in batch])
+            return extract_lexical(batch)
+
+        self.lexicon.extract_lexical = counting_extract
+        self.disambiguator.disambiguate(tokens, self.analyzer, self.lexicon)
+        # Tous les lemmes candidats sont analysés en un seul lot
+        self.assertEqual(calls, [["le", "la", "chat"]])
+
+        table = self.disambiguator.get_lemma_table(self.analyzer, self.lexicon)
+        self.assertEqual(table.get("chat"), ('Nom:Mas+SG', {'Gender': 'Mas', 'Number': 'Sing'}))
+        self.assertEqual(table.features("le"), {'Gender': 'Mas', 'Number': 'Sing'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Ajouter dynamiquement le chemin vers src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from Tokenizer.Doc import Doc
+from Tokenizer.Token_ import Token
+from Tokenizer.Tokenizer import Tokenizer
+
+
+class TestDoc(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        with open(os.path.join(self.data_dir, 'motsComposés.txt'), 'w', encoding='utf-8') as f:
+            f.write('1;"arc-en-ciel";\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def analyzed_tokens(self):
+        tokens = Tokenizer(data_dir=self.data_dir).tokenize("L'arc-en-ciel brille. Le chat dort.")
+        tags = ["DET", "NOUN", "VERB", "PUNCT", "DET", "NOUN", "VERB", "PUNCT"]
+        for token, tag in zip(tokens, tags):
+            token.pos_ = tag
+            token.lemma_ = token.text.lower()
+            token.is_alpha = token.text.isalpha()
+        tokens[0].text += "'"  # Comme l'analyseur morphologique pour les élisions
+        tokens[0].head, tokens[0].dep_ = tokens[1], 'det'
+        tokens[1].head, tokens[1].dep_ = tokens[2], 'nsubj'
+        tokens[2].head, tokens[2].dep_ = tokens[2], 'ROOT'
+        tokens[6].morph = {'VerbForm': 'Fin', 'Number': 'Sing'}
+        tokens[5].groupe = [{'type': 'GN', 'range': (4, 5)}]
+        return tokens
+
+    def test_token_sans_dict(self):
+        token = Token("chat")
+        self.assertFalse(hasattr(token, '__dict__'))
+        with self.assertRaises(AttributeError):
+            token.inconnu = 1
+
+    def test_colonnes_et_vues(self):
+        tokens = self.analyzed_tokens()
+        doc = Doc.from_tokens(tokens)
+        self.assertEqual(len(doc), 8)
+        self.assertIs(doc[1], tokens[1])  # Vues d'origine tant que le document n'est pas sérialisé
+        self.assertEqual(list(doc.head[:3]), [1, 2, 2])
+        self.assertEqual(doc.head[3], -1)
+        self.assertEqual(doc.pos[1], doc.pos[5])  # POS internés
+        self.assertEqual([doc.text_of(i) for i in range(3)], ["L'", "arc-en-ciel", "brille"])
+
+    def test_serialisation(self):
+        tokens = self.analyzed_tokens()
+        restored = pickle.loads(pickle.dumps(Doc.from_tokens(tokens)))
+        self.assertIsNone(restored._tokens)
+        views = restored.tokens
+        self.assertEqual([t.text for t in views], [t.text for t in tokens])
+        self.assertEqual([t.pos_ for t in views], [t.pos_ for t in tokens])
+        self.assertEqual([t.token_primarykey for t in views], [t.token_primarykey for t in tokens])
+        self.assertEqual([(t.start, t.end) for t in views], [(t.start, t.end) for t in tokens])
+        self.assertIs(views[0].head, views[1])
+        self.assertIs(views[2].head, views[2])
+        self.assertIsNone(views[3].head)
+        self.assertEqual(views[1].dep_, 'nsubj')
+        self.assertEqual(views[6].morph, {'VerbForm': 'Fin', 'Number': 'Sing'})
+        self.assertEqual(views[5].groupe, [{'type': 'GN', 'range': (4, 5)}])
+        self.assertEqual((views[1].is_alpha, views[3].is_stop), (False, None))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Ajouter dynamiquement le chemin vers src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from evaluateur_performance import EvaluateurPerformance, MesuresPipeline
+from Tokenizer.Pipeline import Pipeline
+from tests.test_lexicon import write_lexicon_files
+
+
+class TestMesuresPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_compteurs_et_exports(self):
+        mesures = MesuresPipeline()
+        with mesures.mesurer('tokenize') as mesure:
+            mesure['elements'] = 5
+        mesures.enregistrer('tokenize', 0.5, 3)
+        self.assertEqual(EvaluateurPerformance(mesures).mesurer_temps_execution(sorted, [2, 1], etape='tri'), [1, 2])
+
+        etapes = mesures.instantane()
+        self.assertEqual((etapes['tokenize']['appels'], etapes['tokenize']['elements']), (2, 8))
+        self.assertEqual(etapes['tokenize']['duree_max'], 0.5)
+        self.assertEqual(etapes['tri']['appels'], 1)
+
+        chemin = os.path.join(self.data_dir, 'mesures.json')
+        mesures.exporter_json(chemin)
+        with open(chemin, encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['tokenize']['elements'], 8)
+        texte = mesures.exporter_texte(os.path.join(self.data_dir, 'mesures.prom'))
+        self.assertIn('# TYPE extracteur_etape_duree_secondes_total counter', texte)
+        self.assertIn('extracteur_etape_appels_total{etape="tokenize"} 2', texte)
+
+        # Report des mesures d'un autre processus
+        autre = MesuresPipeline()
+        autre.fusionner(mesures.extraire())
+        self.assertEqual(mesures.instantane(), {})
+        self.assertEqual(autre.instantane()['tokenize']['elements'], 8)
+
+    def test_etapes_de_la_pipeline(self):
+        write_lexicon_files(self.data_dir)
+        with open(os.path.join(self.data_dir, 'motsComposés.txt'), 'w', encoding='utf-8') as f:
+            f.write('1;"arc-en-ciel";\n')
+        mesures = MesuresPipeline()
+        pipeline = Pipeline(data_dir=self.data_dir, metriques=mesures)
+        list(pipeline.pipe(["Les chats mangent.", "Le chat dort."]))
+        etapes = mesures.instantane()
+        self.assertEqual(set(etapes), {'tokenize', 'lexicon', 'morph', 'disambiguate', 'dependencies', 'groups'})
+        self.assertEqual(etapes['tokenize']['elements'], 8)
+        self.assertEqual(etapes['disambiguate']['appels'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Ajouter dynamiquement le chemin vers src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from Tokenizer.FuzzyLexicon import FuzzyIndex, build_fuzzy_index, edit_distance, fold_accents
+from Tokenizer.Lexicon import Lexicon
+from Tokenizer.Token_ import Token
+from tests.test_lexicon import write_lexicon_files
+
+
+class TestFuzzyIndex(unittest.TestCase):
+
+    def test_distance_et_accents(self):
+        self.assertEqual(fold_accents("élève cœur"), "eleve coeur")
+        self.assertEqual(edit_distance("chat", "chta", 1), 1)
+        self.assertEqual(edit_distance("chat", "chien", 1), 2)
+        self.assertEqual(edit_distance("manger", "mangeur", 2), 1)
+
+    def test_recherche_approchee(self):
+        index = FuzzyIndex(["chat", "chats", "été", "être", "mangent", "anticonstitutionnellement"])
+        self.assertEqual(index.lookup("ete"), ["été"])
+        self.assertEqual(index.lookup("etre"), ["être"])
+        self.assertEqual(index.lookup("mnagent"), ["mangent"])
+        self.assertEqual(index.lookup("chatx"), ["chat", "chats"])
+        # Faute au-delà du préfixe indexé
+        self.assertEqual(index.lookup("anticonstitutionnelement"), ["anticonstitutionnellement"])
+        self.assertEqual(index.lookup("chien"), [])
+        self.assertFalse(index.eligible("12"))
+
+
+class TestLexiconFuzzy(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        write_lexicon_files(self.data_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_mots_hors_lexique(self):
+        words = ["ete", "mnagent", "chat", "xyzw"]
+        tokens = Lexicon(data_dir=self.data_dir).extract_lexical([Token(word) for word in words])
+        self.assertEqual(tokens[0].lemma_candidates, [('ete', 0)])
+
+        lexicon = Lexicon(data_dir=self.data_dir, fuzzy=True)
+        ete, mangent, chat, inconnu = lexicon.extract_lexical([Token(word) for word in words])
+        self.assertEqual(ete.lemma_candidates, [('être', 60), ('été', 30)])
+        self.assertEqual(mangent.pos_candidates, [('Ver:IPre+PL+P3', 50), ('VerbalTime:Present', 30)])
+        self.assertEqual(chat.lemma_candidates, [('chat', 50)])
+        self.assertEqual(inconnu.lemma_candidates, [('xyzw', 0)])
+
+        build_fuzzy_index(self.data_dir)
+        lexicon = Lexicon(data_dir=self.data_dir, mode='bisect', fuzzy=True)
+        self.assertEqual(lexicon.extract_lemmas([Token("Chta")])[0].lemma_candidates, [('chat', 50)])
+        lexicon.add_lemma("souriceau", "souriceau", 40)
+        self.assertEqual(lexicon.extract_lemmas([Token("sourriceau")])[0].lemma_candidates, [('souriceau', 40)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,275 @@
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+# Ajouter dynamiquement le chemin vers src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from Tokenizer.BisectLexicon import check_sorted
+from Tokenizer.CompiledLexicon import CompiledLexicon, compile_lexicon
+from Tokenizer import IndexBuilder
+from Tokenizer.IndexBuilder import build_index, build_indexes, check_staleness
+from Tokenizer.Lexicon import Lexicon
+from Tokenizer.LexiconOverlay import OVERLAY_FILE, compact_overlay
+from Tokenizer.Token_ import Token
+
+LEMMA_LINES = [
+    "chat;chat;50",
+    "chats;chat;40",
+    "est;est;10",
+    "est;être;90",
+    "la;la;30",
+    "la;le;60",
+    "le;le;80",
+    "les;le;70",
+    "mangent;manger;50",
+    "petite;petit;45",
+    "petite;petite;20",
+    "souris;souris;40",
+    "été;été;30",
+    "été;être;60",
+]
+
+POS_LINES = [
+    "chat;chat;Nom:Mas+SG;50",
+    "chats;chat;Nom:Mas+PL;40",
+    "est;être;Ver:IPre+SG+P3;90",
+    "est;est;Nom:Mas+SG;10",
+    "la;le;Det:Fem+SG;60",
+    "la;la;Pro:Pers:Fem+SG;20",
+    "le;le;Det:Mas+SG;80",
+    "les;le;Det:PL;70",
+    "mangent;manger;Ver:IPre+PL+P3;50",
+    "mangent;manger;VerbalTime:Present;30",
+    "petite;petit;Adj:Fem+SG;45",
+    "petite;petite;Nom:Fem+SG;20",
+    "souris;souris;Nom:Fem+InvGen;40",
+    "souris;souris;Number:Sing;0",
+    "été;être;Ver:PPas;60",
+    "été;été;Nom:Mas+SG;30",
+]
+
+
+def write_lexicon_files(data_dir):
+    """Écrit un petit lexique de test et ses index pickle dans data_dir."""
+    lemma_path = os.path.join(data_dir, 'lemma_clean_utf8.txt')
+    pos_path = os.path.join(data_dir, 'pos_utf8.txt')
+    lemma_index, pos_index = {}, {}
+    with open(lemma_path, 'wb') as f:
+        previous = None
+        for line in LEMMA_LINES:
+            word = line.split(';')[0]
+            if word != previous:
+                lemma_index.setdefault(word, []).append(f.tell())
+            previous = word
+            f.write((line + '\n').encode('utf-8'))
+    with open(pos_path, 'wb') as f:
+        for line in POS_LINES:
+            pos_index.setdefault(line.split(';')[0], []).append(f.tell())
+            f.write((line + '\n').encode('utf-8'))
+    with open(os.path.join(data_dir, 'lemma_index.pkl'), 'wb') as f:
+        pickle.dump(lemma_index, f)
+    with open(os.path.join(data_dir, 'pos_index.pkl'), 'wb') as f:
+        pickle.dump(pos_index, f)
+    return lemma_path, pos_path
+
+
+class TestLexicon(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.lemma_path, self.pos_path = write_lexicon_files(self.data_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def analyser(self, lexicon, words):
+        tokens = [Token(word) for word in words]
+        lexicon.extract_lemmas(tokens)
+        lexicon.extract_pos(tokens)
+        return [(t.lemma_candidates, t.pos_candidates) for t in tokens]
+
+    def test_index_mode(self):
+        lexicon = Lexicon(data_dir=self.data_dir)
+        self.assertEqual(lexicon.mode, 'index')
+        (lemmas, pos), = self.analyser(lexicon, ["La"])
+        self.assertEqual(lemmas, [('le', 60), ('la', 30)])
+        self.assertEqual(pos, [('Det:Fem+SG', 60), ('Pro:Pers:Fem+SG', 20)])
+
+    def test_compiled_mode_matches_index_mode(self):
+        words = ["La", "chat", "mangent", "la", "petite", "souris", "-été", "inconnu"]
+        expected = self.analyser(Lexicon(data_dir=self.data_dir, mode='index'), words)
+
+        compile_lexicon(self.lemma_path, self.pos_path, os.path.join(self.data_dir, 'lexicon.bin'))
+        lexicon = Lexicon(data_dir=self.data_dir)
+        self.assertEqual(lexicon.mode, 'compiled')
+        self.assertEqual(self.analyser(lexicon, words), expected)
+        lexicon.compiled.close()
+
+    def test_extraction_fusionnee(self):
+        words = ["le", "chat", "mangent", "le", "souris", "inconnu", "Le"]
+        lexicon = Lexicon(data_dir=self.data_dir)
+        expected = self.analyser(lexicon, words)
+
+        tokens = [Token(word) for word in words]
+        with mock.patch('builtins.open', side_effect=open) as opened:
+            lexicon.extract_lexical(tokens)
+        # Un seul accès à chaque fichier pour tout le lot
+        self.assertEqual(sorted(call.args[0] for call in opened.call_args_list),
+                         sorted([self.lemma_path, self.pos_path]))
+        self.assertEqual([(t.lemma_candidates, t.pos_candidates) for t in tokens], expected)
+
+        compile_lexicon(self.lemma_path, self.pos_path, os.path.join(self.data_dir, 'lexicon.bin'))
+        compiled = Lexicon(data_dir=self.data_dir, mode='compiled')
+        tokens = compiled.extract_lexical([Token(word) for word in words])
+        self.assertEqual([(t.lemma_candidates, t.pos_candidates) for t in tokens], expected)
+        compiled.compiled.close()
+
+    def test_bisect_mode_matches_index_mode(self):
+        words = ["La", "chat", "mangent", "la", "petite", "souris", "-été", "inconnu", "a", "zzz"]
+        expected = self.analyser(Lexicon(data_dir=self.data_dir, mode='index'), words)
+
+        self.assertIsNone(check_sorted(self.lemma_path))
+        self.assertIsNone(check_sorted(self.pos_path))
+        lexicon = Lexicon(data_dir=self.data_dir, mode='bisect')
+        self.assertEqual(self.analyser(lexicon, words), expected)
+        lexicon.store.close()
+
+        with open(self.lemma_path, 'a', encoding='utf-8') as f:
+            f.write("abeille;abeille;40\n")
+        self.assertEqual(check_sorted(self.lemma_path), len(LEMMA_LINES) + 1)
+
+    def test_index_inverse(self):
+        lexicon = Lexicon(data_dir=self.data_dir)
+        # Sans lemma_forms.pkl, l'index inverse est construit en mémoire depuis le fichier
+        self.assertEqual(lexicon.forms_of("être"), ('est', 'été'))
+        self.assertEqual(lexicon.forms_of("Chat"), ('chat', 'chats'))
+        self.assertEqual(lexicon.forms_of("inconnu"), ())
+
+        counts = build_indexes(self.data_dir)
+        self.assertEqual(counts['reverse'], 10)
+        lexicon = Lexicon(data_dir=self.data_dir, mode='bisect')
+        self.assertEqual(lexicon.forms_of("le"), ('la', 'le', 'les'))
+        lexicon.add_lemma("chatte", "chat", 20)
+        lexicon.add_lemma("chats", "chat", 0)
+        self.assertEqual(lexicon.forms_of("chat"), ('chat', 'chatte'))
+
+    def test_compiled_lookup(self):
+        path = os.path.join(self.data_dir, 'lexicon.bin')
+        counts = compile_lexicon(self.lemma_path, self.pos_path, path)
+        self.assertEqual(counts['forms'], 10)
+
+        compiled = CompiledLexicon(path)
+        self.assertEqual(compiled.find_form("zzz"), -1)
+        self.assertEqual(compiled.search_lemmas(["été"])["été"], [('être', 60), ('été', 30)])
+        # Les scores nuls sont ignorés comme dans Lexicon.extract_pos
+        self.assertEqual(compiled.search_pos(["souris"])["souris"], [('Nom:Fem+InvGen', 40)])
+        compiled.close()
+
+
+class TestLexiconOverlay(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.lemma_path, self.pos_path = write_lexicon_files(self.data_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def analyser(self, lexicon, words):
+        tokens = lexicon.extract_lexical([Token(word) for word in words])
+        return [(t.lemma_candidates, t.pos_candidates) for t in tokens]
+
+    def test_ajouts_et_corrections(self):
+        lexicon = Lexicon(data_dir=self.data_dir)
+        namespace = lexicon.cache_namespace
+        lexicon.add_lemma("Souriceau", "souriceau", 40)
+        lexicon.add_pos("souriceau", "Nom:Mas+SG", 40)
+        lexicon.add_lemma("est", "être", 0)
+        lexicon.add_pos("petite", "Adj:Fem+SG", 10)
+        self.assertNotEqual(lexicon.cache_namespace, namespace)
+
+        attendu = [
+            ([('souriceau', 40)], [('Nom:Mas+SG', 40)]),
+            ([('est', 10)], [('Ver:IPre+SG+P3', 90), ('Nom:Mas+SG', 10)]),
+            ([('petit', 45), ('petite', 20)], [('Nom:Fem+SG', 20), ('Adj:Fem+SG', 10)]),
+        ]
+        self.assertEqual(self.analyser(lexicon, ["souriceau", "est", "petite"]), attendu)
+        # L'overlay est relu par un nouveau lexique
+        self.assertEqual(self.analyser(Lexicon(data_dir=self.data_dir), ["souriceau", "est", "petite"]), attendu)
+
+    def test_compaction(self):
+        lexicon = Lexicon(data_dir=self.data_dir)
+        lexicon.add_lemma("abeille", "abeille", 30)
+        lexicon.add_lemma("la", "la", 0)
+        lexicon.add_pos("zèbre", "Nom:Mas+SG", 50)
+        words = ["abeille", "la", "zèbre", "chat", "été"]
+        attendu = self.analyser(lexicon, words)
+
+        self.assertEqual(compact_overlay(self.data_dir), 3)
+        self.assertEqual(os.path.getsize(os.path.join(self.data_dir, OVERLAY_FILE)), 0)
+        self.assertIsNone(check_sorted(self.lemma_path))
+        self.assertIsNone(check_sorted(self.pos_path))
+        self.assertEqual(self.analyser(Lexicon(data_dir=self.data_dir), words), attendu)
+        self.assertEqual(self.analyser(Lexicon(data_dir=self.data_dir, mode='bisect'), words), attendu)
+
+
+class TestIndexBuilder(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.lemma_path, self.pos_path = write_lexicon_files(self.data_dir)
+        with open(os.path.join(self.data_dir, 'lemma_index.pkl'), 'rb') as f:
+            self.reference_lemma_index = pickle.load(f)
+        with open(os.path.join(self.data_dir, 'pos_index.pkl'), 'rb') as f:
+            self.reference_pos_index = pickle.load(f)
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_index_identiques(self):
+        for workers in (1, 3):
+            lemma_index = build_index(self.lemma_path, 'lemma', workers)
+            pos_index = build_index(self.pos_path, 'pos', workers)
+            self.assertEqual({k: list(v) for k, v in lemma_index.items()}, self.reference_lemma_index)
+            self.assertEqual({k: list(v) for k, v in pos_index.items()}, self.reference_pos_index)
+
+    def test_index_perime(self):
+        build_indexes(self.data_dir)
+        lexicon = Lexicon(data_dir=self.data_dir)
+        self.assertEqual(lexicon.stale_artifacts, {})
+
+        with open(self.lemma_path, 'a', encoding='utf-8') as f:
+            f.write("souriceau;souriceau;40\n")
+        lexicon = Lexicon(data_dir=self.data_dir)
+        self.assertIn(os.path.join(self.data_dir, 'lemma_index.pkl'), lexicon.stale_artifacts)
+        self.assertEqual(lexicon.extract_lemmas([Token("souriceau")])[0].lemma_candidates, [('souriceau', 0)])
+
+        lexicon = Lexicon(data_dir=self.data_dir, rebuild_stale=True)
+        self.assertEqual(lexicon.stale_artifacts, {})
+        self.assertEqual(lexicon.extract_lemmas([Token("souriceau")])[0].lemma_candidates, [('souriceau', 40)])
+
+    def test_date_modifiee_sans_changement(self):
+        build_indexes(self.data_dir)
+        artifact = os.path.join(self.data_dir, 'lemma_index.pkl')
+        stat = os.stat(self.lemma_path)
+        os.utime(self.lemma_path, (stat.st_atime, stat.st_mtime + 100))
+        with mock.patch.object(IndexBuilder, 'source_signature', wraps=IndexBuilder.source_signature) as signature, \
+                mock.patch('os.replace', wraps=os.replace) as replace:
+            self.assertIsNone(check_staleness(artifact, [self.lemma_path]))
+            # Métadonnées remplacées d'un bloc, sans fichier temporaire restant
+            self.assertEqual(replace.call_args[0][1], artifact + '.meta.json')
+            self.assertFalse([name for name in os.listdir(self.data_dir) if name.endswith('.tmp')])
+            self.assertEqual(signature.call_count, 2)  # Date modifiée : le contenu est haché une fois
+            signature.reset_mock()
+            # La nouvelle date est enregistrée : plus de hachage aux vérifications suivantes
+            self.assertIsNone(check_staleness(artifact, [self.lemma_path]))
+            self.assertEqual([c.kwargs for c in signature.call_args_list], [{'with_hash': False}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+# Ajouter dynamiquement le chemin vers src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from Tokenizer.Lexicon import Lexicon
+from Tokenizer.LexiconClient import LexiconClient
+from Tokenizer.LexiconServer import LexiconServer
+from Tokenizer.Token_ import Token
+from Tokenizer.Tokenizer import Tokenizer
+from tests.test_lexicon import write_lexicon_files
+
+
+class TestLexiconServer(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        write_lexicon_files(self.data_dir)
+        self.socket_path = os.path.join(self.data_dir, 'lexicon.sock')
+        self.lexicon = Lexicon(data_dir=self.data_dir, mode='index')
+        self.server = LexiconServer(self.socket_path, self.lexicon, {'arc-en-ciel'})
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        shutil.rmtree(self.data_dir)
+
+    def test_recherche_par_le_demon(self):
+        mots = ["Le", "chat", "est", "inconnu", "chat"]
+        attendu = self.lexicon.extract_lexical([Token(mot) for mot in mots])
+        client_lexicon = Lexicon(data_dir=self.data_dir, mode='daemon', socket_path=self.socket_path)
+        try:
+            obtenu = client_lexicon.extract_lexical([Token(mot) for mot in mots])
+        finally:
+            client_lexicon.store.close()
+        self.assertEqual([t.lemma_candidates for t in obtenu], [t.lemma_candidates for t in attendu])
+        self.assertEqual([t.pos_candidates for t in obtenu], [t.pos_candidates for t in attendu])
+
+    def test_requetes_en_pipeline_et_cache(self):
+        client = LexiconClient(self.socket_path, batch_size=2)
+        try:
+            with mock.patch.object(client, 'request', wraps=client.request) as request:
+                lemmas = client.search_lemmas(["chat", "chats", "les", "été", "souris"])
+                # Trois requêtes envoyées d'un coup, une seule lecture des réponses
+                self.assertEqual(request.call_count, 1)
+                self.assertEqual(len(request.call_args[0][0]), 3)
+                self.assertEqual(lemmas["été"], [("été", 30), ("être", 60)])
+                client.search_lemmas(["chat", "souris"])
+                self.assertEqual(request.call_count, 1)
+        finally:
+            client.close()
+
+    def test_gros_lot_sans_interblocage(self):
+        # Les requêtes dépassent largement le tampon du socket : envoi par fenêtre
+        client = LexiconClient(self.socket_path, timeout=5, max_in_flight=2)
+        try:
+            lemmas = client.search_lemmas([f"mot{i}" for i in range(30000)] + ["chat"])
+            self.assertEqual(len(lemmas), 30001)
+            self.assertEqual(lemmas["chat"], self.lexicon.search_lemmas(["chat"])["chat"])
+        finally:
+            client.close()
+
+    def test_requete_invalide(self):
+        client = LexiconClient(self.socket_path)
+        try:
+            with self.assertRaises(RuntimeError):
+                client.request([{'op': 'inconnue'}])
+            # La connexion reste utilisable
+            self.assertEqual(client.compounds(["arc-en-ciel", "chat"]), [True, False])
+        finally:
+            client.close()
+
+    def test_mots_composes_du_demon(self):
+        tokenizer = Tokenizer(compound_mode='daemon', socket_path=self.socket_path)
+        self.assertEqual([t.text for t in tokenizer.tokenize("Un arc-en-ciel bleu-vert.")],
+                         ["Un", "arc-en-ciel", "bleu", "vert", "."])
+        self.assertEqual(tokenizer.compounds_with_prefix("Arc-"), ["arc-en-ciel"])
+        self.assertEqual(tokenizer.compounds_with_prefix("pomme"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
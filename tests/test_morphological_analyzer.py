@@ -0,0 +1,82 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Ajouter dynamiquement le chemin vers src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from Tokenizer.Lexicon import Lexicon
+from Tokenizer.MorphologicalAnalyzer import MorphologicalAnalyzer
+from Tokenizer.Token_ import Token
+from cache import CacheLRU
+from tests.test_lexicon import write_lexicon_files
+
+
+class TestMorphologicalAnalyzer(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        write_lexicon_files(self.data_dir)
+        self.lexicon = Lexicon(data_dir=self.data_dir)
+        self.analyzer = MorphologicalAnalyzer(cache=None)
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_analyse_morphologique(self):
+        tokens = self.analyzer.analyze([Token("la"), Token("petite"), Token("souris")], self.lexicon)
+        la, petite, souris = tokens
+        self.assertTrue(la.is_stop)
+        self.assertEqual((la.gender, la.number), ('Fem', 'Sing'))
+        self.assertEqual(petite.lemma_candidates, [('petit', 45), ('petite', 20)])
+        self.assertEqual(souris.morph, {'Gender': 'Fem'})
+        self.assertEqual(souris.shape_, 'xxxxxx')
+
+    def test_formes_dedupliquees(self):
+        searched = []
+        search = self.lexicon.search_lemmas_with_index
+
+        def counting_search(path, index, target_words):
+            searched.extend(target_words)
+            return search(path, index, target_words)
+
+        self.lexicon.search_lemmas_with_index = counting_search
+        tokens = [Token(word) for word in ["le", "chat", "mangent", "le", "chat", "le"]]
+        self.analyzer.analyze(tokens, self.lexicon)
+
+        self.assertEqual(sorted(searched), ["chat", "le", "mangent"])
+        self.assertEqual(tokens[0].lemma_candidates, tokens[5].lemma_candidates)
+        self.assertEqual(tokens[1].morph, tokens[4].morph)
+        # Chaque occurrence garde ses propres structures modifiables
+        self.assertIsNot(tokens[1].morph, tokens[4].morph)
+        self.assertEqual(tokens[2].morph, {'VerbalTime': 'Present'})
+
+    def test_cache_entre_documents(self):
+        cache = CacheLRU(capacite=100)
+        analyzer = MorphologicalAnalyzer(cache=cache)
+        analyzer.preload(self.lexicon, ["le", "chat", "la"], limit=2)
+        self.assertEqual(len(cache), 2)
+
+        tokens = analyzer.analyze([Token("le"), Token("chat"), Token("l")], self.lexicon)
+        self.assertEqual(cache.succes, 2)
+        self.assertEqual(tokens[2].text, "l'")
+
+        # Une seconde instance réutilise les analyses déjà en cache, y compris la forme modifiée
+        other = MorphologicalAnalyzer(cache=cache)
+        tokens = other.analyze([Token("l"), Token("chat")], self.lexicon)
+        self.assertEqual(cache.succes, 4)
+        self.assertEqual(tokens[0].text, "l'")
+        self.assertEqual(tokens[1].lemma_candidates, [('chat', 50)])
+        self.assertEqual(tokens[1].gender, 'Mas')
+
+        # Une correction du lexique rend les analyses en cache obsolètes
+        self.lexicon.add_lemma("chat", "chat", 0)
+        self.lexicon.add_lemma("chat", "félin", 30)
+        tokens = other.analyze([Token("chat")], self.lexicon)
+        self.assertEqual(tokens[0].lemma_candidates, [('félin', 30)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,12 +4,17 @@ import os
 import sys
 import csv
 import re
+import shutil
+import tempfile
 
 # Ajouter le chemin du répertoire 'src' pour importer les modules
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
 
 from moteur_de_regles import MoteurDeRegles
 from graphe_semantique import GrapheSemantique
+from Tokenizer.Pipeline import Pipeline
+from visualisateur_graphe import VisualisateurGraphe
+from tests.test_lexicon import write_lexicon_files
 # Remove import of TextSplitter if not needed
 # from text_splitter import TextSplitter
 
@@ -157,6 +162,41 @@ class TestMoteurDeRegles(unittest.TestCase):
         ]
         self.tester_relation('r_isa', phrases, expected_relations)
 
+class TestMotsDuTexteCourant(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        write_lexicon_files(self.data_dir)
+        with open(os.path.join(self.data_dir, 'motsComposés.txt'), 'w', encoding='utf-8') as f:
+            f.write('1;"arc-en-ciel";\n')
+        self.pipeline = Pipeline(data_dir=self.data_dir)
+        self.moteur = MoteurDeRegles(GrapheSemantique(), pipeline=self.pipeline)
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_lemme_du_dernier_texte(self):
+        self.moteur.appliquer_relations(self.pipeline.analyze("Les chats mangent."))
+        premier = self.moteur.get_word_id_by_lemma("chat")
+        self.moteur.appliquer_relations(self.pipeline.analyze("Le chat dort."))
+        dernier = self.moteur.get_word_id_by_lemma("chat")
+        self.assertNotEqual(dernier, premier)
+        self.assertEqual(self.moteur.graphe.G.nodes[dernier]['valeur'], "chat")
+        self.assertIsNone(self.moteur.get_word_id_by_lemma("manger"))
+
+    def test_export_brat_des_elisions(self):
+        texte = "Le chat d'été."
+        self.moteur.appliquer_relations(self.pipeline.analyze(texte))
+        chemin = os.path.join(self.data_dir, 'texte.ann')
+        VisualisateurGraphe().exporter_en_BRAT(self.moteur.graphe, chemin)
+        with open(chemin, encoding='utf-8') as f:
+            entites = [ligne.split('\t') for ligne in f if ligne.startswith('T')]
+        # Le texte de chaque entité est celui de son intervalle, même pour « d' »
+        for _, position, texte_entite in entites:
+            debut, fin = map(int, position.split()[1:])
+            self.assertEqual(texte_entite.rstrip('\n'), texte[debut:fin])
+        self.assertIn('d', [texte_entite.rstrip('\n') for _, _, texte_entite in entites])
+
+
 if __name__ == '__main__':
     # Exécuter tous les tests
     unittest.main()
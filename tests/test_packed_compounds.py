@@ -0,0 +1,69 @@
+import os
+import shutil
+import sys
+import tempfile
+import time
+import unittest
+
+# Ajouter dynamiquement le chemin vers src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from Tokenizer.PackedCompounds import PACKED_FILE, PackedCompounds, build_packed_compounds
+from Tokenizer.Tokenizer import Tokenizer
+
+COMPOUND_LINES = [
+    '9;"avant toute chose";',
+    '15;"Arc-en-ciel";',
+    '16;"après-midi";',
+    '17;"arc-boutant";',
+    '21;"week-end";',
+]
+
+
+class TestPackedCompounds(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.compounds_path = os.path.join(self.data_dir, 'motsComposés.txt')
+        with open(self.compounds_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(COMPOUND_LINES) + '\n')
+        self.packed_path = os.path.join(self.data_dir, PACKED_FILE)
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_recherche(self):
+        self.assertEqual(build_packed_compounds(self.compounds_path, self.packed_path), 5)
+        packed = PackedCompounds(self.packed_path)
+        self.assertIsNone(packed.mm)  # Projection différée jusqu'à la première recherche
+        self.assertIn("arc-en-ciel", packed)
+        self.assertIn("après-midi", packed)
+        self.assertNotIn("arc", packed)
+        self.assertNotIn("zèbre", packed)
+        self.assertEqual(packed.keys("arc-"), ["arc-boutant", "arc-en-ciel"])
+        self.assertEqual(len(packed), 5)
+        packed.close()
+
+    def test_tokenizer_utilise_l_artefact(self):
+        text = "Un arc-en-ciel, un après-midi de week-end et un bleu-vert."
+        tokenizer = Tokenizer(data_dir=self.data_dir, compound_mode='set')
+        expected = [t.text for t in tokenizer.tokenize(text)]
+        self.assertEqual(tokenizer.compounds_with_prefix("Arc-"), ["arc-boutant", "arc-en-ciel"])
+
+        build_packed_compounds(self.compounds_path, self.packed_path)
+        tokenizer = Tokenizer(data_dir=self.data_dir)
+        self.assertEqual(tokenizer.compound_mode, 'packed')
+        self.assertEqual([t.text for t in tokenizer.tokenize(text)], expected)
+        self.assertEqual(tokenizer.compounds_with_prefix("Arc-b"), ["arc-boutant"])
+
+        # Un artefact périmé est ignoré au profit du fichier texte
+        with open(self.compounds_path, 'a', encoding='utf-8') as f:
+            f.write('22;"bleu-vert";\n')
+        os.utime(self.compounds_path, (time.time() + 10, time.time() + 10))
+        tokenizer = Tokenizer(data_dir=self.data_dir)
+        self.assertEqual(tokenizer.compound_mode, 'set')
+        self.assertIn("bleu-vert", [t.text for t in tokenizer.tokenize(text)])
+
+
+if __name__ == '__main__':
+    unittest.main()
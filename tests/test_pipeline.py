@@ -0,0 +1,75 @@
+import gc
+import multiprocessing
+import os
+import pickle
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+# Ajouter dynamiquement le chemin vers src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from SyntaxicExtraction import SyntaxicExtraction
+from Tokenizer.Doc import Doc
+from Tokenizer.Pipeline import Pipeline
+from tests.test_lexicon import write_lexicon_files
+
+TEXTES = ["Le chat mange.", "Les chats mangent la petite souris.", "La souris est petite.", "Le chat dort."]
+
+
+class TestPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        write_lexicon_files(self.data_dir)
+        with open(os.path.join(self.data_dir, 'motsComposés.txt'), 'w', encoding='utf-8') as f:
+            f.write('1;"arc-en-ciel";\n')
+        self.pipeline = Pipeline(data_dir=self.data_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_pipe_par_lots(self):
+        expected = [[(t.text, t.lemma_, t.pos_, t.dep_) for t in self.pipeline.analyze(texte)] for texte in TEXTES]
+        with mock.patch.object(self.pipeline.lexicon, 'extract_lexical',
+                               wraps=self.pipeline.lexicon.extract_lexical) as extract:
+            docs = self.pipeline.pipe(iter(TEXTES), batch_size=3)
+            self.assertFalse(extract.called)  # Analyse paresseuse
+            docs = list(docs)
+        self.assertTrue(all(isinstance(doc, Doc) for doc in docs))
+        self.assertEqual([[(t.text, t.lemma_, t.pos_, t.dep_) for t in doc] for doc in docs], expected)
+        # Au plus une recherche groupée par lot
+        self.assertLessEqual(extract.call_count, 2)
+
+    @unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), "fork start method required")
+    def test_pipe_multiprocessus(self):
+        expected = [[(t.text, t.lemma_, t.pos_, t.dep_, t.token_primarykey) for t in doc]
+                    for doc in self.pipeline.pipe(TEXTES * 3)]
+        freeze_count = gc.get_freeze_count()
+        with self.pipeline:
+            docs = list(self.pipeline.pipe(iter(TEXTES * 3), batch_size=2, n_process=2))
+            pool = self.pipeline._pool
+            # Le pool est réutilisé d'un appel à l'autre, sans geler de nouveau le tas du parent
+            self.assertEqual(len(list(self.pipeline.pipe(TEXTES, n_process=2))), len(TEXTES))
+            self.assertIs(self.pipeline._pool, pool)
+            self.assertEqual(gc.get_freeze_count(), freeze_count)
+        self.assertIsNone(self.pipeline._pool)
+        self.assertEqual([[(t.text, t.lemma_, t.pos_, t.dep_, t.token_primarykey) for t in doc] for doc in docs],
+                         expected)
+        # Les documents reçus des processus sont des colonnes : les tokens sont reconstruits
+        self.assertIsNone(pickle.loads(pickle.dumps(docs[1]))._tokens)
+        self.assertIs(docs[1][1].head, docs[1][2])
+
+    def test_syntaxic_extraction_reutilise_la_pipeline(self):
+        with mock.patch('Tokenizer.SharedResources.Lexicon') as lexicon_class:
+            extraction = SyntaxicExtraction("Les chats mangent.", self.pipeline)
+            SyntaxicExtraction("La souris dort.", self.pipeline)
+        lexicon_class.assert_not_called()
+        self.assertIs(extraction.lexicon, self.pipeline.lexicon)
+        self.assertEqual([t.lemma_ for t in extraction.tokens], ["le", "chat", "manger", "."])
+
+
+if __name__ == '__main__':
+    unittest.main()
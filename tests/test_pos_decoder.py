@@ -0,0 +1,76 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Ajouter dynamiquement le chemin vers src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from Tokenizer.Disambiguator import Disambiguator
+from Tokenizer.Pipeline import Pipeline
+from Tokenizer.PosDecoder import ViterbiPosDecoder
+from tests.test_lexicon import write_lexicon_files
+
+TEXTES = ["Les chats mangent la petite souris.", "La souris est petite.", "Les mangent."]
+
+
+class TestViterbiPosDecoder(unittest.TestCase):
+
+    def test_regles_de_contexte(self):
+        decoder = ViterbiPosDecoder()
+        # Un verbe après un déterminant est lu comme un nom
+        self.assertEqual(decoder.decode([[('Pro:Pers', 20), ('Det:SG', 60)], [('Ver:IPre+SG+P3', 50)]]),
+                         ['Det:SG', 'Nom'])
+        # Le déterminant devant un nom l'emporte sur un meilleur score, sans forcer la lecture du nom
+        self.assertEqual(decoder.decode([[('Pro:Pers', 60), ('Det:SG', 20)], [('Nom:Fem+SG', 50)]]),
+                         ['Det:SG', 'Nom:Fem+SG'])
+        self.assertEqual(decoder.decode([[('Det:SG', 60)], [('Adj:Fem+SG', 45), ('Nom:Fem+SG', 20)], []]),
+                         ['Det:SG', 'Adj:Fem+SG', 'X'])
+        # À score égal, Adj est préféré après un nom, Nom après un déterminant
+        self.assertEqual(decoder.decode([[('Nom:Mas+SG', 40)], [('Nom:Fem+SG', 30), ('Adj:Fem+SG', 30)]]),
+                         ['Nom:Mas+SG', 'Adj:Fem+SG'])
+        self.assertEqual(decoder.decode([[('Det:SG', 40)], [('Adj:Fem+SG', 30), ('Nom:Fem+SG', 30)]]),
+                         ['Det:SG', 'Nom:Fem+SG'])
+        self.assertEqual(decoder.decode([]), [])
+
+    def test_faisceau(self):
+        candidates = [[('Det:SG', 60), ('Pro:Pers', 20)], [('Adj:Fem+SG', 45), ('Nom:Fem+SG', 20)],
+                      [('Ver:IPre+SG+P3', 50), ('Nom:Mas+PL', 50)], [('Pre', 10), ('Adv', 10)]] * 50
+        expected = ViterbiPosDecoder().decode(candidates)
+        self.assertEqual(ViterbiPosDecoder(beam_size=4).decode(candidates), expected)
+        # Un faisceau de largeur 1 écarte le déterminant dès le premier token, que la règle
+        # « déterminant devant un nom » aurait retenu
+        candidates = [[('Pro:Pers', 60), ('Det:SG', 55)], [('Nom:Fem+SG', 40)]]
+        self.assertEqual(ViterbiPosDecoder().decode(candidates), ['Det:SG', 'Nom:Fem+SG'])
+        self.assertEqual(ViterbiPosDecoder(beam_size=2).decode(candidates), ['Det:SG', 'Nom:Fem+SG'])
+        self.assertEqual(ViterbiPosDecoder(beam_size=1).decode(candidates), ['Pro:Pers', 'Nom:Fem+SG'])
+        with self.assertRaises(ValueError):
+            ViterbiPosDecoder(beam_size=0)
+
+
+class TestDecodageDeSequence(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        write_lexicon_files(self.data_dir)
+        with open(os.path.join(self.data_dir, 'motsComposés.txt'), 'w', encoding='utf-8') as f:
+            f.write('1;"arc-en-ciel";\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_memes_analyses_que_le_decodage_glouton(self):
+        expected = [[(t.text, t.pos_, t.lemma_) for t in Pipeline(data_dir=self.data_dir).analyze(texte)]
+                    for texte in TEXTES]
+        for pos_decoder in ('viterbi', 'beam'):
+            pipeline = Pipeline(data_dir=self.data_dir, pos_decoder=pos_decoder)
+            self.assertEqual([[(t.text, t.pos_, t.lemma_) for t in pipeline.analyze(texte)] for texte in TEXTES],
+                             expected)
+        self.assertEqual(expected[2][1][1:], ('NOUN', 'manger'))
+        with self.assertRaises(ValueError):
+            Disambiguator(pos_decoder='crf')
+
+
+if __name__ == '__main__':
+    unittest.main()
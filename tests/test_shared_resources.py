@@ -0,0 +1,72 @@
+import gc
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Ajouter dynamiquement le chemin vers src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from Tokenizer.CompiledLexicon import compile_lexicon
+from Tokenizer.Lexicon import Lexicon
+from Tokenizer.SharedResources import SharedLexiconBlock, SharedResources, current_resources
+from Tokenizer.Token_ import Token
+from tests.test_lexicon import write_lexicon_files
+
+
+def lemmes_partages(mots):
+    resources = current_resources()
+    tokens = resources.lexicon.extract_lemmas([Token(mot) for mot in mots])
+    return [token.lemma_candidates[0][0] for token in tokens]
+
+
+def lemmes_attaches(args):
+    name, mots = args
+    block = SharedLexiconBlock.attach(name)
+    try:
+        tokens = block.lexicon().extract_lemmas([Token(mot) for mot in mots])
+        return [token.lemma_candidates[0][0] for token in tokens]
+    finally:
+        block.close()
+
+
+@unittest.skipUnless('fork' in multiprocessing.get_all_start_methods(), "fork start method required")
+class TestSharedResources(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        write_lexicon_files(self.data_dir)
+        self.compiled_path = os.path.join(self.data_dir, 'lexicon.bin')
+        compile_lexicon(os.path.join(self.data_dir, 'lemma_clean_utf8.txt'),
+                        os.path.join(self.data_dir, 'pos_utf8.txt'), self.compiled_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_workers_heritent_des_ressources(self):
+        resources = SharedResources(data_dir=self.data_dir)
+        freeze_count = gc.get_freeze_count()
+        with resources.pool(2) as pool:
+            # Le tas n'est gelé que dans les processus de travail
+            self.assertEqual(gc.get_freeze_count(), freeze_count)
+            results = pool.map(lemmes_partages, [["chats"], ["les", "été"]])
+        self.assertEqual(results, [["chat"], ["le", "être"]])
+        with resources.pool(2):
+            self.assertEqual(gc.get_freeze_count(), freeze_count)
+
+    def test_bloc_de_memoire_partagee(self):
+        block = SharedLexiconBlock.publish(self.compiled_path)
+        try:
+            expected = Lexicon(data_dir=self.data_dir, mode='compiled').store.search_lemmas(["est", "petite"])
+            self.assertEqual(block.lexicon(self.data_dir).store.search_lemmas(["est", "petite"]), expected)
+            with multiprocessing.get_context('fork').Pool(2) as pool:
+                results = pool.map(lemmes_attaches, [(block.name, ["chats"]), (block.name, ["la"])])
+            self.assertEqual(results, [["chat"], ["le"]])
+        finally:
+            block.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import os
+import sys
+import unittest
+
+# Ajouter dynamiquement le chemin vers src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from Tokenizer.Disambiguator import Disambiguator
+from Tokenizer.MorphologicalAnalyzer import MorphologicalAnalyzer
+from Tokenizer.TagTable import TagTable
+
+
+class TestTagTable(unittest.TestCase):
+
+    def test_interning(self):
+        table = TagTable(["Nom:Mas+SG", "Det:Fem+SG"])
+        self.assertEqual(len(table), 2)
+        self.assertEqual(table.intern("Nom:Mas+SG"), 0)
+        self.assertEqual(table.intern("Ver:Inf"), 2)
+        self.assertIs(table.info("Ver:Inf"), table.infos[2])
+
+    def test_traits(self):
+        table = TagTable()
+        nom = table.info("Nom:Fem+PL")
+        self.assertEqual((nom.upos, nom.gender_number), ("NOUN", {'Gender': 'Fem', 'Number': 'Plur'}))
+        self.assertEqual(table.info("Conj:Coord").upos, "CCONJ")
+        self.assertEqual(table.info("Conj:Sub").upos, "SCONJ")
+        self.assertEqual(table.info("Number:Sing").upos, "X")
+        verbe = table.info("VerbalTime:Present+VerbalNumber:PL")
+        self.assertEqual(verbe.verbal_features, {'VerbalTime': 'Present+VerbalNumber', 'VerbalNumber': 'Plur'})
+
+    def test_sites_d_appel(self):
+        analyzer = MorphologicalAnalyzer(cache=None)
+        self.assertEqual(analyzer.extract_gender_number("Adj:Mas+SG"), {'Gender': 'Mas', 'Number': 'Sing'})
+        self.assertEqual(analyzer.extract_verbal_features("VerbalMode:Indicatif"), {'VerbalMode': 'Indicatif'})
+        self.assertEqual(Disambiguator().map_pos_to_spacy("Pro:Pers"), "PRON")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from io import StringIO
+
+# Ajouter dynamiquement le chemin vers src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from text_splitter import TextSplitter
+from Tokenizer.DependencyExtractor import DependencyExtractor
+from Tokenizer.Tokenizer import Tokenizer
+
+TEXTE = ("M. Dupont arrive, etc. et repart. Il pèse 3.5 kg. J. Martin crie : « Quoi ? » dit-il. "
+         "Des pommes, des poires, etc. Enfin ! Fin sans point")
+
+
+class TestTextSplitter(unittest.TestCase):
+
+    def test_intervalles(self):
+        splitter = TextSplitter()
+        self.assertEqual(splitter.split_text_into_sentences(TEXTE), [
+            "M. Dupont arrive, etc. et repart.",
+            "Il pèse 3.5 kg.",
+            "J. Martin crie : « Quoi ? » dit-il.",
+            "Des pommes, des poires, etc.",
+            "Enfin !",
+            "Fin sans point",
+        ])
+        # Abréviations qui sont aussi des mots courants : fin de phrase devant une majuscule
+        for texte in ("J'aime l'art. Il est beau.", "Il a pris le vol. Le pilote dort.", "C'est mon ex. Elle part."):
+            self.assertEqual(len(splitter.split_text_into_sentences(texte)), 2, texte)
+        self.assertEqual(splitter.split_text_into_sentences("Voir l'art. 3 et la fig. 2. Puis le vol. 4 p. ex. ici."),
+                         ["Voir l'art. 3 et la fig. 2.", "Puis le vol. 4 p. ex. ici."])
+        self.assertEqual(len(splitter.split_text_into_sentences("Voir Mme. Dupont et cf. Martin.")), 1)
+        self.assertEqual(len(splitter.split_text_into_sentences("Il voit M. Dupont et le Dr. Martin.")), 1)
+        # En minuscule, « m. » est une unité qui peut clore la phrase
+        self.assertEqual(splitter.split_text_into_sentences("Il mesure 3.5 m. Puis il part."),
+                         ["Il mesure 3.5 m.", "Puis il part."])
+        spans = list(splitter.split_spans("  Bonjour.\nAu revoir.  "))
+        self.assertEqual(spans, [(2, 10), (11, 21)])
+
+    def test_tokenizer_et_propositions(self):
+        data_dir = tempfile.mkdtemp()
+        with open(os.path.join(data_dir, 'motsComposés.txt'), 'w', encoding='utf-8') as f:
+            f.write('1;"arc-en-ciel";\n')
+        try:
+            tokenizer = Tokenizer(data_dir=data_dir, compound_mode='set', sentence_splitter=TextSplitter())
+            tokens = tokenizer.tokenize(TEXTE)
+        finally:
+            shutil.rmtree(data_dir)
+        phrases = {}
+        for token in tokens:
+            phrases.setdefault(token.token_pid, []).append(token.text)
+        self.assertEqual(len(phrases), 6)
+        self.assertEqual(phrases[0], ["M", ".", "Dupont", "arrive", "etc", ".", "et", "repart", "."])
+        self.assertEqual([t.token_id for t in tokens[:3]], [0, 1, 2])
+
+        # Les propositions suivent les phrases du Tokenizer et les points-virgules
+        for token in tokens:
+            token.pos_ = 'PUNCT' if not token.text.isalnum() else 'NOUN'
+            token.morph = {}
+        tokens[3].text, tokens[3].pos_ = ';', 'PUNCT'
+        clauses = DependencyExtractor(use_token_pid=True).segment_into_clauses(tokens)
+        self.assertEqual([len(clause) for clause in clauses[:3]], [4, 5, 7])
+        self.assertGreater(len(DependencyExtractor().segment_into_clauses(tokens)), len(clauses))
+
+    def test_lecture_par_blocs(self):
+        data_dir = tempfile.mkdtemp()
+        with open(os.path.join(data_dir, 'motsComposés.txt'), 'w', encoding='utf-8') as f:
+            f.write('1;"arc-en-ciel";\n')
+        try:
+            tokenizer = Tokenizer(data_dir=data_dir, compound_mode='set', sentence_splitter=TextSplitter())
+        finally:
+            shutil.rmtree(data_dir)
+        for texte in (TEXTE, "Il a cité M. Dupont, etc. et il est parti. Fin.", "Il crie : « Quoi ? » Puis rien."):
+            attendu = [(t.text, t.token_primarykey) for t in tokenizer.tokenize(texte)]
+            # Une fin de phrase en bout de bloc n'est tranchée qu'avec le début du bloc suivant
+            for block_size in (1, 4, 13, 27, 64):
+                phrases = list(tokenizer.iter_sentences(StringIO(texte), block_size=block_size))
+                self.assertEqual([(t.text, t.token_primarykey) for phrase in phrases for t in phrase], attendu,
+                                 (texte, block_size))
+                self.assertEqual(len(phrases), len({pid for _, (pid, _) in attendu}))
+        lignes = ["Il a cité M. Dupont, etc.", "et il est parti. Fin."]
+        attendu = [(t.text, t.token_primarykey) for t in tokenizer.tokenize('\n'.join(lignes))]
+        self.assertEqual([(t.text, t.token_primarykey) for phrase in tokenizer.iter_sentences(lignes) for t in phrase],
+                         attendu)
+        self.assertEqual(attendu[-2:], [("Fin", (1, 0)), (".", (1, 1))])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from io import StringIO
+
+# Ajouter dynamiquement le chemin vers src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from graphe_semantique import GrapheSemantique
+from visualisateur_graphe import VisualisateurGraphe
+from Tokenizer.Tokenizer import Tokenizer
+
+
+class TestTokenizerSpans(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        with open(os.path.join(self.data_dir, 'motsComposés.txt'), 'w', encoding='utf-8') as f:
+            f.write('1;"arc-en-ciel";\n2;"pomme de terre";\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_offsets(self):
+        text = "L’arc-en-ciel brille. Un bleu-vert « pur »."
+        tokens = Tokenizer(data_dir=self.data_dir).tokenize(text)
+        self.assertEqual([t.text for t in tokens],
+                         ["L", "arc-en-ciel", "brille", ".", "Un", "bleu", "vert", '"', "pur", '"', "."])
+        # Les offsets désignent le texte d'origine, la normalisation conservant les longueurs
+        self.assertEqual([(t.start, t.end) for t in tokens[:3]], [(0, 1), (2, 13), (14, 20)])
+        self.assertEqual([text[t.start:t.end] for t in tokens[5:7]], ["bleu", "vert"])
+        self.assertEqual(text[tokens[7].start:tokens[7].end], "«")
+        self.assertEqual([t.token_primarykey for t in tokens[3:6]], [(0, 3), (1, 0), (1, 1)])
+
+        # Le texte n'est extrait qu'à la lecture et reste modifiable
+        token = Tokenizer(data_dir=self.data_dir).tokenize(text)[0]
+        self.assertIsNone(token._text)
+        token.text += "'"
+        self.assertEqual((token.text, token.start, token.end), ("L'", 0, 1))
+
+    def test_fusion_conserve_le_span(self):
+        text = "Une pomme  de terre cuite."
+        tokens = Tokenizer(data_dir=self.data_dir, merge_multiword=True).tokenize(text)
+        self.assertEqual(tokens[1].text, "pomme  de terre")
+        self.assertEqual((tokens[1].start, tokens[1].end), (4, 19))
+
+    def test_offsets_dans_le_graphe_et_l_export_brat(self):
+        text = "Le chat dort."
+        tokens = Tokenizer(data_dir=self.data_dir).tokenize(text)
+        graphe = GrapheSemantique()
+        for i, token in enumerate(tokens[:3]):
+            graphe.ajouter_noeud(f"word_{i}", 'word', token.text, debut=token.start, fin=token.end)
+        graphe.ajouter_noeud("pos_1", 'pos', 'noun')
+        graphe.ajouter_relation("word_1", "r_pos", "pos_1")
+        graphe.ajouter_relation("word_0", "r_succ", "word_1")
+        self.assertEqual((graphe.G.nodes["word_2"]['debut'], graphe.G.nodes["word_2"]['fin']), (8, 12))
+
+        chemin = os.path.join(self.data_dir, 'texte.ann')
+        self.assertEqual(VisualisateurGraphe().exporter_en_BRAT(graphe, chemin), 3)
+        with open(chemin, encoding='utf-8') as f:
+            self.assertEqual(f.read().splitlines(),
+                             ["T1\tword 0 2\tLe", "T2\tNOUN 3 7\tchat", "T3\tword 8 12\tdort",
+                              "R1\tr_succ Arg1:T1 Arg2:T2"])
+
+        # Un mot composé fusionné à cheval sur deux lignes devient une entité discontinue
+        text = "Une pomme\nde terre."
+        tokens = Tokenizer(data_dir=self.data_dir, merge_multiword=True).tokenize(text)
+        graphe = GrapheSemantique()
+        for i, token in enumerate(tokens):
+            graphe.ajouter_noeud(f"word_{i}", 'word', token.text, debut=token.start, fin=token.end)
+        self.assertEqual(VisualisateurGraphe().exporter_en_BRAT(graphe, chemin), 3)
+        with open(chemin, encoding='utf-8') as f:
+            self.assertEqual(f.read().splitlines(),
+                             ["T1\tword 0 3\tUne", "T2\tword 4 9;10 18\tpomme de terre", "T3\tword 18 19\t."])
+
+
+class TestIterSentences(unittest.TestCase):
+
+    TEXT = ("Une pomme de terre cuite. L'arc-en-ciel\nbrille au-dessus\ndu champ ! Fin sans point")
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        with open(os.path.join(self.data_dir, 'motsComposés.txt'), 'w', encoding='utf-8') as f:
+            f.write('1;"arc-en-ciel";\n2;"pomme de terre";\n')
+        self.tokenizer = Tokenizer(data_dir=self.data_dir, merge_multiword=True)
+        self.expected = self.tokenizer.tokenize(self.TEXT)
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def assertSameTokens(self, sentences):
+        tokens = [token for sentence in sentences for token in sentence]
+        self.assertEqual([(t.text, t.token_primarykey) for t in tokens],
+                         [(t.text, t.token_primarykey) for t in self.expected])
+        for sentence in sentences:
+            self.assertEqual(len({token.token_pid for token in sentence}), 1)
+
+    def test_sources(self):
+        path = os.path.join(self.data_dir, 'texte.txt')
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(self.TEXT)
+        sentences = list(self.tokenizer.iter_sentences(path))
+        self.assertEqual(len(sentences), 3)
+        self.assertEqual(sentences[0][1].text, "pomme de terre")
+        self.assertSameTokens(sentences)
+        # Blocs minuscules : aucun mot n'est coupé entre deux blocs
+        self.assertSameTokens(list(self.tokenizer.iter_sentences(StringIO(self.TEXT), block_size=4)))
+        self.assertSameTokens(list(self.tokenizer.iter_sentences(iter(self.TEXT.split('\n')))))
+
+    def test_phrase_trop_longue(self):
+        sentences = list(self.tokenizer.iter_sentences(["un deux trois quatre cinq."], max_sentence_tokens=2))
+        self.assertEqual([[t.text for t in s] for s in sentences], [["un", "deux"], ["trois", "quatre"], ["cinq", "."]])
+        self.assertEqual([t.token_id for t in sentences[2]], [4, 5])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import logging
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+# Ajouter dynamiquement le chemin vers src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from Tokenizer.Pipeline import Pipeline
+from Tokenizer.Trace import DISAMBIGUATOR_TRACE, LEXICON_TRACE, Tracer, configure_tracing, disable_tracing
+from tests.test_lexicon import write_lexicon_files
+
+
+class Explosif:
+    def __str__(self):
+        raise AssertionError("formatted")
+
+
+class TestTrace(unittest.TestCase):
+
+    def tearDown(self):
+        disable_tracing()
+
+    def test_echantillonnage_deterministe(self):
+        tracer = Tracer('test')
+        tracer.enable(0.25)
+        with mock.patch.object(tracer.logger, 'debug') as debug:
+            for i in range(10):
+                tracer("token %d", i)
+        self.assertEqual([c.args[1] for c in debug.call_args_list], [0, 4, 8])
+
+    def test_formatage_paresseux(self):
+        tracer = Tracer('test_paresseux')
+        tracer.enable()
+        tracer.logger.propagate = False
+        # Aucun gestionnaire n'émet le message : l'argument n'est jamais converti en texte
+        tracer("token %s", Explosif())
+        with self.assertRaises(ValueError):
+            tracer.enable(0)
+
+    def test_configuration(self):
+        configure_tracing("lexicon, disambiguator:0.5")
+        self.assertTrue(LEXICON_TRACE.enabled)
+        self.assertEqual((DISAMBIGUATOR_TRACE.every, LEXICON_TRACE.every), (2, 1))
+        disable_tracing()
+        self.assertFalse(LEXICON_TRACE.enabled or DISAMBIGUATOR_TRACE.enabled)
+        configure_tracing("all")
+        self.assertTrue(LEXICON_TRACE.enabled and DISAMBIGUATOR_TRACE.enabled)
+
+    def test_pipeline_tracee(self):
+        data_dir = tempfile.mkdtemp()
+        try:
+            write_lexicon_files(data_dir)
+            with open(os.path.join(data_dir, 'motsComposés.txt'), 'w', encoding='utf-8') as f:
+                f.write('1;"arc-en-ciel";\n')
+            pipeline = Pipeline(data_dir=data_dir)
+            # Le chargement des modules ne configure plus la journalisation globale
+            self.assertEqual(logging.getLogger().manager.disable, logging.NOTSET)
+            with mock.patch.object(DISAMBIGUATOR_TRACE.logger, 'debug') as debug:
+                pipeline.analyze("Les chats mangent.")
+                self.assertFalse(debug.called)
+                configure_tracing("disambiguator")
+                pipeline.analyze("Les chats mangent.")
+            self.assertIn("Disambiguated POS for '%s': %s", [c.args[0] for c in debug.call_args_list])
+        finally:
+            shutil.rmtree(data_dir)
+
+
+if __name__ == '__main__':
+    unittest.main()
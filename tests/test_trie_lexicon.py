@@ -0,0 +1,53 @@
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+# Ajouter dynamiquement le chemin vers src
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../src')))
+
+from Tokenizer import TrieLexicon as trie_module
+from Tokenizer.Lexicon import Lexicon
+from Tokenizer.Token_ import Token
+from Tokenizer.Tokenizer import Tokenizer
+from tests.test_lexicon import write_lexicon_files
+
+COMPOUNDS = ['9;"avant toute chose";', '10;"arc-en-ciel";', '11;"Maria Callas";', '12;"arc-boutant";']
+
+
+@unittest.skipIf(trie_module.marisa_trie is None, "marisa-trie n'est pas installé")
+class TestTrieLexicon(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        self.lemma_path, self.pos_path = write_lexicon_files(self.data_dir)
+        self.compounds_path = os.path.join(self.data_dir, 'motsComposés.txt')
+        with open(self.compounds_path, 'w', encoding='utf-8') as f:
+            f.write('\n'.join(COMPOUNDS) + '\n')
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_mode_trie_identique_au_mode_index(self):
+        words = ["La", "chat", "mangent", "petite", "souris", "-été", "inconnu"]
+        expected = Lexicon(data_dir=self.data_dir, mode='index').extract_lexical([Token(w) for w in words])
+
+        trie_module.build_lexicon_tries(self.lemma_path, self.pos_path, self.data_dir)
+        lexicon = Lexicon(data_dir=self.data_dir, mode='trie')
+        tokens = lexicon.extract_lexical([Token(w) for w in words])
+        self.assertEqual([(t.lemma_candidates, t.pos_candidates) for t in tokens],
+                         [(t.lemma_candidates, t.pos_candidates) for t in expected])
+        self.assertEqual(lexicon.store.forms_with_prefix("ch"), ["chat", "chats"])
+
+    def test_mots_composes(self):
+        trie_module.build_compound_trie(self.compounds_path, os.path.join(self.data_dir, 'motsComposes.marisa'))
+        tokenizer = Tokenizer(data_dir=self.data_dir, compound_mode='trie')
+        self.assertEqual(set(tokenizer.mots_composes), Tokenizer(data_dir=self.data_dir).mots_composes)
+        self.assertEqual(sorted(tokenizer.compounds_with_prefix("Arc-")), ["arc-boutant", "arc-en-ciel"])
+        texts = [token.text for token in tokenizer.tokenize("Un arc-en-ciel, un porte-avions.")]
+        self.assertEqual(texts, ["Un", "arc-en-ciel", "un", "porte", "avions", "."])
+
+
+if __name__ == '__main__':
+    unittest.main()